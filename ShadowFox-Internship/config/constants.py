@@ -35,15 +35,11 @@ PLAYER_ROLES = {
     'Kuldeep Yadav': 'Bowler'
 }
 
-# Expected performance scores for validation
-EXPECTED_SCORES = {
-    'Rilee Russouw': 10,
-    'Phil Salt': 2,
-    'Yash Dhull': 11,
-    'Axar Patel': 11,
-    'Lalit Yadav': 6,
-    'Aman Khan': 9,
-    'Kuldeep Yadav': 9
+# Name variants seen in other feeds, mapped to the canonical names above. Initials
+# ("R Russouw") and close spellings are matched automatically at ingest.
+PLAYER_ALIASES = {
+    'Rilee Rossouw': 'Rilee Russouw',
+    'Philip Salt': 'Phil Salt'
 }
 
 # Visualization settings
@@ -67,4 +63,58 @@ ANALYSIS_CONFIG = {
         'good': 6,
         'needs_improvement': 0
     }
-}
\ No newline at end of file
+}
+
+# Declarative recommendation rules. Conditions are pandas expressions evaluated over
+# per-team or per-player aggregates (sums of count columns plus players, matches,
+# average_score, players_conceding and runs_conceded); text fields may reference them.
+RECOMMENDATION_RULES = [
+    {
+        'level': 'team',
+        'condition': 'dropped_catches > 0',
+        'type': 'Team Training',
+        'priority': 'High',
+        'recommendation': 'Implement intensive catching practice sessions',
+        'rationale': '{dropped_catches} catches dropped affecting team performance'
+    },
+    {
+        'level': 'team',
+        'condition': 'players_conceding > 0',
+        'type': 'Technical Training',
+        'priority': 'High',
+        'recommendation': 'Focus on ground fielding and boundary prevention',
+        'rationale': '{players_conceding} players conceded runs'
+    },
+    {
+        'level': 'team',
+        'condition': 'players > 0',
+        'type': 'Foundation',
+        'priority': 'Medium',
+        'recommendation': 'Continue focus on basic fielding drills',
+        'rationale': 'Clean picks and good throws form the foundation of good fielding'
+    },
+    {
+        'level': 'player',
+        'condition': 'dropped_catches >= 2',
+        'type': 'Individual Training',
+        'priority': 'High',
+        'recommendation': 'Extra high-catch drills for {player_name}',
+        'rationale': '{dropped_catches} catches dropped in {matches} match(es)'
+    },
+    {
+        'level': 'player',
+        'condition': 'missed_run_outs > 0',
+        'type': 'Individual Training',
+        'priority': 'Medium',
+        'recommendation': 'Throwing accuracy work for {player_name}',
+        'rationale': '{missed_run_outs} run out(s) missed'
+    },
+    {
+        'level': 'player',
+        'condition': 'runs_conceded > 0',
+        'type': 'Individual Training',
+        'priority': 'Medium',
+        'recommendation': 'Ground fielding and boundary work for {player_name}',
+        'rationale': 'Conceded {runs_conceded} run(s) net'
+    }
+]
@@ -20,6 +20,8 @@ from src.data_loader import FieldingDataLoader
 from src.performance_calculator import PerformanceCalculator
 from src.visualizations import FieldingVisualizer
 from src.analysis_tools import FieldingAnalyzer, analyze_fielding_performance
+from src.result_writer import ResultWriter
+from src.report_generator import ReportGenerator
 
 def print_header():
     """Print project header and information"""
@@ -52,6 +54,7 @@ def run_analysis_pipeline():
     Returns analysis results and generated files
     """
     results = {}
+    writer = ResultWriter()
     
     try:
         # Step 1: Data Loading and Preparation
@@ -83,7 +86,7 @@ def run_analysis_pipeline():
         
         # Step 3: Visualization Generation
         print("\n📈 STEP 3: Creating visualizations...")
-        visualizer = FieldingVisualizer()
+        visualizer = FieldingVisualizer(writer=writer)
         
         # Generate all visualizations
         charts = {
@@ -132,32 +135,41 @@ def run_analysis_pipeline():
         print("\n💾 STEP 6: Saving results...")
         
         # Save processed data
-        processed_path = loader.save_processed_data(df_scored)
+        processed_path = loader.save_processed_data(df_scored, writer=writer)
         results['processed_file'] = processed_path
         
-        # Save analysis results
+        # Save analysis results (same frame as processed data, serialized once)
         results_path = "data/outputs/analysis_results.csv"
-        df_scored.to_csv(results_path, index=False)
+        writer.write_frame(df_scored, results_path)
         results['results_file'] = results_path
         
         # Save recommendations
         recs_path = "data/outputs/strategic_recommendations.csv"
-        recommendations.to_csv(recs_path, index=False)
+        writer.write_frame(recommendations, recs_path)
         results['recommendations_file'] = recs_path
         
         # Save comprehensive analysis
         comp_path = "data/outputs/comprehensive_analysis.json"
-        pd.DataFrame(comprehensive_analysis['performance_report']).to_json(comp_path, orient='records')
+        writer.write_frame(pd.DataFrame(comprehensive_analysis['performance_report']), comp_path)
         results['comprehensive_file'] = comp_path
         
+        # Wait for background writes to land before reporting success
+        writer.close()
         print("✅ All results saved successfully")
         
+        # Step 7: Reports
+        print("\n📋 STEP 7: Generating team reports...")
+        reports = ReportGenerator.from_settings().generate_reports(df_scored)
+        results['reports'] = reports
+        print(f"✅ Reports written for {len(reports)} team(s) to results/reports/")
+        
         return results, True
         
     except Exception as e:
         print(f"\n❌ Error during analysis pipeline: {e}")
         import traceback
         traceback.print_exc()
+        writer.close()
         return results, False
 
 def generate_final_report(results, success):
@@ -191,6 +203,7 @@ def generate_final_report(results, success):
         print(f"   • Analysis results: data/outputs/analysis_results.csv")
         print(f"   • Strategic recommendations: data/outputs/strategic_recommendations.csv")
         print(f"   • Comprehensive report: data/outputs/comprehensive_analysis.json")
+        print(f"   • Team reports: results/reports/")
         
         print(f"\n🚀 NEXT STEPS:")
         print(f"   • Review visualizations in results/visualizations/")
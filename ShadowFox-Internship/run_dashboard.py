@@ -57,11 +57,15 @@ class FieldingDashboard:
             from performance_calculator import PerformanceCalculator
             from visualizations import FieldingVisualizer
             from analysis_tools import FieldingAnalyzer
+            from result_writer import ResultWriter
+            from rollup_cube import RollupCube
+            from leaderboard import Leaderboard
             
             # Initialize components
+            self.writer = ResultWriter()
             loader = FieldingDataLoader()
-            calculator = PerformanceCalculator()
-            visualizer = FieldingVisualizer()
+            calculator = PerformanceCalculator.from_settings(registry=loader.registry)
+            visualizer = FieldingVisualizer(writer=self.writer)
             analyzer = FieldingAnalyzer()
             
             # STEP 1: Data Loading
@@ -86,26 +90,70 @@ class FieldingDashboard:
             validation_df = calculator.validate_calculations(df_scored)
             self.display_calculation_validation(validation_df)
             
+            # Precompute team/match/player rollups once for every display and save step
+            cube = RollupCube().fit(df_scored)
+            leaderboard = Leaderboard().fit(df_scored)
+            
             # STEP 5: Display Performance Results
-            self.display_performance_results(df_scored)
+            self.display_performance_results(leaderboard, cube)
             
             # STEP 6: Generate Visualizations
-            self.animate_step(6, "DATA VISUALIZATION", self.generate_visualizations, visualizer, df_scored)
+            chart_paths = self.animate_step(6, "DATA VISUALIZATION", self.generate_visualizations,
+                                            visualizer, df_scored)
             
             # STEP 7: Advanced Analysis
-            self.animate_step(7, "ADVANCED ANALYSIS", self.perform_advanced_analysis, analyzer, df_scored)
+            self.animate_step(7, "ADVANCED ANALYSIS", self.perform_advanced_analysis, analyzer, df_scored, cube)
             
             # STEP 8: Save Results
-            self.animate_step(8, "SAVING RESULTS", self.save_results, df_scored, analyzer)
+            self.animate_step(8, "SAVING RESULTS", self.save_results, df_scored, analyzer, cube)
+            
+            # Wait for background writes before reporting output files
+            self.writer.close()
+            
+            # STEP 9: Reports (reuses the chart files written above)
+            self.animate_step(9, "REPORT GENERATION", self.generate_reports, df_scored, chart_paths)
             
             # Final Dashboard
-            self.display_final_dashboard(df_scored, analyzer)
+            self.display_final_dashboard(df_scored, analyzer, cube)
             
         except Exception as e:
             print(f"❌ Error in analysis: {e}")
             import traceback
             traceback.print_exc()
     
+    def run_batch_analysis(self, csv_files, max_workers=None):
+        """Run the pipeline for many match files with overlapping I/O and compute
+        
+        Files that are missing or fail are skipped (their result is None) and
+        recorded in ``self.batch_failures``.
+        """
+        sys.path.append('src')
+        from data_loader import FieldingDataLoader
+        from performance_calculator import PerformanceCalculator
+        from visualizations import FieldingVisualizer
+        from analysis_tools import FieldingAnalyzer
+        from result_writer import ResultWriter
+        from pipeline import build_analysis_pipeline
+        
+        self.print_header()
+        with ResultWriter() as writer:
+            pipeline = build_analysis_pipeline(FieldingDataLoader(), PerformanceCalculator.from_settings(),
+                                               FieldingVisualizer(writer=writer, show=False),
+                                               FieldingAnalyzer(), writer, max_workers=max_workers)
+            results = pipeline.run_batch(csv_files, return_exceptions=True)
+        
+        self.batch_failures = {}
+        for index, (csv_file, result) in enumerate(zip(csv_files, results)):
+            if isinstance(result, Exception):
+                self.batch_failures[csv_file] = str(result)
+                results[index] = None
+                print(f"❌ {csv_file}: skipped ({result})")
+                continue
+            top = result['analysis']['top_performers'].iloc[0]
+            print(f"✅ {csv_file}: {len(result['scored'])} players, "
+                  f"top performer {top['player_name']} ({top['performance_score']} pts)")
+        return results
+    
     def display_data_preview(self, df):
         """Display data preview"""
         print("\n📊 DATA PREVIEW:")
@@ -129,15 +177,15 @@ class FieldingDashboard:
         print(f"\n{status}")
         time.sleep(2)
     
-    def display_performance_results(self, df_scored):
+    def display_performance_results(self, leaderboard, cube):
         """Display performance results in dashboard format"""
         print("\n🎯 PERFORMANCE SCOREBOARD")
         print("=" * 60)
         
-        # Sort by performance score
-        df_sorted = df_scored.sort_values('performance_score', ascending=False)
+        # Pages come straight off the leaderboard's precomputed score order
+        rows = (player for page in leaderboard.pages(sort='score') for _, player in page.iterrows())
         
-        for i, (_, player) in enumerate(df_sorted.iterrows(), 1):
+        for i, player in enumerate(rows, 1):
             score = player['performance_score']
             role = player['player_role']
             
@@ -156,15 +204,13 @@ class FieldingDashboard:
             time.sleep(0.5)
         
         # Team statistics
-        avg_score = df_scored['performance_score'].mean()
-        total_runs = df_scored['runs_saved'].sum()
-        total_catches = df_scored['catches'].sum()
+        summary = cube.summary()
         
         print(f"\n📈 TEAM STATISTICS:")
-        print(f"   • Average Score: {avg_score:.1f} points")
-        print(f"   • Net Runs Saved: {total_runs:+d} runs")
-        print(f"   • Total Catches: {total_catches}")
-        print(f"   • Performance Range: {df_scored['performance_score'].min()} - {df_scored['performance_score'].max()}")
+        print(f"   • Average Score: {summary['average_score']:.1f} points")
+        print(f"   • Net Runs Saved: {summary['total_runs_saved']:+d} runs")
+        print(f"   • Total Catches: {summary['total_catches']}")
+        print(f"   • Performance Range: {summary['min_score']} - {summary['max_score']}")
         
         time.sleep(2)
     
@@ -173,21 +219,25 @@ class FieldingDashboard:
         print("\n📈 GENERATING VISUALIZATIONS...")
         
         charts = [
-            ("Performance Scores", visualizer.plot_performance_scores),
-            ("Contributions Analysis", visualizer.plot_positive_negative_contributions),
-            ("Runs Saved Analysis", visualizer.plot_runs_saved_analysis),
-            ("Correlation Heatmap", visualizer.create_correlation_heatmap)
+            ("Performance Scores", visualizer.plot_performance_scores, 'performance_scores'),
+            ("Contributions Analysis", visualizer.plot_positive_negative_contributions,
+             'contributions_analysis'),
+            ("Runs Saved Analysis", visualizer.plot_runs_saved_analysis, 'runs_saved_analysis'),
+            ("Correlation Heatmap", visualizer.create_correlation_heatmap, 'correlation_heatmap')
         ]
         
-        for chart_name, chart_func in charts:
+        chart_paths = {}
+        for chart_name, chart_func, filename in charts:
             print(f"   Creating {chart_name}...", end="")
             chart_func(df_scored)
+            chart_paths[chart_name] = visualizer._chart_path(filename)
             print(" ✅")
             time.sleep(1)
         
         print("✅ All visualizations saved to results/visualizations/")
+        return chart_paths
     
-    def perform_advanced_analysis(self, analyzer, df_scored):
+    def perform_advanced_analysis(self, analyzer, df_scored, cube):
         """Perform advanced analysis"""
         print("\n🔍 ADVANCED ANALYSIS RESULTS")
         print("-" * 40)
@@ -199,7 +249,7 @@ class FieldingDashboard:
             print(f"   {i}. {player['player_name']} - {player['performance_score']} points")
         
         # Key insights
-        insights = analyzer.generate_performance_insights(df_scored)
+        insights = analyzer.generate_performance_insights(df_scored, cube)
         print(f"\n💡 KEY INSIGHTS:")
         for insight in insights[:4]:
             print(f"   • {insight}")
@@ -212,46 +262,65 @@ class FieldingDashboard:
         
         time.sleep(2)
     
-    def save_results(self, df_scored, analyzer):
+    def save_results(self, df_scored, analyzer, cube):
         """Save all results"""
         print("\n💾 SAVING ANALYSIS RESULTS...")
         
         # Save scored data
         output_path = 'data/outputs/fielding_analysis_results.csv'
-        df_scored.to_csv(output_path, index=False)
+        self.writer.write_frame(df_scored, output_path)
         print(f"   ✅ Analysis results: {output_path}")
         
         # Save recommendations
         recommendations = analyzer.generate_strategic_recommendations(df_scored)
         recs_path = 'data/outputs/strategic_recommendations.csv'
-        recommendations.to_csv(recs_path, index=False)
+        self.writer.write_frame(recommendations, recs_path)
         print(f"   ✅ Recommendations: {recs_path}")
         
         # Save performance summary
+        totals = cube.summary()
         summary = {
             'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'total_players': len(df_scored),
-            'average_score': round(df_scored['performance_score'].mean(), 2),
-            'total_runs_saved': int(df_scored['runs_saved'].sum()),
-            'top_performer': df_scored.loc[df_scored['performance_score'].idxmax(), 'player_name']
+            'total_players': totals['rows'],
+            'average_score': round(totals['average_score'], 2),
+            'total_runs_saved': int(totals['total_runs_saved']),
+            'top_performer': totals['top_performer']
         }
         
         summary_df = pd.DataFrame([summary])
         summary_path = 'data/outputs/performance_summary.csv'
-        summary_df.to_csv(summary_path, index=False)
+        self.writer.write_frame(summary_df, summary_path)
         print(f"   ✅ Performance summary: {summary_path}")
         
+        # Save team-level rollups
+        rollup_path = 'data/outputs/team_rollup.csv'
+        self.writer.write_frame(cube.rollup('team').reset_index(), rollup_path)
+        print(f"   ✅ Team rollup: {rollup_path}")
+        
         time.sleep(1)
     
-    def display_final_dashboard(self, df_scored, analyzer):
+    def generate_reports(self, df_scored, chart_paths):
+        """Write per-team HTML/PDF reports as configured in settings.yaml"""
+        from report_generator import ReportGenerator, UNKNOWN_TEAM
+        
+        print("\n📋 GENERATING REPORTS...")
+        generator = ReportGenerator.from_settings()
+        # The step 6 charts cover the whole frame, so they are that team's charts when it has one team
+        teams = df_scored['team'].fillna(UNKNOWN_TEAM).unique()
+        reused = {teams[0]: chart_paths} if len(teams) == 1 else None
+        reports = generator.generate_reports(df_scored, chart_paths=reused)
+        for team, paths in reports.items():
+            for path in paths:
+                print(f"   ✅ {team}: {path}")
+    
+    def display_final_dashboard(self, df_scored, analyzer, cube):
         """Display final dashboard summary"""
         print("\n" + "=" * 80)
         print("🎉 ANALYSIS COMPLETED SUCCESSFULLY!")
         print("=" * 80)
         
         # Final statistics
-        avg_score = df_scored['performance_score'].mean()
-        total_runs = df_scored['runs_saved'].sum()
+        summary = cube.summary()
         team = df_scored['team'].iloc[0]
         
         print(f"\n📊 FINAL DASHBOARD - {team}")
@@ -268,10 +337,10 @@ class FieldingDashboard:
         print(f"   💪 Needs Improvement: {needs_improvement} players")
         
         print(f"\n🎯 KEY METRICS:")
-        print(f"   📊 Average Score: {avg_score:.1f} points")
-        print(f"   💰 Net Runs: {total_runs:+d} runs")
-        print(f"   👐 Total Catches: {df_scored['catches'].sum()}")
-        print(f"   🎯 Direct Hits: {df_scored['direct_hits'].sum()}")
+        print(f"   📊 Average Score: {summary['average_score']:.1f} points")
+        print(f"   💰 Net Runs: {summary['total_runs_saved']:+d} runs")
+        print(f"   👐 Total Catches: {summary['total_catches']}")
+        print(f"   🎯 Direct Hits: {summary['total_direct_hits']}")
         
         print(f"\n📍 OUTPUT FILES:")
         print(f"   📁 Data: data/outputs/")
@@ -11,10 +11,52 @@ from .data_loader import FieldingDataLoader
 from .performance_calculator import PerformanceCalculator
 from .visualizations import FieldingVisualizer
 from .analysis_tools import FieldingAnalyzer
+from .fielding_store import FieldingStore
+from .result_writer import ResultWriter
+from .pipeline import PipelineOrchestrator
+from .form_metrics import FormTracker
+from .event_ingestion import EventAggregator
+from .live_scoring import LiveScoreBoard
+from .player_record import PlayerRecord
+from .similarity import FieldingSimilarityIndex
+from .resampling import BootstrapAnalyzer
+from .recommendation_rules import RecommendationEngine
+from .report_generator import ReportGenerator
+from .modeling import FieldingModeler
+from .prediction import FieldingPredictor
+from .score_normalization import ScoreBaselines
+from .rollup_cube import RollupCube
+from .count_store import CountMatrixStore
+from .sharded_runner import ShardedRunner
+from .change_capture import IncrementalRecomputer
+from .leaderboard import Leaderboard
+from .scoring_formula import ScoringFormula
+from .player_identity import PlayerRegistry
 
 __all__ = [
     'FieldingDataLoader',
     'PerformanceCalculator', 
     'FieldingVisualizer',
-    'FieldingAnalyzer'
+    'FieldingAnalyzer',
+    'FieldingStore',
+    'ResultWriter',
+    'PipelineOrchestrator',
+    'FormTracker',
+    'EventAggregator',
+    'LiveScoreBoard',
+    'PlayerRecord',
+    'FieldingSimilarityIndex',
+    'BootstrapAnalyzer',
+    'RecommendationEngine',
+    'ReportGenerator',
+    'FieldingModeler',
+    'FieldingPredictor',
+    'ScoreBaselines',
+    'RollupCube',
+    'CountMatrixStore',
+    'ShardedRunner',
+    'IncrementalRecomputer',
+    'Leaderboard',
+    'ScoringFormula',
+    'PlayerRegistry'
 ]
\ No newline at end of file
@@ -1,18 +1,99 @@
 # src/analysis_tools.py
+import copy
+import functools
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
 from scipy.stats import pearsonr
 
+try:
+    from .recommendation_rules import RecommendationEngine
+except ImportError:
+    from recommendation_rules import RecommendationEngine
+
+CORRELATION_METRICS = ['clean_picks', 'good_throws', 'catches', 'direct_hits',
+                       'run_outs', 'stumpings', 'runs_saved']
+
+
+def frame_fingerprint(df, columns):
+    """Cheap content hash of the given columns (missing columns are skipped)"""
+    present = [col for col in columns if col in df.columns]
+    hashes = pd.util.hash_pandas_object(df[present], index=False).to_numpy()
+    digest = hashlib.blake2b(hashes.tobytes(), digest_size=16)
+    digest.update(repr(present).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def memoized(*columns):
+    """Cache an analyzer method on (arguments, fingerprint of ``columns``, analyzer config)
+
+    Arguments with a ``fingerprint()`` method (e.g. a RollupCube) are keyed on
+    their current state rather than held by the cache.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        def wrapper(self, df, *args, **kwargs):
+            bound = signature.bind(self, df, *args, **kwargs)
+            bound.apply_defaults()
+            extra = tuple((name, value.fingerprint() if hasattr(value, 'fingerprint') else value)
+                          for name, value in bound.arguments.items() if name not in ('self', 'df'))
+            key = (func.__name__, frame_fingerprint(df, columns), extra, self._config_key())
+            
+            # Pipeline stages share one analyzer across threads; only cache access is locked
+            with self._cache_lock:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    self.cache_hits += 1
+                    return copy.deepcopy(self._cache[key])
+                self.cache_misses += 1
+            
+            result = func(self, df, *args, **kwargs)
+            with self._cache_lock:
+                self._cache[key] = copy.deepcopy(result)
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            return result
+        return wrapper
+    return decorator
+
+
 class FieldingAnalyzer:
-    def __init__(self):
+    def __init__(self, store=None, cache_size=64, recommendation_rules=None):
         self.performance_thresholds = {'excellent': 9, 'good': 6, 'needs_improvement': 0}
+        self.store = store
+        self.recommendation_engine = RecommendationEngine(recommendation_rules)
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def _config_key(self):
+        return (tuple(sorted(self.performance_thresholds.items())),
+                repr(self.recommendation_engine.rules))
+    
+    def cache_info(self):
+        return {'hits': self.cache_hits, 'misses': self.cache_misses,
+                'size': len(self._cache), 'max_size': self.cache_size}
     
+    def clear_cache(self):
+        self._cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    @memoized('player_name', 'performance_score', 'player_role')
     def identify_top_performers(self, df, n=3):
         top_players = df.nlargest(n, 'performance_score')[
             ['player_name', 'performance_score', 'player_role']
         ].reset_index(drop=True)
         return top_players
     
+    @memoized('player_name', 'performance_score', 'dropped_catches', 'missed_run_outs', 'runs_saved')
     def identify_areas_improvement(self, df):
         improvement_areas = []
         for _, player in df.iterrows():
@@ -40,9 +121,9 @@ class FieldingAnalyzer:
         
         return pd.DataFrame(improvement_areas)
     
+    @memoized(*CORRELATION_METRICS, 'performance_score')
     def calculate_correlations(self, df):
-        metrics = ['clean_picks', 'good_throws', 'catches', 'direct_hits', 
-                  'run_outs', 'stumpings', 'runs_saved']
+        metrics = CORRELATION_METRICS
         
         correlations = []
         for metric in metrics:
@@ -55,49 +136,65 @@ class FieldingAnalyzer:
         
         return pd.DataFrame(correlations).sort_values('correlation', ascending=False)
     
-    def generate_performance_insights(self, df):
+    @memoized('player_name', 'performance_score', 'player_role', 'runs_saved',
+              'catches', 'dropped_catches')
+    def generate_performance_insights(self, df, cube=None):
+        """Headline team insights; with a RollupCube the figures come from its precomputed summary"""
         insights = []
-        avg_score = df['performance_score'].mean()
-        total_runs_saved = df['runs_saved'].sum()
-        total_catches = df['catches'].sum()
-        total_dropped_catches = df['dropped_catches'].sum()
+        if cube is not None:
+            summary = cube.summary()
+            avg_score = summary['average_score']
+            total_runs_saved = summary['total_runs_saved']
+            total_catches = summary['total_catches']
+            total_dropped_catches = summary['total_dropped_catches']
+            top_player, top_score = summary['top_performer'], summary['top_score']
+        else:
+            avg_score = df['performance_score'].mean()
+            total_runs_saved = df['runs_saved'].sum()
+            total_catches = df['catches'].sum()
+            total_dropped_catches = df['dropped_catches'].sum()
+            top_3 = self.identify_top_performers(df, 3)
+            top_player, top_score = top_3.iloc[0]['player_name'], top_3.iloc[0]['performance_score']
         
         insights.append(f"📊 Team average performance score: {avg_score:.1f} points")
         insights.append(f"💰 Net runs saved by team: {total_runs_saved:+d} runs")
         insights.append(f"👐 Total catches taken: {total_catches}")
         insights.append(f"⚠️  Total catches dropped: {total_dropped_catches}")
-        
-        top_3 = self.identify_top_performers(df, 3)
-        insights.append(f"🏆 Top performer: {top_3.iloc[0]['player_name']} ({top_3.iloc[0]['performance_score']} points)")
+        insights.append(f"🏆 Top performer: {top_player} ({top_score} points)")
         
         return insights
     
+    @memoized('season', 'team', 'match_no', 'player_name', 'performance_score',
+              'clean_picks', 'good_throws', 'catches', 'dropped_catches', 'stumpings',
+              'run_outs', 'missed_run_outs', 'direct_hits', 'runs_saved')
     def generate_strategic_recommendations(self, df):
-        recommendations = []
-        total_dropped = df['dropped_catches'].sum()
-        
-        if total_dropped > 0:
-            recommendations.append({
-                'type': 'Team Training',
-                'priority': 'High',
-                'recommendation': 'Implement intensive catching practice sessions',
-                'rationale': f'{total_dropped} catches dropped affecting team performance'
-            })
-        
-        runs_conceded_players = df[df['runs_saved'] < 0]
-        if len(runs_conceded_players) > 0:
-            recommendations.append({
-                'type': 'Technical Training',
-                'priority': 'High',
-                'recommendation': 'Focus on ground fielding and boundary prevention',
-                'rationale': f'{len(runs_conceded_players)} players conceded runs'
-            })
-        
-        recommendations.append({
-            'type': 'Foundation',
-            'priority': 'Medium',
-            'recommendation': 'Continue focus on basic fielding drills',
-            'rationale': 'Clean picks and good throws form the foundation of good fielding'
-        })
-        
-        return pd.DataFrame(recommendations)
\ No newline at end of file
+        """Team-level recommendations from the configured rule set, labelled by season and team"""
+        recommendations = self.recommendation_engine.evaluate(df, levels=('team',))
+        keys = [key for key in ['season', 'team'] if key in df.columns]
+        return recommendations[keys + ['type', 'priority', 'recommendation', 'rationale']]
+    
+    @memoized('season', 'team', 'match_no', 'player_name', 'performance_score',
+              'clean_picks', 'good_throws', 'catches', 'dropped_catches', 'stumpings',
+              'run_outs', 'missed_run_outs', 'direct_hits', 'runs_saved')
+    def generate_all_recommendations(self, df):
+        """Prioritized team and player recommendations for every team in the frame"""
+        return self.recommendation_engine.evaluate(df)
+    
+    def query_top_performers(self, n=3, **filters):
+        """Top performers pushed down to the analytical store (e.g. season=, team=)"""
+        self._require_store()
+        return self.store.top_performers(n, **filters)
+    
+    def query_team_summary(self, **filters):
+        """Team averages and totals aggregated inside the analytical store"""
+        self._require_store()
+        return self.store.team_summary(**filters)
+    
+    def query_player_totals(self, **filters):
+        """Cross-match player aggregates aggregated inside the analytical store"""
+        self._require_store()
+        return self.store.player_totals(**filters)
+    
+    def _require_store(self):
+        if self.store is None:
+            raise ValueError("FieldingAnalyzer was created without a FieldingStore")
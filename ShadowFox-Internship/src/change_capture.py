@@ -0,0 +1,154 @@
+# src/change_capture.py
+import time
+import numpy as np
+import pandas as pd
+
+try:
+    from .data_loader import FieldingDataLoader, ROW_KEY_COLUMNS, clean_frame, row_hashes
+    from .performance_calculator import PerformanceCalculator
+    from .recommendation_rules import RecommendationEngine
+    from .rollup_cube import RollupCube
+    from .report_generator import UNKNOWN_TEAM
+except ImportError:
+    from data_loader import FieldingDataLoader, ROW_KEY_COLUMNS, clean_frame, row_hashes
+    from performance_calculator import PerformanceCalculator
+    from recommendation_rules import RecommendationEngine
+    from rollup_cube import RollupCube
+    from report_generator import UNKNOWN_TEAM
+
+
+class IncrementalRecomputer:
+    """Keeps scores, rollups, store rows, recommendations and reports in step with corrections
+
+    ``build`` scores a full input once. ``apply`` diffs a corrected input (a single
+    match file or the whole season) against the stored row hashes and recomputes
+    only the rows, cube cells, team recommendations and team reports it touches.
+    Rows are identified by (season, match_no, innings, player_name).
+
+    Charts are refreshed through the report generator, which redraws the
+    per-team charts of every affected team; without a ``report_generator`` no
+    charts are rendered. League-wide pipeline charts are not redrawn here.
+    """
+
+    def __init__(self, calculator=None, engine=None, loader=None, store=None, report_generator=None):
+        self.calculator = calculator or PerformanceCalculator()
+        self.engine = engine or RecommendationEngine()
+        self.loader = loader or FieldingDataLoader()
+        self.store = store
+        self.report_generator = report_generator
+        self.keys = []
+        self.hashes = None
+        self.scored = None
+        self.cube = None
+        self.recommendations = None
+
+    def build(self, df_raw):
+        """Full build: score every row and materialize every downstream output"""
+        clean = self._clean(df_raw).reset_index(drop=True)
+        self.keys = [key for key in ROW_KEY_COLUMNS if key in clean.columns]
+        self.hashes = row_hashes(clean)
+        self.scored = self._index(self.calculator.calculate_all_scores(clean))
+        self.cube = RollupCube().fit(self.scored)
+        self.recommendations = self.engine.evaluate(self.scored)
+        if self.store is not None:
+            self.store.insert_scored(self.scored)
+        if self.report_generator is not None:
+            self.report_generator.generate_reports(self.scored.reset_index(drop=True))
+        return self
+
+    def _clean(self, df):
+        # Same identity resolution as FieldingDataLoader.clean_fielding_data, so name variants
+        # in a corrected file diff against the canonical rows
+        return clean_frame(self.loader.registry.resolve(df))
+
+    def _index(self, df):
+        # Index levels are renamed so they never shadow the key columns in groupbys
+        return df.set_index(pd.MultiIndex.from_frame(df[self.keys].astype(str),
+                                                     names=[f'{key}_key' for key in self.keys]))
+
+    def apply(self, df_new, scope='match_no'):
+        """Apply a corrected input and return a report of what was invalidated"""
+        start = time.perf_counter()
+        clean = self._index(self._clean(df_new))
+        changes = self.loader.diff_inputs(clean.reset_index(drop=True), self.hashes, scope=scope)
+        changed = {kind: pd.MultiIndex.from_frame(rows[self.keys]) for kind, rows in changes.groupby('change')}
+        added, modified, removed = (changed.get(kind) for kind in ('added', 'modified', 'removed'))
+
+        stale_keys = self._union(modified, removed)
+        fresh_keys = self._union(added, modified)
+        old_rows = self.scored.loc[stale_keys] if stale_keys is not None else self.scored.iloc[0:0]
+        new_rows = (self._index(self.calculator.calculate_all_scores(clean.loc[fresh_keys]))
+                    if fresh_keys is not None else self.scored.iloc[0:0])
+
+        # Scores: drop stale rows and append the rescored ones
+        if stale_keys is not None:
+            self.scored = self.scored.drop(stale_keys)
+        if len(new_rows):
+            self.scored = pd.concat([self.scored, new_rows])
+
+        # Rollups: rebuild only the leaf cells the old and new rows belong to
+        touched = pd.concat([old_rows, new_rows])
+        cell_keys = self.cube.cell_keys(touched)
+        if len(touched):
+            self.cube.refresh(self.cube.rows_in_cells(self.scored, cell_keys), cell_keys)
+
+        # Recommendations and reports: re-evaluate only the affected teams
+        team_keys = [key for key in ['season', 'team'] if key in self.scored.columns]
+        teams = touched[team_keys].drop_duplicates()
+        self._refresh_recommendations(teams, team_keys)
+        reports = self._refresh_reports(teams)
+
+        if self.store is not None:
+            if removed is not None:
+                self.store.delete_scored(old_rows.loc[removed])
+            if len(new_rows):
+                self.store.insert_scored(new_rows)
+
+        self.hashes = self._merge_hashes(clean, removed)
+        return {
+            'added': 0 if added is None else len(added),
+            'modified': 0 if modified is None else len(modified),
+            'removed': 0 if removed is None else len(removed),
+            'players': sorted(touched['player_name'].unique()) if len(touched) else [],
+            'matches': sorted(touched['match_no'].astype(str).unique()) if len(touched) else [],
+            'teams': teams.to_dict('records'),
+            'rollup_cells': len(cell_keys),
+            'reports': reports,
+            'elapsed_ms': (time.perf_counter() - start) * 1000
+        }
+
+    @staticmethod
+    def _union(first, second):
+        if first is None:
+            return second
+        return first if second is None else first.append(second)
+
+    def _refresh_recommendations(self, teams, team_keys):
+        if teams.empty:
+            return
+        affected = pd.MultiIndex.from_frame(teams)
+        in_scope = pd.MultiIndex.from_frame(self.scored[team_keys]).isin(affected)
+        fresh = self.engine.evaluate(self.scored[in_scope])
+
+        existing = self.recommendations
+        stale = (pd.MultiIndex.from_frame(existing[team_keys]).isin(affected) if len(existing)
+                 else np.zeros(0, dtype=bool))
+        recommendations = pd.concat([existing[~stale], fresh], ignore_index=True)
+        sort_keys = [key for key in ['season', 'team'] if recommendations[key].notna().any()]
+        if sort_keys:
+            recommendations = recommendations.sort_values(sort_keys, kind='mergesort')
+        self.recommendations = recommendations.reset_index(drop=True)
+
+    def _refresh_reports(self, teams):
+        if self.report_generator is None or teams.empty:
+            return {}
+        # Missing teams are reported as UNKNOWN_TEAM, so match them under that label too
+        affected = self.scored[self.scored['team'].fillna(UNKNOWN_TEAM).isin(teams['team'].fillna(UNKNOWN_TEAM))]
+        # The affected teams' rows changed, so their existing chart files are stale
+        return self.report_generator.generate_reports(affected.reset_index(drop=True), redraw_charts=True)
+
+    def _merge_hashes(self, clean, removed):
+        hashes = self.hashes.drop(removed) if removed is not None else self.hashes
+        latest = row_hashes(clean.reset_index(drop=True))
+        hashes = hashes[~hashes.index.isin(latest.index)]
+        return pd.concat([hashes, latest])
@@ -0,0 +1,145 @@
+# src/count_store.py
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+
+try:
+    from .data_loader import COUNT_COLUMNS
+except ImportError:
+    from data_loader import COUNT_COLUMNS
+
+STORE_COLUMNS = COUNT_COLUMNS + ['runs_saved']
+INDEX_KEYS = {'player': 'player_name', 'team': 'team', 'match': 'match_no'}
+COUNT_DTYPE = np.int16
+ID_DTYPE = np.int32
+
+
+def _write_json(path, payload):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2)
+
+
+def _swap_directory(staging, directory):
+    """Move a fully written staging directory into place, replacing any previous store"""
+    if not os.path.exists(directory):
+        os.rename(staging, directory)
+        return
+    # Directories cannot be replaced in one rename, so the old store is moved aside first
+    retired = f"{staging}.old"
+    os.rename(directory, retired)
+    os.rename(staging, directory)
+    shutil.rmtree(retired, ignore_errors=True)
+
+
+def write_count_store(df, directory="data/processed/count_store"):
+    """Write a loader frame as an int16 count matrix, id arrays, a JSON dictionary file and a manifest
+
+    Counts must be whole numbers within the int16 range (ValueError otherwise).
+    Every file is written to a staging directory that then replaces ``directory``
+    as a whole, so readers never see arrays from two different writes.
+    """
+    try:
+        counts = df[STORE_COLUMNS].fillna(0).to_numpy(dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError("Count columns must be numeric")
+    if not np.isfinite(counts).all() or (counts != np.round(counts)).any():
+        raise ValueError("Count values must be whole numbers")
+    info = np.iinfo(COUNT_DTYPE)
+    if counts.size and (counts.min() < info.min or counts.max() > info.max):
+        raise ValueError(f"Count values outside the {COUNT_DTYPE.__name__} range")
+
+    directory = os.path.normpath(directory)
+    parent = os.path.dirname(directory) or '.'
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=parent, prefix=f".{os.path.basename(directory)}.tmp-")
+    try:
+        dictionaries = {'columns': STORE_COLUMNS}
+        files = []
+        for name, column in INDEX_KEYS.items():
+            codes, labels = pd.factorize(df[column] if column in df.columns else pd.Series([None] * len(df)))
+            np.save(os.path.join(staging, f'{name}_ids.npy'), codes.astype(ID_DTYPE))
+            files.append(f'{name}_ids.npy')
+            dictionaries[name] = [str(label) for label in labels]
+
+        np.save(os.path.join(staging, 'counts.npy'), counts.astype(COUNT_DTYPE))
+        _write_json(os.path.join(staging, 'dictionaries.json'), dictionaries)
+        _write_json(os.path.join(staging, 'manifest.json'),
+                    {'rows': len(counts), 'files': files + ['counts.npy', 'dictionaries.json']})
+        _swap_directory(staging, directory)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return directory
+
+
+class CountMatrixStore:
+    """Read-only, memory-mapped view of a count store written by ``write_count_store``
+
+    Arrays are opened with ``mmap_mode='r'`` so opening is instant and rows are
+    paged in on demand. Pickling sends only the directory, so worker processes
+    reopen the same files and share the page cache instead of copying arrays.
+    """
+
+    def __init__(self, directory="data/processed/count_store"):
+        self.directory = directory
+        self._open()
+
+    def _open(self):
+        with open(os.path.join(self.directory, 'manifest.json'), encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        with open(os.path.join(self.directory, 'dictionaries.json'), encoding='utf-8') as f:
+            self.dictionaries = json.load(f)
+        self.columns = self.dictionaries['columns']
+        self.counts = np.load(os.path.join(self.directory, 'counts.npy'), mmap_mode='r')
+        self.ids = {name: np.load(os.path.join(self.directory, f'{name}_ids.npy'), mmap_mode='r')
+                    for name in INDEX_KEYS}
+        if any(len(array) != self.manifest['rows'] for array in [self.counts, *self.ids.values()]):
+            raise ValueError(f"Count store {self.directory} does not match its manifest")
+
+    def __getstate__(self):
+        return {'directory': self.directory}
+
+    def __setstate__(self, state):
+        self.directory = state['directory']
+        self._open()
+
+    def __len__(self):
+        return len(self.counts)
+
+    def column(self, name):
+        """One count column as a (zero-copy) strided view"""
+        return self.counts[:, self.columns.index(name)]
+
+    def id_of(self, kind, label):
+        labels = self.dictionaries[kind]
+        if label not in labels:
+            raise KeyError(f"Unknown {kind}: {label}")
+        return labels.index(label)
+
+    def mask(self, player=None, team=None, match=None):
+        """Boolean row mask for the given player / team / match labels"""
+        selected = np.ones(len(self), dtype=bool)
+        for kind, label in (('player', player), ('team', team), ('match', match)):
+            if label is not None:
+                selected &= self.ids[kind] == self.id_of(kind, label)
+        return selected
+
+    def scores(self, weights):
+        """Performance scores for every row from a weights dict (runs_saved counts once)"""
+        vector = np.array([weights.get(column, 1 if column == 'runs_saved' else 0)
+                           for column in self.columns], dtype=np.float64)
+        return self.counts @ vector
+
+    def to_frame(self, rows=None):
+        """Materialize (a subset of) the store back into a loader-style frame"""
+        rows = slice(None) if rows is None else rows
+        df = pd.DataFrame(np.asarray(self.counts[rows], dtype=np.int64), columns=self.columns)
+        for kind, column in INDEX_KEYS.items():
+            labels = np.array(self.dictionaries[kind], dtype=object)
+            codes = np.asarray(self.ids[kind][rows])
+            values = labels[codes.clip(min=0)] if len(labels) else np.full(len(codes), None)
+            df[column] = np.where(codes >= 0, values, None)
+        return df[[INDEX_KEYS['player']] + self.columns + [INDEX_KEYS['team'], INDEX_KEYS['match']]]
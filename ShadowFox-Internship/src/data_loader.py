@@ -2,15 +2,211 @@
 import pandas as pd
 import numpy as np
 import os
+import glob
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from openpyxl import load_workbook
+
+try:
+    from .result_writer import ResultWriter
+    from .player_identity import PlayerRegistry
+except ImportError:
+    from result_writer import ResultWriter
+    from player_identity import PlayerRegistry
+
+COUNT_COLUMNS = ['clean_picks', 'good_throws', 'catches', 'dropped_catches',
+                 'stumpings', 'run_outs', 'missed_run_outs', 'direct_hits']
+
+CANONICAL_COLUMNS = (['player_name'] + COUNT_COLUMNS +
+                     ['runs_saved', 'player_role', 'team', 'match_no', 'innings', 'venue'])
+
+# Columns identifying one player's row for one innings of one match
+ROW_KEY_COLUMNS = ['season', 'match_no', 'innings', 'player_name']
+
+# Header variants seen in the match feeds, mapped to the canonical schema
+COLUMN_ALIASES = {
+    'player': 'player_name', 'name': 'player_name', 'fielder': 'player_name',
+    'role': 'player_role',
+    'match': 'match_no', 'match_id': 'match_no', 'match_number': 'match_no',
+    'ground': 'venue', 'stadium': 'venue',
+    'team_name': 'team',
+    'picks': 'clean_picks', 'throws': 'good_throws',
+    'drops': 'dropped_catches', 'dropped': 'dropped_catches',
+    'runouts': 'run_outs', 'missed_runouts': 'missed_run_outs',
+    'hits': 'direct_hits', 'runs': 'runs_saved'
+}
+
+MATCH_FILE_PATTERNS = ['*.csv', '*.xlsx']
+
+# Rows buffered per sheet before they are packed into a typed DataFrame chunk
+EXCEL_CHUNK_ROWS = 10000
+
+
+def canonical_column_name(col):
+    """Map a single feed header to its canonical column name"""
+    key = str(col).strip().lower().replace(' ', '_').replace('-', '_')
+    return COLUMN_ALIASES.get(key, key)
+
+
+def normalize_columns(df):
+    """Rename feed headers to the canonical schema and add any missing columns"""
+    df = df.rename(columns={col: canonical_column_name(col) for col in df.columns})
+    
+    for col in CANONICAL_COLUMNS:
+        if col not in df.columns:
+            df[col] = 0 if col in COUNT_COLUMNS + ['runs_saved'] else np.nan
+    
+    extra_columns = [col for col in df.columns if col not in CANONICAL_COLUMNS]
+    return df[CANONICAL_COLUMNS + extra_columns]
+
+
+def _pack_excel_chunk(buffer):
+    """Turn buffered sheet rows into a DataFrame with compact numeric dtypes"""
+    chunk = pd.DataFrame(buffer)
+    for col in chunk.columns:
+        if col in COUNT_COLUMNS or col in ('runs_saved', 'innings'):
+            chunk[col] = pd.to_numeric(chunk[col], errors='coerce', downcast='integer')
+    return chunk
+
+
+def _excel_columns(sheet_name, header, columns):
+    """Positions and canonical names of the header cells to keep"""
+    names = [canonical_column_name(col) for col in header]
+    keep = [i for i, name in enumerate(names)
+            if header[i] is not None and (columns is None or name in columns)]
+    seen = {}
+    for i in keep:
+        # Two variants of one column (e.g. 'Player' and 'Name') would be merged into one list
+        if names[i] in seen:
+            raise ValueError(f"Sheet {sheet_name}: headers '{header[seen[names[i]]]}' and '{header[i]}' "
+                             f"both map to '{names[i]}'")
+        seen[names[i]] = i
+    return names, keep
+
+
+def _iter_excel_sheet(filepath, sheet_name, columns=None, chunk_rows=EXCEL_CHUNK_ROWS):
+    """Stream one worksheet in read-only mode as typed DataFrame chunks
+    
+    Only the requested canonical columns are kept, and at most ``chunk_rows``
+    rows are buffered before a chunk is yielded, so memory stays bounded by one
+    chunk. Raises ValueError when two headers map to the same canonical column.
+    """
+    workbook = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        header = next(rows, None) or ()
+        names, keep = _excel_columns(sheet_name, header, columns)
+        
+        yielded = False
+        buffer = {names[i]: [] for i in keep}
+        buffered = 0
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            for i in keep:
+                buffer[names[i]].append(row[i] if i < len(row) else None)
+            buffered += 1
+            if buffered >= chunk_rows:
+                yield _finish_excel_chunk(buffer, sheet_name, columns)
+                yielded = True
+                buffer = {names[i]: [] for i in keep}
+                buffered = 0
+        if buffered or not yielded:
+            yield _finish_excel_chunk(buffer, sheet_name, columns)
+    finally:
+        workbook.close()
+
+
+def _finish_excel_chunk(buffer, sheet_name, columns):
+    chunk = _pack_excel_chunk(buffer)
+    if columns is None:
+        chunk = normalize_columns(chunk)
+    chunk['source_sheet'] = sheet_name
+    return chunk
+
+
+def _read_excel_sheet(filepath, sheet_name, columns=None):
+    """Read one whole worksheet into a frame (runs inside worker processes)"""
+    return pd.concat(list(_iter_excel_sheet(filepath, sheet_name, columns)), ignore_index=True)
+
+
+def _list_sheets(filepath):
+    workbook = load_workbook(filepath, read_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def _read_match_file(filepath):
+    """Read one match file into the canonical schema (runs inside worker processes)"""
+    if filepath.lower().endswith(('.xlsx', '.xlsm')):
+        df = pd.concat([_read_excel_sheet(filepath, sheet) for sheet in _list_sheets(filepath)],
+                       ignore_index=True)
+    else:
+        df = pd.read_csv(filepath)
+    df = normalize_columns(df)
+    df['source_file'] = os.path.basename(filepath)
+    return df
+
+
+def clean_frame(df):
+    """Coerce count columns to int and drop exact duplicate rows (the index is kept)"""
+    cleaned_df = df.copy()
+    for col in COUNT_COLUMNS + ['runs_saved']:
+        cleaned_df[col] = pd.to_numeric(cleaned_df[col], errors='coerce').fillna(0).astype(int)
+    return cleaned_df[~cleaned_df.duplicated()]
+
+
+def row_hashes(df):
+    """Content hash of every row, indexed by its (season, match, innings, player) key"""
+    keys = [key for key in ROW_KEY_COLUMNS if key in df.columns]
+    # Interned ids depend on registry state, not on the row itself
+    content = sorted(col for col in df.columns if col not in keys and col not in ('source_file', 'player_id'))
+    hashes = pd.Series(pd.util.hash_pandas_object(df[content], index=False).to_numpy().view(np.int64),
+                       index=pd.MultiIndex.from_frame(df[keys].astype(str)), name='row_hash')
+    # Rows sharing a key are combined order-independently
+    return hashes.groupby(level=keys, sort=False).sum()
+
+
+def sort_season(df, order_column='match_date'):
+    """Rows in the order the matches were played (input order is kept within an innings)
+
+    Sorts on ``order_column`` when the frame has it, otherwise on season, match
+    number and innings, comparing match numbers such as 'IPL2367' by their
+    numeric part. Raises ValueError when the frame has neither column.
+    """
+    keys = pd.DataFrame(index=range(len(df)))
+    if order_column in df.columns:
+        keys['order'] = df[order_column].to_numpy()
+    elif 'match_no' in df.columns:
+        match_no = df['match_no'].astype(str).reset_index(drop=True)
+        if 'season' in df.columns:
+            keys['season'] = df['season'].to_numpy()
+        keys['match_number'] = pd.to_numeric(match_no.str.extract(r'(\d+)\s*$', expand=False), errors='coerce')
+        keys['match_no'] = match_no
+    else:
+        raise ValueError(f"Cannot order the season: expected a '{order_column}' or 'match_no' column")
+    if 'innings' in df.columns:
+        keys['innings'] = pd.to_numeric(df['innings'], errors='coerce').to_numpy()
+    order = keys.sort_values(list(keys.columns), kind='mergesort').index
+    return df.iloc[order].reset_index(drop=True)
+
 
 class FieldingDataLoader:
-    def __init__(self):
+    def __init__(self, registry=None):
         self.raw_data_path = "data/raw/"
         self.processed_data_path = "data/processed/"
+        self.load_failures = []
+        self.missing_columns = {}
+        self.registry = registry if registry is not None else PlayerRegistry()
         
-    def load_from_csv(self, filename="ipl_fielding_data.csv"):
-        """Load data from CSV file with progress animation"""
+    def load_from_csv(self, filename="ipl_fielding_data.csv", fallback=True):
+        """Load data from CSV file with progress animation
+        
+        A missing or unreadable file falls back to the sample dataset, unless
+        ``fallback`` is False, in which case the error is raised.
+        """
         filepath = os.path.join(self.raw_data_path, filename)
         
         print("📁 LOADING DATA FROM CSV...")
@@ -18,6 +214,8 @@ class FieldingDataLoader:
         
         if not os.path.exists(filepath):
             print(f"❌ CSV file not found: {filepath}")
+            if not fallback:
+                raise FileNotFoundError(f"CSV file not found: {filepath}")
             print("🔄 Creating sample data instead...")
             return self.create_sample_dataset()
         
@@ -27,9 +225,171 @@ class FieldingDataLoader:
             return df
         except Exception as e:
             print(f"❌ Error loading CSV: {e}")
+            if not fallback:
+                raise
             print("🔄 Creating sample data instead...")
             return self.create_sample_dataset()
     
+    def load_from_excel(self, filename="ipl_fielding_raw_data.xlsx", sheets=None,
+                        columns=None, max_workers=None):
+        """Load an xlsx workbook in read-only streaming mode
+        
+        Each sheet (one per match) is parsed in its own worker process. ``sheets``
+        restricts which sheets are read and ``columns`` which canonical columns are
+        kept; headers are mapped to the canonical schema.
+        """
+        filepath = os.path.join(self.raw_data_path, filename)
+        
+        print("📁 LOADING DATA FROM EXCEL...")
+        self.load_failures = []
+        self.missing_columns = {}
+        
+        if columns is not None:
+            columns = [canonical_column_name(col) for col in columns]
+        
+        try:
+            sheet_names = _list_sheets(filepath)
+        except Exception as e:
+            print(f"❌ Error opening workbook {filepath}: {e}")
+            self.load_failures.append({'file': filepath, 'error': str(e)})
+            return pd.DataFrame(columns=columns or CANONICAL_COLUMNS)
+        
+        if sheets is not None:
+            missing = [sheet for sheet in sheets if sheet not in sheet_names]
+            for sheet in missing:
+                self.load_failures.append({'file': filepath, 'sheet': sheet,
+                                           'error': 'sheet not found'})
+            sheet_names = [sheet for sheet in sheet_names if sheet in sheets]
+        
+        frames = {}
+        if max_workers == 1 or len(sheet_names) <= 1:
+            for index, sheet in enumerate(sheet_names):
+                try:
+                    frames[index] = _read_excel_sheet(filepath, sheet, columns)
+                except Exception as e:
+                    self.load_failures.append({'file': filepath, 'sheet': sheet, 'error': str(e)})
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(_read_excel_sheet, filepath, sheet, columns): (index, sheet)
+                           for index, sheet in enumerate(sheet_names)}
+                for future in as_completed(futures):
+                    index, sheet = futures[future]
+                    try:
+                        frames[index] = future.result()
+                    except Exception as e:
+                        self.load_failures.append({'file': filepath, 'sheet': sheet, 'error': str(e)})
+        
+        if columns is not None:
+            for index in sorted(frames):
+                absent = [col for col in columns if col not in frames[index].columns]
+                if absent:
+                    self.missing_columns[sheet_names[index]] = absent
+        
+        if frames:
+            df = pd.concat([frames[i] for i in sorted(frames)], ignore_index=True)
+        else:
+            df = pd.DataFrame(columns=columns or CANONICAL_COLUMNS)
+        
+        print(f"✅ Loaded {len(df)} records from {len(frames)} sheet(s) of {filename}")
+        for failure in self.load_failures:
+            print(f"❌ Failed to load {failure.get('sheet', failure['file'])}: {failure['error']}")
+        for sheet, absent in self.missing_columns.items():
+            print(f"⚠️ Sheet {sheet} has no column(s): {', '.join(absent)}")
+        
+        return df
+    
+    def iter_excel_chunks(self, filename="ipl_fielding_raw_data.xlsx", sheets=None, columns=None,
+                          chunk_rows=EXCEL_CHUNK_ROWS):
+        """Yield a workbook's rows as canonical DataFrame chunks, sheet by sheet
+        
+        Unlike ``load_from_excel`` nothing is concatenated: each chunk of at most
+        ``chunk_rows`` rows is handed to the caller, so workbooks larger than
+        memory can be processed. Unknown ``sheets`` raise ValueError.
+        """
+        filepath = os.path.join(self.raw_data_path, filename)
+        if columns is not None:
+            columns = [canonical_column_name(col) for col in columns]
+        
+        sheet_names = _list_sheets(filepath)
+        if sheets is not None:
+            missing = [sheet for sheet in sheets if sheet not in sheet_names]
+            if missing:
+                raise ValueError(f"Workbook {filepath} has no sheet(s): {', '.join(missing)}")
+            sheet_names = [sheet for sheet in sheet_names if sheet in sheets]
+        
+        for sheet in sheet_names:
+            yield from _iter_excel_sheet(filepath, sheet, columns, chunk_rows)
+    
+    def load_from_events(self, filename="ipl_fielding_events.csv", chunksize=100000):
+        """Aggregate a ball-by-ball event CSV into per-player fielding counts"""
+        try:
+            from .event_ingestion import EventAggregator
+        except ImportError:
+            from event_ingestion import EventAggregator
+        
+        filepath = os.path.join(self.raw_data_path, filename)
+        print("📁 LOADING FIELDING EVENTS...")
+        aggregator = EventAggregator().ingest_csv(filepath, chunksize=chunksize)
+        df = aggregator.to_frame()
+        
+        print(f"✅ Aggregated {aggregator.events_processed} events into {len(df)} player innings")
+        for event_type, count in aggregator.unknown_events.items():
+            print(f"⚠️  Skipped {count} unknown '{event_type}' event(s)")
+        return df
+    
+    def load_from_directory(self, source=None, patterns=None, max_workers=None):
+        """Load every match file in a directory (or matching a glob) using a process pool
+        
+        Files are parsed and normalized in parallel and concatenated once. Files that
+        fail to parse are reported in ``self.load_failures`` instead of being replaced
+        by sample data.
+        """
+        source = source or self.raw_data_path
+        files = self._resolve_match_files(source, patterns or MATCH_FILE_PATTERNS)
+        
+        print(f"📁 LOADING {len(files)} MATCH FILES FROM {source}...")
+        self.load_failures = []
+        frames = {}
+        
+        if max_workers == 1 or len(files) <= 1:
+            for index, filepath in enumerate(files):
+                try:
+                    frames[index] = _read_match_file(filepath)
+                except Exception as e:
+                    self.load_failures.append({'file': filepath, 'error': str(e)})
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(_read_match_file, filepath): (index, filepath)
+                           for index, filepath in enumerate(files)}
+                for future in as_completed(futures):
+                    index, filepath = futures[future]
+                    try:
+                        frames[index] = future.result()
+                    except Exception as e:
+                        self.load_failures.append({'file': filepath, 'error': str(e)})
+        
+        if frames:
+            # Keep file order stable regardless of completion order
+            df = pd.concat([frames[i] for i in sorted(frames)], ignore_index=True)
+        else:
+            df = pd.DataFrame(columns=CANONICAL_COLUMNS + ['source_file'])
+        
+        print(f"✅ Loaded {len(df)} records from {len(frames)} of {len(files)} files")
+        for failure in self.load_failures:
+            print(f"❌ Failed to load {failure['file']}: {failure['error']}")
+        
+        return df
+    
+    def _resolve_match_files(self, source, patterns):
+        """Expand a directory or glob pattern into a sorted list of match files"""
+        if os.path.isdir(source):
+            files = []
+            for pattern in patterns:
+                files.extend(glob.glob(os.path.join(source, pattern)))
+        else:
+            files = glob.glob(source)
+        return sorted(set(files))
+    
     def create_sample_dataset(self):
         """Create sample data if CSV is not available"""
         fielding_data = {
@@ -93,17 +453,86 @@ class FieldingDataLoader:
         print("🧹 CLEANING DATA...")
         self._animate_loading("Processing data")
         
-        cleaned_df = df.copy()
-        numeric_columns = ['clean_picks', 'good_throws', 'catches', 'dropped_catches',
-                          'stumpings', 'run_outs', 'missed_run_outs', 'direct_hits', 'runs_saved']
-        
-        for col in numeric_columns:
-            cleaned_df[col] = pd.to_numeric(cleaned_df[col], errors='coerce').fillna(0).astype(int)
-        
-        cleaned_df = cleaned_df.drop_duplicates().reset_index(drop=True)
+        # Resolve name variants first so rows from different feeds dedup as one player
+        resolved_before = len(self.registry.resolutions)
+        queued_before = len(self.registry.review_queue)
+        cleaned_df = clean_frame(self.registry.resolve(df)).reset_index(drop=True)
+        matched = self.registry.resolutions[resolved_before:]
+        queued = self.registry.review_queue[queued_before:]
+        if matched:
+            print(f"🔗 Matched {len(matched)} player name variant(s) to known players")
+        if queued:
+            print(f"🔍 {len(queued)} new player name(s) resemble known players; see registry.review_queue")
         print(f"✅ Data cleaning completed: {len(cleaned_df)} records")
         return cleaned_df
     
+    def save_processed_data(self, df, filename="cleaned_fielding_data.csv", writer=None):
+        """Save processed data atomically, through ``writer`` when one is shared"""
+        filepath = os.path.join(self.processed_data_path, filename)
+        if writer is None:
+            with ResultWriter(background=False) as own_writer:
+                own_writer.write_frame(df, filepath)
+        else:
+            writer.write_frame(df, filepath)
+        print(f"✅ Processed data saved: {filepath}")
+        return filepath
+    
+    def save_count_store(self, df, directory="data/processed/count_store"):
+        """Write the count columns as a memory-mappable int16 matrix with id arrays"""
+        try:
+            from .count_store import write_count_store
+        except ImportError:
+            from count_store import write_count_store
+        
+        write_count_store(df, directory)
+        print(f"✅ Count store saved: {directory} ({len(df)} rows)")
+        return directory
+    
+    def load_count_store(self, directory="data/processed/count_store"):
+        """Open a count store as zero-copy memory-mapped arrays"""
+        try:
+            from .count_store import CountMatrixStore
+        except ImportError:
+            from count_store import CountMatrixStore
+        
+        return CountMatrixStore(directory)
+    
+    def save_input_snapshot(self, df, filename="input_row_hashes.csv"):
+        """Store the row hashes of an input frame for later change detection"""
+        filepath = os.path.join(self.processed_data_path, filename)
+        with ResultWriter(background=False) as writer:
+            writer.write_frame(row_hashes(df).reset_index(), filepath)
+        return filepath
+    
+    def load_input_snapshot(self, filename="input_row_hashes.csv"):
+        snapshot = pd.read_csv(os.path.join(self.processed_data_path, filename), dtype=str)
+        keys = [key for key in ROW_KEY_COLUMNS if key in snapshot.columns]
+        return snapshot.set_index(keys)['row_hash'].astype(np.int64)
+    
+    def diff_inputs(self, new_df, previous, scope='match_no'):
+        """Keys added, modified or removed in ``new_df`` relative to a stored version
+        
+        ``previous`` is the stored frame or its row hashes (see save_input_snapshot).
+        With ``scope`` set, only stored rows for the same matches are compared, so a
+        single corrected match file can be diffed against a whole season.
+        """
+        new_hashes = row_hashes(new_df)
+        old_hashes = previous if isinstance(previous, pd.Series) else row_hashes(previous)
+        if scope is not None and scope in new_hashes.index.names:
+            in_scope = old_hashes.index.get_level_values(scope).isin(new_hashes.index.get_level_values(scope))
+            old_hashes = old_hashes[in_scope]
+        
+        joined = pd.concat([old_hashes.astype('Int64').rename('old'),
+                            new_hashes.astype('Int64').rename('new')], axis=1)
+        differs = (joined['old'] != joined['new']).fillna(False).to_numpy(dtype=bool)
+        change = np.select(
+            [joined['old'].isna().to_numpy(), joined['new'].isna().to_numpy(), differs],
+            ['added', 'removed', 'modified'], default='unchanged'
+        )
+        changes = joined.index.to_frame(index=False)
+        changes['change'] = change
+        return changes[changes['change'] != 'unchanged'].reset_index(drop=True)
+    
     def _animate_loading(self, message, duration=2):
         """Simple loading animation"""
         symbols = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
@@ -0,0 +1,132 @@
+# src/event_ingestion.py
+import numpy as np
+import pandas as pd
+
+try:
+    from .data_loader import CANONICAL_COLUMNS
+except ImportError:
+    from data_loader import CANONICAL_COLUMNS
+
+# Event type -> (count column, multiplier). Events on runs_saved carry their run value.
+EVENT_TYPE_MAP = {
+    'clean_pick': ('clean_picks', 1),
+    'good_throw': ('good_throws', 1),
+    'catch': ('catches', 1),
+    'dropped_catch': ('dropped_catches', 1),
+    'stumping': ('stumpings', 1),
+    'run_out': ('run_outs', 1),
+    'missed_run_out': ('missed_run_outs', 1),
+    'direct_hit': ('direct_hits', 1),
+    'runs_saved': ('runs_saved', 1),
+    'runs_conceded': ('runs_saved', -1)
+}
+
+VALUE_COLUMNS = CANONICAL_COLUMNS[1:10]
+EVENT_KEYS = ['player_name', 'match_no', 'innings']
+EVENT_METADATA = ['team', 'player_role', 'venue']
+
+
+class EventAggregator:
+    """Aggregates ball-by-ball fielding events into per-player count rows
+
+    Counts are held in a dict keyed on (player, match, innings), so events can be
+    streamed in chunks of any size without ever materializing the event table.
+    Events with a missing key are not aggregated; they are counted in
+    ``incomplete_events`` and left out of ``events_processed``.
+    """
+
+    def __init__(self, event_map=None):
+        self.event_map = event_map or EVENT_TYPE_MAP
+        self.counts = {}
+        self.metadata = {}
+        self.unknown_events = {}
+        self.incomplete_events = 0
+        self.events_processed = 0
+
+    def add_event(self, player_name, match_no, innings, event_type, runs=1,
+                  team=None, player_role=None, venue=None):
+        """Apply a single event (used for live feeds)"""
+        mapping = self.event_map.get(event_type)
+        if mapping is None:
+            self.unknown_events[event_type] = self.unknown_events.get(event_type, 0) + 1
+            return None
+        if any(pd.isna(value) for value in (player_name, match_no, innings)):
+            self.incomplete_events += 1
+            return None
+        column, multiplier = mapping
+        amount = multiplier * (runs if column == 'runs_saved' else 1)
+
+        key = (player_name, match_no, innings)
+        row = self.counts.get(key)
+        if row is None:
+            row = self.counts[key] = [0] * len(VALUE_COLUMNS)
+            self.metadata[key] = (team, player_role, venue)
+        row[VALUE_COLUMNS.index(column)] += amount
+        self.events_processed += 1
+        return key
+
+    def add_events(self, events):
+        """Apply a chunk of events given as a DataFrame"""
+        mapped = events['event_type'].map(lambda event: self.event_map.get(event, (None, 0)))
+        columns = mapped.str[0]
+        known = columns.notna()
+
+        for event_type, count in events.loc[~known, 'event_type'].value_counts().items():
+            self.unknown_events[event_type] = self.unknown_events.get(event_type, 0) + int(count)
+
+        # groupby drops null keys, so such events are rejected up front rather than silently lost
+        keyed = events[EVENT_KEYS].notna().all(axis=1)
+        self.incomplete_events += int((known & ~keyed).sum())
+        known &= keyed
+
+        events = events[known]
+        columns = columns[known]
+        amounts = mapped[known].str[1].to_numpy()
+        if 'runs' in events.columns:
+            runs = events['runs'].fillna(1).to_numpy()
+            amounts = np.where(columns.to_numpy() == 'runs_saved', amounts * runs, amounts)
+
+        chunk = events[EVENT_KEYS].copy()
+        chunk['column'] = columns.to_numpy()
+        chunk['amount'] = amounts
+        totals = chunk.groupby(EVENT_KEYS + ['column'], sort=False)['amount'].sum().unstack(fill_value=0)
+
+        for key, values in zip(totals.index, totals.itertuples(index=False, name=None)):
+            row = self.counts.get(key)
+            if row is None:
+                row = self.counts[key] = [0] * len(VALUE_COLUMNS)
+            for column, value in zip(totals.columns, values):
+                row[VALUE_COLUMNS.index(column)] += int(value)
+
+        metadata_columns = [col for col in EVENT_METADATA if col in events.columns]
+        first_seen = events.drop_duplicates(EVENT_KEYS)
+        for row in first_seen.itertuples(index=False):
+            key = tuple(getattr(row, col) for col in EVENT_KEYS)
+            if self.metadata.get(key) is None:
+                self.metadata[key] = tuple(getattr(row, col) if col in metadata_columns else None
+                                           for col in EVENT_METADATA)
+
+        self.events_processed += len(events)
+
+    def ingest_csv(self, filepath, chunksize=100000):
+        """Stream an event CSV in chunks"""
+        for chunk in pd.read_csv(filepath, chunksize=chunksize):
+            self.add_events(chunk)
+        return self
+
+    def ingest_records(self, records):
+        """Stream events from an iterable of dicts"""
+        for record in records:
+            self.add_event(**record)
+        return self
+
+    def to_frame(self):
+        """Aggregated counts in the schema PerformanceCalculator expects"""
+        if not self.counts:
+            return pd.DataFrame(columns=CANONICAL_COLUMNS)
+        keys = list(self.counts)
+        df = pd.DataFrame(keys, columns=EVENT_KEYS)
+        df[VALUE_COLUMNS] = pd.DataFrame([self.counts[key] for key in keys], columns=VALUE_COLUMNS)
+        df[EVENT_METADATA] = pd.DataFrame([self.metadata.get(key) or (None,) * 3 for key in keys],
+                                          columns=EVENT_METADATA)
+        return df[CANONICAL_COLUMNS]
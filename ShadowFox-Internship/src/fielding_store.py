@@ -0,0 +1,148 @@
+# src/fielding_store.py
+import os
+import sqlite3
+import pandas as pd
+
+STORE_COLUMNS = {
+    'season': 'TEXT NOT NULL',
+    'match_no': 'TEXT NOT NULL',
+    'innings': 'INTEGER NOT NULL',
+    'team': 'TEXT',
+    'venue': 'TEXT',
+    'player_name': 'TEXT NOT NULL',
+    'player_role': 'TEXT',
+    'clean_picks': 'INTEGER', 'good_throws': 'INTEGER', 'catches': 'INTEGER',
+    'dropped_catches': 'INTEGER', 'stumpings': 'INTEGER', 'run_outs': 'INTEGER',
+    'missed_run_outs': 'INTEGER', 'direct_hits': 'INTEGER', 'runs_saved': 'INTEGER',
+    'performance_score': 'REAL',
+    'positive_contributions': 'REAL',
+    'negative_contributions': 'REAL',
+    'net_contribution': 'REAL',
+    'efficiency_ratio': 'REAL'
+}
+
+# Columns that may be used as equality filters in store queries
+FILTER_COLUMNS = ['season', 'team', 'match_no', 'innings', 'player_name', 'player_role', 'venue']
+
+
+class FieldingStore:
+    """Embedded SQLite store for scored fielding frames across matches and seasons"""
+
+    def __init__(self, db_path="data/outputs/fielding_store.db"):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self._create_schema()
+
+    def _create_schema(self):
+        columns = ",\n    ".join(f"{name} {sql_type}" for name, sql_type in STORE_COLUMNS.items())
+        with self.conn:
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS scored_fielding (\n    {columns}\n)")
+            self.conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_player_match "
+                              "ON scored_fielding (season, match_no, innings, player_name)")
+            for column in ['player_name', 'team', 'match_no', 'season']:
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{column} "
+                                  f"ON scored_fielding ({column})")
+
+    def _keyed_rows(self, df, season=None):
+        """Copy of the frame with a complete (season, match_no, innings, player_name) key"""
+        rows = df.copy()
+        if 'season' not in rows.columns:
+            rows['season'] = season
+        rows['season'] = rows['season'].fillna('').astype(str)
+        # Feeds without an innings column are normalized to NaN; treat them as the first innings
+        rows['innings'] = (rows['innings'] if 'innings' in rows.columns else 1)
+        rows['innings'] = pd.to_numeric(rows['innings']).fillna(1).astype(int)
+        for column in ['match_no', 'player_name']:
+            missing = rows[column].isna() if column in rows.columns else pd.Series(True, index=rows.index)
+            if missing.any():
+                raise ValueError(f"{int(missing.sum())} row(s) have no {column}; "
+                                 f"every stored row needs a {column}")
+        return rows
+
+    def insert_scored(self, df, season=None):
+        """Bulk insert a scored frame, replacing rows already stored for the same player-match"""
+        rows = self._keyed_rows(df, season)
+        for column in STORE_COLUMNS:
+            if column not in rows.columns:
+                rows[column] = None
+
+        records = rows[list(STORE_COLUMNS)].astype(object).where(rows[list(STORE_COLUMNS)].notna(), None)
+        placeholders = ", ".join("?" for _ in STORE_COLUMNS)
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO scored_fielding ({', '.join(STORE_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                records.itertuples(index=False, name=None)
+            )
+        return len(records)
+
+    def delete_scored(self, df, season=None):
+        """Delete the stored rows for each (season, match, innings, player) in the frame"""
+        rows = self._keyed_rows(df, season)
+        keys = rows[['season', 'match_no', 'innings', 'player_name']].astype(object)
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM scored_fielding WHERE season = ? AND match_no = ? AND innings = ? "
+                "AND player_name = ?",
+                keys.itertuples(index=False, name=None)
+            )
+        return len(keys)
+    
+    def query(self, sql, params=()):
+        """Run an arbitrary read query and return the result as a DataFrame"""
+        return pd.read_sql_query(sql, self.conn, params=list(params))
+
+    def _where(self, filters):
+        clauses, params = [], []
+        for column, value in filters.items():
+            if column not in FILTER_COLUMNS:
+                raise ValueError(f"Unsupported filter column: {column}")
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                values = list(value)
+                clauses.append(f"{column} IN ({', '.join('?' for _ in values)})")
+                params.extend(str(v) if column == 'season' else v for v in values)
+            else:
+                clauses.append(f"{column} = ?")
+                params.append(str(value) if column == 'season' else value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def top_performers(self, n=3, **filters):
+        """Top n player-match rows by performance score"""
+        where, params = self._where(filters)
+        return self.query(
+            f"SELECT player_name, performance_score, player_role FROM scored_fielding {where} "
+            f"ORDER BY performance_score DESC LIMIT ?",
+            params + [n]
+        )
+
+    def player_totals(self, **filters):
+        """Per-player aggregates across every stored match matching the filters"""
+        where, params = self._where(filters)
+        return self.query(
+            f"SELECT player_name, COUNT(*) AS matches, "
+            f"AVG(performance_score) AS average_score, SUM(performance_score) AS total_score, "
+            f"SUM(runs_saved) AS total_runs_saved, SUM(catches) AS total_catches, "
+            f"SUM(dropped_catches) AS total_dropped_catches "
+            f"FROM scored_fielding {where} GROUP BY player_name ORDER BY total_score DESC",
+            params
+        )
+
+    def team_summary(self, **filters):
+        """Per-team aggregates matching the team metrics shown in the dashboard"""
+        where, params = self._where(filters)
+        return self.query(
+            f"SELECT team, COUNT(DISTINCT match_no) AS matches, COUNT(*) AS player_matches, "
+            f"AVG(performance_score) AS average_score, SUM(runs_saved) AS net_runs_saved, "
+            f"SUM(catches) AS total_catches, SUM(dropped_catches) AS total_dropped_catches "
+            f"FROM scored_fielding {where} GROUP BY team ORDER BY average_score DESC",
+            params
+        )
+
+    def close(self):
+        self.conn.close()
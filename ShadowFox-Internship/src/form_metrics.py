@@ -0,0 +1,106 @@
+# src/form_metrics.py
+from collections import deque
+import pandas as pd
+
+try:
+    from .data_loader import sort_season
+except ImportError:
+    from data_loader import sort_season
+
+
+class FormTracker:
+    """Rolling form metrics per player over a season of scored matches
+
+    ``compute_form`` scores a whole season with grouped rolling windows, and
+    ``update`` folds in one new match in O(players in the match) using the
+    state left behind, so form is never recomputed from scratch after a game.
+    """
+
+    def __init__(self, window=5, ewm_span=5, order_column='match_date'):
+        self.window = window
+        self.ewm_span = ewm_span
+        self.alpha = 2 / (ewm_span + 1)
+        self.order_column = order_column
+        self.form_columns = [f'form_avg_{window}', 'form_ewm', 'clean_streak']
+        self.state = {}
+
+    def compute_form(self, df_scored):
+        """Add rolling average, EWM form and no-drop streak columns to a season frame"""
+        df = self._sort_season(df_scored)
+        players = df['player_name']
+        scores = df['performance_score'].astype(float)
+        grouped = scores.groupby(players, sort=False)
+
+        df[f'form_avg_{self.window}'] = (
+            grouped.rolling(self.window, min_periods=1).mean().reset_index(level=0, drop=True)
+        )
+        df['form_ewm'] = grouped.ewm(span=self.ewm_span).mean().reset_index(level=0, drop=True)
+
+        # Streak resets on every match with a dropped catch
+        clean = (df['dropped_catches'] == 0).astype(int)
+        resets = (1 - clean).groupby(players, sort=False).cumsum()
+        df['clean_streak'] = clean.groupby([players, resets], sort=False).cumsum()
+
+        self._rebuild_state(df)
+        return df
+
+    def update(self, match_df):
+        """Apply one new match's scored rows to the stored state and return them with form"""
+        df = self._sort_season(match_df)
+        averages, ewms, streaks = [], [], []
+
+        for player, score, dropped in zip(df['player_name'], df['performance_score'], df['dropped_catches']):
+            state = self.state.get(player)
+            if state is None:
+                state = {'recent': deque(maxlen=self.window), 'ewm': 0.0, 'matches': 0, 'streak': 0}
+                self.state[player] = state
+
+            state['recent'].append(float(score))
+            state['ewm'] = self._next_ewm(state['ewm'], state['matches'], float(score))
+            state['matches'] += 1
+            state['streak'] = state['streak'] + 1 if dropped == 0 else 0
+
+            averages.append(sum(state['recent']) / len(state['recent']))
+            ewms.append(state['ewm'])
+            streaks.append(state['streak'])
+
+        df[f'form_avg_{self.window}'] = averages
+        df['form_ewm'] = ewms
+        df['clean_streak'] = streaks
+        return df
+
+    def current_form(self):
+        """Latest form snapshot for every tracked player"""
+        rows = [{
+            'player_name': player,
+            'matches': state['matches'],
+            f'form_avg_{self.window}': sum(state['recent']) / len(state['recent']),
+            'form_ewm': state['ewm'],
+            'clean_streak': state['streak']
+        } for player, state in self.state.items()]
+        return pd.DataFrame(rows).sort_values('form_ewm', ascending=False).reset_index(drop=True)
+
+    def _next_ewm(self, previous, n, score):
+        # Matches pandas' adjusted EWM: weights (1-a)^k normalised over the n+1 observations
+        decay = 1 - self.alpha
+        previous_weight = (1 - decay ** n) / self.alpha
+        new_weight = (1 - decay ** (n + 1)) / self.alpha
+        return (score + decay * previous * previous_weight) / new_weight
+
+    def _rebuild_state(self, df):
+        self.state = {}
+        last_rows = df.groupby('player_name', sort=False).tail(1).set_index('player_name')
+        recent = df.groupby('player_name', sort=False)['performance_score'].apply(
+            lambda s: list(s.tail(self.window).astype(float))
+        )
+        matches = df.groupby('player_name', sort=False).size()
+        for player, row in last_rows.iterrows():
+            self.state[player] = {
+                'recent': deque(recent[player], maxlen=self.window),
+                'ewm': float(row['form_ewm']),
+                'matches': int(matches[player]),
+                'streak': int(row['clean_streak'])
+            }
+
+    def _sort_season(self, df):
+        return sort_season(df, self.order_column)
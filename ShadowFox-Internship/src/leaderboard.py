@@ -0,0 +1,199 @@
+# src/leaderboard.py
+import base64
+import json
+import numpy as np
+import pandas as pd
+
+try:
+    from .analysis_tools import frame_fingerprint
+    from .player_identity import player_key
+except ImportError:
+    from analysis_tools import frame_fingerprint
+    from player_identity import player_key
+
+# Public sort keys and the scored columns they rank on
+SORT_KEYS = {
+    'score': 'performance_score',
+    'efficiency_ratio': 'efficiency_ratio',
+    'net_contribution': 'net_contribution',
+    'runs_saved': 'runs_saved'
+}
+# Columns that may be used as equality filters; each gets a posting list per sort key
+FILTER_COLUMNS = ['team', 'player_role', 'venue', 'season']
+LEADERBOARD_COLUMNS = ['player_name', 'team', 'player_role', 'venue', 'season', 'match_no',
+                       'matches_played', 'performance_score', 'efficiency_ratio', 'net_contribution',
+                       'runs_saved']
+
+
+def _encode_cursor(state):
+    return base64.urlsafe_b64encode(json.dumps(state, sort_keys=True).encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor):
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, UnicodeError):
+        raise ValueError("Malformed leaderboard cursor")
+
+
+class Leaderboard:
+    """Paged leaderboard queries over player-match rows of a scored frame
+
+    ``fit`` precomputes one descending order per sort key and, for every value
+    of every filter column, the rows holding that value in each order (a posting
+    list). A query walks the most selective posting list from the cursor
+    position and checks the remaining filters on small chunks, so a page costs
+    O(page size) for single-value filters and never sorts at request time.
+    """
+
+    def __init__(self, page_size=20):
+        self.page_size = page_size
+        self.frame = None
+        self.orders = {}
+        self.codes = {}
+        self.postings = {}
+        self.version = None
+
+    def fit(self, df_scored):
+        """Build the sort orders and posting lists (rebuild after the scored frame changes)"""
+        frame = df_scored.reset_index(drop=True)
+        players = player_key(frame)
+        if 'match_no' in frame.columns:
+            frame['matches_played'] = frame.groupby(players)['match_no'].transform('nunique')
+        else:
+            frame['matches_played'] = frame.groupby(players)['player_name'].transform('size')
+        self.frame = frame
+        self.matches_played = frame['matches_played'].to_numpy()
+
+        self.orders = {}
+        for key, column in SORT_KEYS.items():
+            if column in frame.columns:
+                values = frame[column].astype(float).fillna(-np.inf).to_numpy()
+                # Stable sort on the negated values keeps ties in input order
+                self.orders[key] = np.argsort(-values, kind='stable')
+
+        self.codes, self.postings = {}, {}
+        for column in FILTER_COLUMNS:
+            if column not in frame.columns:
+                continue
+            # Factorize the raw values so filters compare in the column's own dtype
+            codes, labels = pd.factorize(frame[column])
+            self.codes[column] = (codes, pd.Index(labels))
+            for key, order in self.orders.items():
+                ordered_codes = codes[order]
+                grouping = np.argsort(ordered_codes, kind='stable')
+                bounds = np.searchsorted(ordered_codes[grouping], np.arange(len(labels) + 1))
+                for code in range(len(labels)):
+                    self.postings[(key, column, code)] = order[grouping[bounds[code]:bounds[code + 1]]]
+        # Cursors carry a content hash, so they only resume on a board fitted to the same rows
+        self.version = frame_fingerprint(frame, LEADERBOARD_COLUMNS)
+        return self
+
+    def _lookup_codes(self, column, values):
+        """Codes of the requested filter values after coercion to the column's dtype (-1 if absent)"""
+        labels = self.codes[column][1]
+        wanted = pd.Index(list(values))
+        numeric_column = pd.api.types.is_numeric_dtype(labels.dtype)
+        if numeric_column and not pd.api.types.is_numeric_dtype(wanted.dtype):
+            wanted = pd.Index(pd.to_numeric(wanted, errors='coerce'))
+        elif not numeric_column and pd.api.types.is_numeric_dtype(wanted.dtype):
+            wanted = wanted.astype(str)
+        return labels.get_indexer(wanted)
+
+    def _filter_plan(self, sort, filters):
+        """Walk the smallest single-value posting list; the other filters become row checks"""
+        specs = []
+        for column, value in filters.items():
+            if column not in FILTER_COLUMNS:
+                raise ValueError(f"Unsupported filter column: {column}")
+            if value is None:
+                continue
+            if column not in self.codes:
+                raise ValueError(f"Scored frame has no '{column}' column to filter on")
+            values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            specs.append((column, self._lookup_codes(column, values)))
+
+        candidates, driving = self.orders[sort], None
+        for index, (column, wanted) in enumerate(specs):
+            if len(wanted) == 1:
+                posting = self.postings.get((sort, column, wanted[0]), candidates[0:0])
+                if driving is None or len(posting) < len(candidates):
+                    candidates, driving = posting, index
+
+        checks = []
+        for index, (column, wanted) in enumerate(specs):
+            # The driving posting list already satisfies its own filter
+            if index == driving:
+                continue
+            codes = self.codes[column][0]
+            wanted = wanted[wanted >= 0].astype(codes.dtype)
+            checks.append(lambda rows, codes=codes, wanted=wanted: np.isin(codes[rows], wanted))
+        return candidates, checks
+
+    def query(self, sort='score', ascending=False, min_matches=None, limit=None, cursor=None, **filters):
+        """One page of leaderboard rows plus the cursor for the next page
+
+        Filters are equality (or list membership) on team, player_role, venue and
+        season; ``min_matches`` keeps players with at least that many matches.
+        Returns a dict with the page ``rows`` (ranked within the filtered result)
+        and ``next_cursor`` (None on the last page).
+        """
+        if self.frame is None:
+            raise ValueError("Leaderboard has not been fitted")
+        if sort not in self.orders:
+            raise ValueError(f"Unknown sort key '{sort}', expected one of {list(self.orders)}")
+        limit = limit or self.page_size
+        signature = {'sort': sort, 'ascending': bool(ascending), 'min_matches': min_matches,
+                     'filters': {column: (sorted(map(str, value)) if isinstance(value, (list, tuple, set))
+                                          else None if value is None else str(value))
+                                 for column, value in sorted(filters.items())}}
+
+        position, ranked = 0, 0
+        if cursor is not None:
+            state = _decode_cursor(cursor)
+            if state.get('version') != self.version:
+                raise ValueError("Leaderboard cursor is stale; the leaderboard was rebuilt")
+            if state.get('query') != signature:
+                raise ValueError("Leaderboard cursor belongs to a different query")
+            position, ranked = state['position'], state['ranked']
+
+        candidates, checks = self._filter_plan(sort, filters)
+        if ascending:
+            candidates = candidates[::-1]
+        if min_matches is not None:
+            checks.append(lambda rows: self.matches_played[rows] >= min_matches)
+
+        selected = []
+        found, step = 0, limit
+        while found < limit and position < len(candidates):
+            chunk = candidates[position:position + step]
+            step *= 2
+            keep = np.ones(len(chunk), dtype=bool)
+            for check in checks:
+                keep &= check(chunk)
+            hits = np.flatnonzero(keep)[:limit - found]
+            selected.append(chunk[hits])
+            found += len(hits)
+            # Resume after the last returned row, or after the whole chunk if the page is still short
+            position += int(hits[-1]) + 1 if found == limit else len(chunk)
+
+        rows = np.concatenate(selected) if selected else np.zeros(0, dtype=np.intp)
+        columns = [column for column in LEADERBOARD_COLUMNS if column in self.frame.columns]
+        page = self.frame.iloc[rows][columns].reset_index(drop=True)
+        page.insert(0, 'rank', np.arange(ranked + 1, ranked + len(page) + 1))
+
+        next_cursor = None
+        if position < len(candidates) and len(page) == limit:
+            next_cursor = _encode_cursor({'version': self.version, 'query': signature,
+                                          'position': position, 'ranked': ranked + len(page)})
+        return {'rows': page, 'next_cursor': next_cursor}
+
+    def pages(self, **query):
+        """Iterate over every page of a query"""
+        cursor = None
+        while True:
+            result = self.query(cursor=cursor, **query)
+            yield result['rows']
+            cursor = result['next_cursor']
+            if cursor is None:
+                return
@@ -0,0 +1,214 @@
+# src/live_scoring.py
+import json
+import math
+import threading
+from bisect import bisect_left, insort
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import pandas as pd
+
+try:
+    from .event_ingestion import EVENT_TYPE_MAP
+    from .performance_calculator import PerformanceCalculator
+    from .analysis_tools import FieldingAnalyzer
+except ImportError:
+    from event_ingestion import EVENT_TYPE_MAP
+    from performance_calculator import PerformanceCalculator
+    from analysis_tools import FieldingAnalyzer
+
+COUNT_FIELDS = ['clean_picks', 'good_throws', 'catches', 'dropped_catches',
+                'stumpings', 'run_outs', 'missed_run_outs', 'direct_hits']
+
+
+class LiveScoreBoard:
+    """In-memory match state updated by O(1) deltas per fielding event
+
+    Produces the same score, contribution and efficiency values as
+    ``PerformanceCalculator.calculate_all_scores`` on the aggregated counts.
+    Players are kept in a sorted ranking that each event moves in place, so
+    reads never sort.
+    """
+
+    def __init__(self, weights=None, analyzer=None):
+        self.weights = PerformanceCalculator(weights).weights
+        self.analyzer = analyzer or FieldingAnalyzer()
+        self.players = {}
+        self.events_applied = 0
+        self._lock = threading.Lock()
+        # (-score, arrival, name) keys in leaderboard order; ties keep arrival order
+        self._ranking = []
+        self._rank_keys = {}
+        self._frame = None
+
+    EVENT_FIELDS = ('player_name', 'event_type', 'runs', 'team', 'player_role', 'match_no',
+                    'innings', 'venue')
+
+    def _validate(self, event):
+        """Check one event before anything is applied; returns its column, multiplier and fields"""
+        if not isinstance(event, dict):
+            raise ValueError(f"Event must be an object, got {type(event).__name__}")
+        unknown = set(event) - set(self.EVENT_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown event field(s): {', '.join(sorted(unknown))}")
+        if event.get('player_name') is None:
+            raise ValueError("Event has no player_name")
+        mapping = EVENT_TYPE_MAP.get(event.get('event_type'))
+        if mapping is None:
+            raise ValueError(f"Unknown event type: {event.get('event_type')}")
+        runs = event.get('runs', 1)
+        if isinstance(runs, bool) or not isinstance(runs, (int, float)) or not math.isfinite(runs):
+            raise ValueError(f"Event runs must be a finite number, got {runs!r}")
+        return mapping, event
+
+    def _apply(self, column, multiplier, event):
+        player_name = event['player_name']
+        player = self.players.get(player_name)
+        if player is None:
+            player = self.players[player_name] = {
+                'player_name': player_name, 'player_role': event.get('player_role'),
+                'team': event.get('team'), 'match_no': event.get('match_no'),
+                'innings': event.get('innings'), 'venue': event.get('venue'),
+                **{field: 0 for field in COUNT_FIELDS},
+                'runs_saved': 0, 'performance_score': 0, 'positive_contributions': 0,
+                'negative_contributions': 0, 'total_actions': 0
+            }
+
+        if column == 'runs_saved':
+            before = player['runs_saved']
+            after = before + multiplier * event.get('runs', 1)
+            player['runs_saved'] = after
+            player['performance_score'] += after - before
+            player['positive_contributions'] += max(after, 0) - max(before, 0)
+            player['negative_contributions'] += max(-after, 0) - max(-before, 0)
+        else:
+            weight = self.weights[column]
+            player[column] += 1
+            player['total_actions'] += 1
+            player['performance_score'] += weight
+            if weight >= 0:
+                player['positive_contributions'] += weight
+            else:
+                player['negative_contributions'] -= weight
+
+        self._rerank(player_name, player['performance_score'])
+        self.events_applied += 1
+        self._frame = None
+        return self._snapshot(player)
+
+    def _rerank(self, player_name, score):
+        """Move a player to the ranking position of their new score"""
+        key = self._rank_keys.get(player_name)
+        if key is not None:
+            del self._ranking[bisect_left(self._ranking, key)]
+        key = (-score, key[1] if key is not None else len(self._rank_keys), player_name)
+        insort(self._ranking, key)
+        self._rank_keys[player_name] = key
+
+    def apply_event(self, player_name, event_type, runs=1, team=None, player_role=None,
+                    match_no=None, innings=None, venue=None):
+        return self.apply_events([{'player_name': player_name, 'event_type': event_type, 'runs': runs,
+                                   'team': team, 'player_role': player_role, 'match_no': match_no,
+                                   'innings': innings, 'venue': venue}])[0]
+
+    def apply_events(self, events):
+        """Validate a batch of event dicts, then apply all of them under one lock (or none on error)"""
+        checked = [self._validate(event) for event in events]
+        with self._lock:
+            return [self._apply(column, multiplier, event) for (column, multiplier), event in checked]
+
+    def _snapshot(self, player):
+        positive = player['positive_contributions']
+        actions = player['total_actions']
+        return {
+            'player_name': player['player_name'],
+            'performance_score': player['performance_score'],
+            'positive_contributions': positive,
+            'negative_contributions': player['negative_contributions'],
+            'net_contribution': positive - player['negative_contributions'],
+            'efficiency_ratio': positive / actions if actions > 0 else 0
+        }
+
+    def to_frame(self):
+        """Copy of the current state as a scored frame in leaderboard order, rebuilt only after events"""
+        with self._lock:
+            if self._frame is None:
+                rows = []
+                for _, _, player_name in self._ranking:
+                    player = self.players[player_name]
+                    row = {key: value for key, value in player.items() if key != 'total_actions'}
+                    row.update(self._snapshot(player))
+                    rows.append(row)
+                self._frame = pd.DataFrame(rows)
+            return self._frame.copy()
+
+    def leaderboard(self):
+        return self.to_frame()
+
+    def top_performers(self, n=3):
+        df = self.to_frame()
+        if df.empty:
+            return df
+        return self.analyzer.identify_top_performers(df, n)
+
+
+def make_handler(board):
+    class LiveScoringHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == '/leaderboard':
+                self._send(200, board.leaderboard().to_dict('records'))
+            elif url.path == '/top':
+                try:
+                    n = int(parse_qs(url.query).get('n', ['3'])[0])
+                except ValueError:
+                    self._send(400, {'error': 'Query parameter n must be an integer'})
+                    return
+                self._send(200, board.top_performers(n).to_dict('records'))
+            elif url.path == '/health':
+                self._send(200, {'status': 'ok', 'events_applied': board.events_applied})
+            else:
+                self._send(404, {'error': f'Unknown path {url.path}'})
+
+        def do_POST(self):
+            if urlparse(self.path).path != '/events':
+                self._send(404, {'error': f'Unknown path {self.path}'})
+                return
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                payload = json.loads(self.rfile.read(length) or b'[]')
+                events = payload if isinstance(payload, list) else [payload]
+                updates = board.apply_events(events)
+            except (ValueError, TypeError) as e:
+                self._send(400, {'error': str(e)})
+                return
+            self._send(200, updates)
+
+        def _send(self, status, body):
+            data = json.dumps(body, default=str).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return LiveScoringHandler
+
+
+def create_server(host='127.0.0.1', port=8050, board=None):
+    """HTTP server exposing POST /events, GET /leaderboard, GET /top?n= and GET /health"""
+    board = board or LiveScoreBoard()
+    server = ThreadingHTTPServer((host, port), make_handler(board))
+    server.board = board
+    return server
+
+
+if __name__ == "__main__":
+    server = create_server()
+    print(f"🏏 Live fielding scores on http://{server.server_address[0]}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,178 @@
+# src/modeling.py
+import os
+import joblib
+import pandas as pd
+from scipy import stats
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.decomposition import PCA, IncrementalPCA
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.model_selection import cross_val_score
+from sklearn.preprocessing import StandardScaler
+
+try:
+    from .analysis_tools import frame_fingerprint
+except ImportError:
+    from analysis_tools import frame_fingerprint
+
+# Feature sets from notebooks/03_advanced_insights.ipynb
+CLUSTERING_FEATURES = ['clean_picks', 'good_throws', 'catches', 'direct_hits',
+                       'run_outs', 'runs_saved', 'efficiency_ratio']
+PREDICTION_FEATURES = ['clean_picks', 'good_throws', 'catches', 'dropped_catches',
+                       'stumpings', 'run_outs', 'missed_run_outs', 'direct_hits', 'runs_saved']
+
+
+class FieldingModeler:
+    """Batch versions of the PCA, clustering, random forest and t-test analyses
+
+    Feature matrices are built once per scored frame and shared by every model.
+    Frames with at least ``large_data_threshold`` rows switch to IncrementalPCA
+    and MiniBatchKMeans; the random forest trains with ``n_jobs`` workers.
+    """
+
+    def __init__(self, n_clusters=3, n_components=2, n_estimators=100, random_state=42,
+                 n_jobs=-1, large_data_threshold=10000, batch_size=1024):
+        self.n_clusters = n_clusters
+        self.n_components = n_components
+        self.n_estimators = n_estimators
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+        self.large_data_threshold = large_data_threshold
+        self.batch_size = batch_size
+
+        self.scaler = None
+        self.pca = None
+        self.kmeans = None
+        self.forest = None
+        self._features = None
+        self._features_key = None
+
+    def build_features(self, df):
+        """Feature matrices for the frame, cached on a fingerprint of the feature columns"""
+        key = frame_fingerprint(df, CLUSTERING_FEATURES + PREDICTION_FEATURES + ['performance_score'])
+        if key != self._features_key:
+            self._features = {
+                'clustering': df[CLUSTERING_FEATURES].to_numpy(dtype=float),
+                'prediction': df[PREDICTION_FEATURES].to_numpy(dtype=float),
+                'target': df['performance_score'].to_numpy(dtype=float)
+            }
+            self._features_key = key
+        return self._features
+
+    def _is_large(self, n_rows):
+        return n_rows >= self.large_data_threshold
+
+    def fit_scaler(self, df):
+        features = self.build_features(df)
+        if 'scaled' not in features:
+            self.scaler = StandardScaler().fit(features['clustering'])
+            features['scaled'] = self.scaler.transform(features['clustering'])
+        return features['scaled']
+
+    def fit_pca(self, df):
+        """Fit PCA on standardized clustering features and return the projected components"""
+        scaled = self.fit_scaler(df)
+        if self._is_large(len(scaled)):
+            self.pca = IncrementalPCA(n_components=self.n_components, batch_size=self.batch_size)
+        else:
+            self.pca = PCA(n_components=self.n_components, random_state=self.random_state)
+        components = self.pca.fit_transform(scaled)
+        return pd.DataFrame(components, columns=[f'PC{i + 1}' for i in range(self.n_components)],
+                            index=df.index)
+
+    def fit_clusters(self, df):
+        """Fit KMeans on standardized clustering features and return df with a cluster column"""
+        scaled = self.fit_scaler(df)
+        if self._is_large(len(scaled)):
+            self.kmeans = MiniBatchKMeans(n_clusters=self.n_clusters, random_state=self.random_state,
+                                          batch_size=self.batch_size, n_init=3)
+        else:
+            self.kmeans = KMeans(n_clusters=self.n_clusters, random_state=self.random_state, n_init=10)
+        df_clustered = df.copy()
+        df_clustered['cluster'] = self.kmeans.fit_predict(scaled)
+        return df_clustered
+
+    def cluster_summary(self, df_clustered):
+        """Per-cluster summary matching the notebook's groupby('cluster') table"""
+        return df_clustered.groupby('cluster').agg(
+            avg_score=('performance_score', 'mean'),
+            std_score=('performance_score', 'std'),
+            players=('performance_score', 'count'),
+            avg_efficiency=('efficiency_ratio', 'mean'),
+            avg_runs_saved=('runs_saved', 'mean'),
+            avg_positive=('positive_contributions', 'mean'),
+            common_role=('player_role', lambda roles: roles.mode().iloc[0])
+        ).reset_index()
+
+    def fit_feature_importance(self, df, cv=5):
+        """Train the random forest and return feature importances plus CV R²"""
+        features = self.build_features(df)
+        self.forest = RandomForestRegressor(n_estimators=self.n_estimators, random_state=self.random_state,
+                                            n_jobs=self.n_jobs)
+        self.forest.fit(features['prediction'], features['target'])
+
+        importance = pd.DataFrame({
+            'feature': PREDICTION_FEATURES,
+            'importance': self.forest.feature_importances_
+        }).sort_values('importance', ascending=False).reset_index(drop=True)
+
+        folds = min(cv, len(features['target']))
+        cv_scores = None
+        if folds >= 2:
+            cv_scores = cross_val_score(
+                RandomForestRegressor(n_estimators=self.n_estimators, random_state=self.random_state),
+                features['prediction'], features['target'], cv=folds, scoring='r2', n_jobs=self.n_jobs
+            )
+        return importance, cv_scores
+
+    def compare_top_bottom(self, df, n=3):
+        """Independent t-test between the top n and bottom n performance scores"""
+        top = df.nlargest(n, 'performance_score')['performance_score']
+        bottom = df.nsmallest(n, 'performance_score')['performance_score']
+        t_stat, p_value = stats.ttest_ind(top, bottom)
+        return {'t_statistic': float(t_stat), 'p_value': float(p_value),
+                'top_mean': float(top.mean()), 'bottom_mean': float(bottom.mean())}
+
+    def fit(self, df):
+        """Fit scaler, PCA, clustering and random forest on one shared feature build"""
+        self.fit_pca(df)
+        self.fit_clusters(df)
+        self.fit_feature_importance(df)
+        return self
+
+    def transform(self, df):
+        """Project a new scored frame with the fitted models (PCs and cluster labels)"""
+        if self.scaler is None or self.pca is None or self.kmeans is None:
+            raise ValueError("FieldingModeler must be fitted before transform")
+        scaled = self.scaler.transform(df[CLUSTERING_FEATURES].to_numpy(dtype=float))
+        result = df.copy()
+        components = self.pca.transform(scaled)
+        for i in range(components.shape[1]):
+            result[f'PC{i + 1}'] = components[:, i]
+        result['cluster'] = self.kmeans.predict(scaled)
+        if self.forest is not None:
+            result['predicted_score'] = self.forest.predict(df[PREDICTION_FEATURES].to_numpy(dtype=float))
+        return result
+
+    def save(self, path="results/models/fielding_models.joblib"):
+        """Persist the fitted models and configuration"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        joblib.dump({
+            'params': {'n_clusters': self.n_clusters, 'n_components': self.n_components,
+                       'n_estimators': self.n_estimators, 'random_state': self.random_state,
+                       'n_jobs': self.n_jobs, 'large_data_threshold': self.large_data_threshold,
+                       'batch_size': self.batch_size},
+            'scaler': self.scaler, 'pca': self.pca, 'kmeans': self.kmeans, 'forest': self.forest
+        }, path)
+        return path
+
+    @classmethod
+    def load(cls, path="results/models/fielding_models.joblib"):
+        saved = joblib.load(path)
+        modeler = cls(**saved['params'])
+        modeler.scaler = saved['scaler']
+        modeler.pca = saved['pca']
+        modeler.kmeans = saved['kmeans']
+        modeler.forest = saved['forest']
+        return modeler
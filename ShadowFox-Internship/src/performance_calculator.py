@@ -1,69 +1,98 @@
 # src/performance_calculator.py
+import os
 import pandas as pd
 import numpy as np
 
+try:
+    from .player_record import records_to_array
+    from .score_normalization import ScoreBaselines
+    from .scoring_formula import ScoringFormula, formula_from_weights
+except ImportError:
+    from player_record import records_to_array
+    from score_normalization import ScoreBaselines
+    from scoring_formula import ScoringFormula, formula_from_weights
+
+# Default expected-scores table (player_name, match_no, expected_score)
+EXPECTED_SCORES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'config',
+                                    'expected_scores.csv')
+
 class PerformanceCalculator:
-    def __init__(self, weights=None):
+    def __init__(self, weights=None, formula=None, registry=None):
         self.weights = weights or {
             'clean_picks': 1, 'good_throws': 1, 'catches': 3,
             'dropped_catches': -3, 'stumpings': 3, 'run_outs': 3,
             'missed_run_outs': -2, 'direct_hits': 2
         }
+        # A formula string (or ScoringFormula) replaces the weighted-count formula
+        if formula is None:
+            formula = formula_from_weights(self.weights)
+        self.formula = formula if isinstance(formula, ScoringFormula) else ScoringFormula(formula)
+        # PlayerRegistry used to match expected-score names to resolved player ids
+        self.registry = registry
+    
+    @classmethod
+    def from_settings(cls, settings_path="config/settings.yaml", **kwargs):
+        """Read weights and an optional ``formula`` from the ``analysis`` block of settings.yaml"""
+        import yaml
+        with open(settings_path) as f:
+            analysis = (yaml.safe_load(f) or {}).get('analysis', {})
+        kwargs.setdefault('weights', analysis.get('weights'))
+        kwargs.setdefault('formula', analysis.get('formula'))
+        return cls(**kwargs)
     
     def calculate_player_score(self, player_data):
         try:
-            score = (
-                player_data['clean_picks'] * self.weights['clean_picks'] +
-                player_data['good_throws'] * self.weights['good_throws'] +
-                player_data['catches'] * self.weights['catches'] +
-                player_data['dropped_catches'] * self.weights['dropped_catches'] +
-                player_data['stumpings'] * self.weights['stumpings'] +
-                player_data['run_outs'] * self.weights['run_outs'] +
-                player_data['missed_run_outs'] * self.weights['missed_run_outs'] +
-                player_data['direct_hits'] * self.weights['direct_hits'] +
-                player_data['runs_saved']
-            )
-            return score
+            return self.formula.score(player_data)
         except KeyError as e:
             print(f"❌ Missing field in player data: {e}")
             return 0
     
+    def calculate_record_scores(self, records):
+        """Score a list of PlayerRecord objects (or a structured array) in one vectorized pass"""
+        array = records if isinstance(records, np.ndarray) else records_to_array(records)
+        return self.formula.score(array)
+    
     def calculate_all_scores(self, df):
         df_scored = df.copy()
-        df_scored['performance_score'] = df_scored.apply(
-            self.calculate_player_score, axis=1
-        )
+        df_scored['performance_score'] = self._score_columns(df_scored)
         df_scored = self._calculate_additional_metrics(df_scored)
         return df_scored
     
+    def calculate_normalized_scores(self, df, baselines=None):
+        """Score a frame and add z-score / percentile columns against role x venue baselines
+        
+        ``baselines`` is a fitted ScoreBaselines table; without one the baselines
+        are built from the frame itself.
+        """
+        df_scored = df if 'performance_score' in df.columns else self.calculate_all_scores(df)
+        if baselines is None:
+            baselines = ScoreBaselines().fit(df_scored)
+        return baselines.normalize(df_scored)
+    
+    def _require_columns(self, df):
+        """Frame-level scoring needs every formula column; a missing one is an input error"""
+        missing = [field for field in self.formula.columns if field not in df.columns]
+        if missing:
+            raise ValueError(f"Missing field(s) in player data: {', '.join(missing)}")
+    
+    def _score_columns(self, df):
+        """Column-wise version of calculate_player_score"""
+        self._require_columns(df)
+        return self.formula.score(df)
+    
     def _calculate_additional_metrics(self, df):
+        self._require_columns(df)
         df_metrics = df.copy()
-        df_metrics['positive_contributions'] = (
-            df_metrics['clean_picks'] * self.weights['clean_picks'] +
-            df_metrics['good_throws'] * self.weights['good_throws'] +
-            df_metrics['catches'] * self.weights['catches'] +
-            df_metrics['stumpings'] * self.weights['stumpings'] +
-            df_metrics['run_outs'] * self.weights['run_outs'] +
-            df_metrics['direct_hits'] * self.weights['direct_hits'] +
-            df_metrics['runs_saved'].clip(lower=0)
-        )
-        
-        df_metrics['negative_contributions'] = (
-            abs(df_metrics['dropped_catches'] * self.weights['dropped_catches']) +
-            abs(df_metrics['missed_run_outs'] * self.weights['missed_run_outs']) +
-            abs(df_metrics['runs_saved'].clip(upper=0))
-        )
+        # Each additive term of the formula counts as positive or negative by its sign per row
+        _, positive, negative = self.formula.contributions(df_metrics)
+        df_metrics['positive_contributions'] = positive
+        df_metrics['negative_contributions'] = negative
         
         df_metrics['net_contribution'] = (
             df_metrics['positive_contributions'] - df_metrics['negative_contributions']
         )
         
-        total_actions = (
-            df_metrics['clean_picks'] + df_metrics['good_throws'] + 
-            df_metrics['catches'] + df_metrics['dropped_catches'] +
-            df_metrics['stumpings'] + df_metrics['run_outs'] +
-            df_metrics['missed_run_outs'] + df_metrics['direct_hits']
-        )
+        total_actions = df_metrics[self.formula.action_columns].sum(axis=1)
         
         df_metrics['efficiency_ratio'] = np.where(
             total_actions > 0,
@@ -73,33 +102,68 @@ class PerformanceCalculator:
         
         return df_metrics
     
-    def validate_calculations(self, df, expected_scores=None):
-        if expected_scores is None:
-            expected_scores = {
-                'Rilee Russouw': 10, 'Phil Salt': 2, 'Yash Dhull': 11,
-                'Axar Patel': 11, 'Lalit Yadav': 6, 'Aman Khan': 9, 'Kuldeep Yadav': 9
-            }
+    def validate_calculations(self, df, expected_scores=None, tolerance=0.1):
+        """Compare calculated scores with an expected-scores table in one keyed join
+        
+        ``expected_scores`` may be a {player_name: score} dict, a DataFrame or a CSV
+        path with ``player_name``, ``expected_score`` and optionally ``match_no``
+        columns; it defaults to config/expected_scores.csv. A player with several
+        different expected scores for the join keys (e.g. one per match when the
+        scored frame has no ``match_no``) raises ValueError.
+        """
+        expected = load_expected_scores(EXPECTED_SCORES_PATH if expected_scores is None else expected_scores)
+        if self.registry is not None and 'player_id' in df.columns:
+            # Join on interned ids so expected scores keyed by any known name variant match
+            ids = expected['player_name'].map(self.registry.identify)
+            expected = expected[ids.notna()].assign(player_id=ids[ids.notna()].astype(df['player_id'].dtype))
+            expected = expected.drop(columns='player_name')
+        player_column = 'player_id' if 'player_id' in expected.columns else 'player_name'
+        keys = [key for key in [player_column, 'match_no'] if key in expected.columns and key in df.columns]
+        labels = ['player_name'] if player_column != 'player_name' else []
+        
+        expected = expected[keys + ['expected_score']].drop_duplicates()
+        conflicting = expected[expected.duplicated(keys, keep=False)]
+        if len(conflicting):
+            raise ValueError(f"Conflicting expected scores for {keys}: "
+                             f"{conflicting.drop_duplicates(keys)[keys].to_dict('records')}; "
+                             f"include match_no in the scored frame or deduplicate the table")
+        
+        validation = df[labels + keys + ['performance_score']].merge(
+            expected, on=keys, how='left'
+        ).rename(columns={'performance_score': 'calculated_score'})
         
-        validation_results = []
-        for _, player in df.iterrows():
-            player_name = player['player_name']
-            calculated_score = player['performance_score']
-            expected_score = expected_scores.get(player_name)
-            
-            if expected_score is not None:
-                is_correct = abs(calculated_score - expected_score) < 0.1
-                status = '✅ PASS' if is_correct else '❌ FAIL'
-                difference = calculated_score - expected_score
-            else:
-                status = '⚠️ NO EXPECTED VALUE'
-                difference = None
-            
-            validation_results.append({
-                'player_name': player_name,
-                'expected_score': expected_score,
-                'calculated_score': calculated_score,
-                'status': status,
-                'difference': difference
-            })
+        validation['difference'] = validation['calculated_score'] - validation['expected_score']
+        has_expected = validation['expected_score'].notna()
+        is_correct = validation['difference'].abs() < tolerance
+        validation['status'] = np.select(
+            [has_expected & is_correct, has_expected],
+            ['✅ PASS', '❌ FAIL'],
+            default='⚠️ NO EXPECTED VALUE'
+        )
         
-        return pd.DataFrame(validation_results)
\ No newline at end of file
+        return validation[labels + keys + ['expected_score', 'calculated_score', 'status', 'difference']]
+    
+    def summarize_validation(self, validation_df):
+        """Summary statistics for a validate_calculations result"""
+        differences = validation_df['difference'].abs()
+        checked = int(validation_df['expected_score'].notna().sum())
+        passed = int((validation_df['status'] == '✅ PASS').sum())
+        return {
+            'rows': len(validation_df),
+            'checked': checked,
+            'passed': passed,
+            'failed': checked - passed,
+            'missing_expected': len(validation_df) - checked,
+            'pass_rate': passed / checked if checked else 0.0,
+            'mean_abs_difference': float(differences.mean()) if checked else 0.0,
+            'max_abs_difference': float(differences.max()) if checked else 0.0
+        }
+
+
+def load_expected_scores(source):
+    """Normalize an expected-scores dict, DataFrame or CSV path into a table"""
+    if isinstance(source, dict):
+        return pd.DataFrame({'player_name': list(source), 'expected_score': list(source.values())})
+    if isinstance(source, pd.DataFrame):
+        return source
+    return pd.read_csv(source)
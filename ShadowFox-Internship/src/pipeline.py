@@ -0,0 +1,191 @@
+# src/pipeline.py
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import partial
+
+EXECUTOR_KINDS = ('inline', 'thread', 'serial', 'process')
+
+
+class PipelineStage:
+    """One node of the pipeline graph
+
+    ``func`` is called with the results of ``depends_on`` in order; stages with no
+    dependencies receive the run's source (a file path, match id, or None).
+    ``executor`` is 'thread' for I/O and for work that holds shared state,
+    'process' for CPU-bound pure functions (func and its arguments are pickled,
+    so nothing they change comes back), 'serial' for work that is not
+    thread-safe such as pyplot rendering (one dedicated thread) or 'inline' for
+    trivial glue.
+    """
+
+    def __init__(self, name, func, depends_on=(), executor='thread'):
+        if executor not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTOR_KINDS}")
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.executor = executor
+
+
+class PipelineOrchestrator:
+    """Runs pipeline stages as a dependency graph on asyncio
+
+    Independent stages run concurrently, I/O on a thread pool and CPU-bound
+    stages on a process pool. ``run_batch`` feeds many sources through a bounded
+    queue so one match can be saving while the next is loading. Every call gets
+    its own executors, so concurrent runs do not share or shut down each other's.
+    """
+
+    def __init__(self, max_workers=None, queue_size=2):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.stages = {}
+
+    def add_stage(self, name, func, depends_on=(), executor='thread'):
+        missing = [dep for dep in depends_on if dep not in self.stages]
+        if missing:
+            raise ValueError(f"Stage '{name}' depends on unknown stage(s): {missing}")
+        self.stages[name] = PipelineStage(name, func, depends_on, executor)
+        return self
+
+    def run(self, source=None):
+        """Run the graph once and return a dict of stage results"""
+        return asyncio.run(self._run_with_executors(self._run_graph, source))
+
+    def run_batch(self, sources, concurrency=None, return_exceptions=False):
+        """Run the graph for every source, overlapping stages across sources
+
+        Results are returned in the same order as ``sources``. With
+        ``return_exceptions`` a failing source yields its exception in place of
+        a result instead of aborting the whole batch.
+        """
+        return asyncio.run(self._run_with_executors(self._run_batch, list(sources),
+                                                    concurrency or self.max_workers, return_exceptions))
+
+    async def _run_with_executors(self, coro_func, *args):
+        # Only the pools some stage uses are started
+        kinds = {stage.executor for stage in self.stages.values()}
+        factories = {
+            'thread': lambda: ThreadPoolExecutor(max_workers=self.max_workers),
+            'serial': lambda: ThreadPoolExecutor(max_workers=1),
+            'process': lambda: ProcessPoolExecutor(max_workers=self.max_workers)
+        }
+        executors = {kind: factory() for kind, factory in factories.items() if kind in kinds}
+        try:
+            return await coro_func(executors, *args)
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True)
+
+    async def _run_graph(self, executors, source):
+        tasks = {}
+        for name, stage in self.stages.items():
+            # Stages are added after their dependencies, so every dep task exists
+            deps = [tasks[dep] for dep in stage.depends_on]
+            tasks[name] = asyncio.ensure_future(self._run_stage(executors, stage, deps, source))
+        try:
+            await asyncio.gather(*tasks.values())
+        except Exception:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        return {name: task.result() for name, task in tasks.items()}
+
+    async def _run_stage(self, executors, stage, dep_tasks, source):
+        args = [await task for task in dep_tasks] if dep_tasks else [source]
+        if stage.executor == 'inline':
+            return stage.func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executors[stage.executor], partial(stage.func, *args))
+
+    async def _run_batch(self, executors, sources, concurrency, return_exceptions):
+        # Bounded queue applies backpressure: sources are only admitted as workers free up
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        results = [None] * len(sources)
+
+        async def producer():
+            for index, source in enumerate(sources):
+                await queue.put((index, source))
+            for _ in range(concurrency):
+                await queue.put(None)
+
+        async def worker():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                index, source = item
+                try:
+                    results[index] = await self._run_graph(executors, source)
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results[index] = e
+
+        await asyncio.gather(producer(), *[worker() for _ in range(concurrency)])
+        return results
+
+
+def _load_stage(loader, source):
+    # A named source must exist; substituting sample data would save it under another match's name
+    return loader.create_sample_dataset() if source is None else loader.load_from_csv(source, fallback=False)
+
+
+def _render_charts(visualizer, df_scored):
+    """Save each chart under a match prefix and close it, returning {chart: path}"""
+    import matplotlib.pyplot as plt
+    match_no = df_scored['match_no'].iloc[0] if len(df_scored) else 'empty'
+    charts = {
+        'performance_scores': (visualizer.plot_performance_scores, 'performance_scores'),
+        'contributions': (visualizer.plot_positive_negative_contributions, 'contributions_analysis'),
+        'runs_saved': (visualizer.plot_runs_saved_analysis, 'runs_saved_analysis'),
+        'correlation': (visualizer.create_correlation_heatmap, 'correlation_heatmap')
+    }
+    paths = {}
+    for chart, (plot, name) in charts.items():
+        fig = plot(df_scored, prefix=match_no)
+        # Figures are closed once saved so a long batch does not accumulate them
+        plt.close(fig)
+        paths[chart] = visualizer._chart_path(name, match_no)
+    return paths
+
+
+def _analysis_stage(analyzer, df_scored):
+    return {
+        'top_performers': analyzer.identify_top_performers(df_scored),
+        'insights': analyzer.generate_performance_insights(df_scored),
+        'correlations': analyzer.calculate_correlations(df_scored)
+    }
+
+
+def _save_stage(writer, df_scored, recommendations):
+    match_no = df_scored['match_no'].iloc[0] if len(df_scored) else 'empty'
+    paths = [f"data/outputs/{match_no}_fielding_analysis_results.csv",
+             f"data/outputs/{match_no}_strategic_recommendations.csv"]
+    writer.write_frame(df_scored, paths[0])
+    writer.write_frame(recommendations, paths[1])
+    return paths
+
+
+def build_analysis_pipeline(loader, calculator, visualizer, analyzer, writer, max_workers=None):
+    """Standard load → validate → clean → score → (charts | analysis | recommendations) → save graph
+    
+    Writes go through ``writer`` in the background; close it after the run.
+    """
+    pipeline = PipelineOrchestrator(max_workers=max_workers)
+    pipeline.add_stage('raw', partial(_load_stage, loader), executor='thread')
+    pipeline.add_stage('validation', loader.validate_data, ['raw'], executor='thread')
+    # Cleaning resolves names through loader.registry, which must stay in this process (a worker
+    # would mutate a pickled copy) and is not thread-safe, so matches resolve one at a time
+    pipeline.add_stage('clean', loader.clean_fielding_data, ['raw'], executor='serial')
+    # Scoring and analysis run on threads: the calculator's compiled formula and the analyzer's
+    # memo cache and store connection live in this process and would be lost or fail to pickle
+    pipeline.add_stage('scored', calculator.calculate_all_scores, ['clean'], executor='thread')
+    pipeline.add_stage('charts', partial(_render_charts, visualizer), ['scored'], executor='serial')
+    pipeline.add_stage('analysis', partial(_analysis_stage, analyzer), ['scored'], executor='thread')
+    pipeline.add_stage('recommendations', analyzer.generate_strategic_recommendations, ['scored'],
+                       executor='thread')
+    pipeline.add_stage('saved', partial(_save_stage, writer), ['scored', 'recommendations'],
+                       executor='thread')
+    return pipeline
@@ -0,0 +1,223 @@
+# src/player_identity.py
+import difflib
+import os
+import re
+import numpy as np
+import pandas as pd
+
+from config.constants import PLAYER_ALIASES, PLAYER_ROLES
+
+ID_DTYPE = np.int32
+
+
+def normalize_name(name):
+    """Lookup key for a feed name: case-folded, dots dropped, whitespace collapsed"""
+    return re.sub(r'\s+', ' ', str(name).replace('.', ' ')).strip().casefold()
+
+
+def player_key(df):
+    """Integer player_id when the frame has been resolved, otherwise the player name"""
+    return df['player_id'] if 'player_id' in df.columns else df['player_name']
+
+
+def names_for_ids(df, ids):
+    """Player names for an array of ids using a dense id -> name table scattered from the frame"""
+    frame_ids = df['player_id'].to_numpy()
+    known = frame_ids >= 0
+    table = np.full(int(frame_ids.max()) + 1 if known.any() else 0, None, dtype=object)
+    table[frame_ids[known]] = df['player_name'].to_numpy()[known]
+    ids = np.asarray(ids)
+    return np.where(ids >= 0, table[ids.clip(min=0)] if len(table) else None, None)
+
+
+# find() methods that merge a variant into a known player
+MATCH_METHODS = ('alias', 'initials', 'fuzzy')
+
+
+class PlayerRegistry:
+    """Alias table and interned integer ids for players across feeds
+
+    A feed name resolves, in order, through the alias table, the initials
+    heuristic ("R Russouw" -> "Rilee Russouw") and a first-name fuzzy match
+    ("Kuldip Yadav" -> "Kuldeep Yadav"). Both heuristics need the exact surname
+    of a single known player; initials are merged only when the feed role agrees
+    with the known role, and a fuzzy first name must share its initial and reach
+    ``cutoff`` similarity. Successful matches are added to the alias table, so
+    each variant is matched once and looked up by dict afterwards.
+
+    Anything else is registered as a new player. When a known player was a
+    plausible but unconfirmed match (a bare initial, a shared surname or a close
+    whole-name spelling) the new name is added to ``review_queue`` with that
+    candidate instead of being merged.
+    """
+
+    def __init__(self, aliases=None, roles=None, cutoff=0.75, review_cutoff=0.85):
+        self.cutoff = cutoff
+        self.review_cutoff = review_cutoff
+        self.names = []
+        self.roles = {}
+        self._ids = {}
+        self.aliases = {}
+        self.resolutions = []
+        self.review_queue = []
+        for name, role in (PLAYER_ROLES if roles is None else roles).items():
+            self.register(name, role)
+        for alias, name in (PLAYER_ALIASES if aliases is None else aliases).items():
+            self.add_alias(alias, name)
+
+    def __len__(self):
+        return len(self.names)
+
+    def register(self, name, role=None):
+        """Intern a canonical name and return its id"""
+        key = normalize_name(name)
+        if key in self.aliases:
+            player_id = self.aliases[key]
+        else:
+            player_id = len(self.names)
+            self.names.append(str(name).strip())
+            self._ids[key] = player_id
+            self.aliases[key] = player_id
+        if role is not None and not pd.isna(role):
+            self.roles.setdefault(player_id, role)
+        return player_id
+
+    def add_alias(self, alias, name):
+        """Map a name variant to a canonical player (registered if new)"""
+        player_id = self.register(name)
+        self.aliases[normalize_name(alias)] = player_id
+        return player_id
+
+    def lookup(self, name):
+        """Id of an already known name or alias, or None"""
+        return self.aliases.get(normalize_name(name))
+
+    def _same_surname(self, tokens):
+        """(name tokens, id) of every known player whose surname equals the variant's"""
+        return [(canonical.split(' '), player_id) for canonical, player_id in self._ids.items()
+                if len(tokens) > 1 and canonical.split(' ')[-1] == tokens[-1]]
+
+    def _by_initials(self, tokens):
+        if len(tokens) < 2 or not all(len(token) == 1 for token in tokens[:-1]):
+            return None
+        matches = {player_id for parts, player_id in self._same_surname(tokens)
+                   if len(parts) >= len(tokens)
+                   and all(part[0] == initial for part, initial in zip(parts, tokens[:-1]))}
+        return matches.pop() if len(matches) == 1 else None
+
+    def _by_first_name(self, tokens):
+        if len(tokens) < 2 or len(tokens[0]) == 1:
+            return None
+        scored = sorted(((difflib.SequenceMatcher(None, tokens[0], parts[0]).ratio(), player_id)
+                         for parts, player_id in self._same_surname(tokens) if parts[0][0] == tokens[0][0]),
+                        reverse=True)
+        scored = [(ratio, player_id) for ratio, player_id in scored if ratio >= self.cutoff]
+        # Two near-equal candidates are ambiguous; keep the variant as its own player
+        if not scored or (len(scored) > 1 and scored[0][0] - scored[1][0] < 0.05):
+            return None
+        return scored[0][1]
+
+    def _suspect(self, key, tokens):
+        """A known player worth a human look: a close whole-name spelling or a shared surname"""
+        close = difflib.get_close_matches(key, list(self._ids), n=1, cutoff=self.review_cutoff)
+        if close:
+            return self._ids[close[0]]
+        same_surname = self._same_surname(tokens)
+        return same_surname[0][1] if same_surname else None
+
+    def find(self, name, role=None):
+        """(player_id, method) for a name without changing the registry
+
+        ``method`` is one of MATCH_METHODS for a match, 'review' when ``player_id``
+        is only a plausible candidate, or None (with no id) when nothing is close.
+        """
+        key = normalize_name(name)
+        if key in self.aliases:
+            return self.aliases[key], 'alias'
+        tokens = key.split(' ')
+        player_id = self._by_initials(tokens)
+        if player_id is not None:
+            # An initial alone fits many players; merge only when the roles corroborate it
+            known_role = self.roles.get(player_id)
+            if role is not None and not pd.isna(role) and role == known_role:
+                return player_id, 'initials'
+            return player_id, 'review'
+        player_id = self._by_first_name(tokens)
+        if player_id is not None:
+            return player_id, 'fuzzy'
+        player_id = self._suspect(key, tokens)
+        return (player_id, 'review') if player_id is not None else (None, None)
+
+    def identify(self, name, role=None):
+        """Id of the known player a name matches, or None; nothing is cached or registered"""
+        player_id, method = self.find(name, role)
+        return player_id if method in MATCH_METHODS else None
+
+    def match(self, name, role=None):
+        """Id of a known player for a name or variant, or None; matched variants are cached as aliases"""
+        player_id, method = self.find(name, role)
+        return self._accept(name, player_id, method)
+
+    def _accept(self, name, player_id, method):
+        if method not in MATCH_METHODS:
+            return None
+        if method != 'alias':
+            self.aliases[normalize_name(name)] = player_id
+            self.resolutions.append({'name': str(name), 'player_name': self.names[player_id],
+                                     'method': method})
+        return player_id
+
+    def resolve_name(self, name, role=None):
+        """Canonical id for a feed name, matching variants or registering a new player"""
+        candidate, method = self.find(name, role)
+        player_id = self._accept(name, candidate, method)
+        if player_id is not None:
+            return player_id
+        player_id = self.register(name, role)
+        if method == 'review':
+            self.review_queue.append({'name': str(name), 'player_id': player_id,
+                                      'candidate': self.names[candidate], 'candidate_id': candidate})
+        return player_id
+
+    def resolve(self, df):
+        """Canonical player_name, int32 player_id and missing roles filled, resolving each distinct name once"""
+        df = df.copy()
+        codes, uniques = pd.factorize(df['player_name'])
+        roles = (df['player_role'].groupby(codes).first() if 'player_role' in df.columns
+                 else pd.Series(dtype=object))
+        ids = np.array([self.resolve_name(name, roles.get(code)) for code, name in enumerate(uniques)],
+                       dtype=ID_DTYPE)
+        row_ids = np.where(codes >= 0, ids[codes.clip(min=0)] if len(ids) else -1, -1).astype(ID_DTYPE)
+
+        known = np.array(self.names, dtype=object)
+        df['player_name'] = np.where(row_ids >= 0, known[row_ids.clip(min=0)] if len(known) else None,
+                                     df['player_name'].to_numpy())
+        df['player_id'] = row_ids
+        if 'player_role' in df.columns:
+            registered = pd.Series(row_ids).map(self.roles).to_numpy()
+            df['player_role'] = df['player_role'].where(df['player_role'].notna(), registered)
+        return df
+
+    def save(self, path="data/processed/player_registry.csv"):
+        """Write every alias with its player id, canonical name and role"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        table = pd.DataFrame({'alias': list(self.aliases), 'player_id': list(self.aliases.values())})
+        table['player_name'] = [self.names[player_id] for player_id in table['player_id']]
+        table['player_role'] = table['player_id'].map(self.roles)
+        table.sort_values(['player_id', 'alias'], kind='mergesort').to_csv(path, index=False)
+        return path
+
+    @classmethod
+    def load(cls, path="data/processed/player_registry.csv", **kwargs):
+        """Rebuild a registry with the same ids from a saved alias table"""
+        registry = cls(aliases={}, roles={}, **kwargs)
+        table = pd.read_csv(path)
+        players = table.drop_duplicates('player_id').sort_values('player_id')
+        for player_id, name, role in zip(players['player_id'], players['player_name'], players['player_role']):
+            if registry.register(name, role) != player_id:
+                raise ValueError(f"Player ids in {path} are not contiguous")
+        for alias, player_id in zip(table['alias'], table['player_id']):
+            registry.aliases[alias] = int(player_id)
+        return registry
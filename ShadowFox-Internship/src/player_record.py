@@ -0,0 +1,76 @@
+# src/player_record.py
+import numpy as np
+
+COUNT_FIELDS = ['clean_picks', 'good_throws', 'catches', 'dropped_catches',
+                'stumpings', 'run_outs', 'missed_run_outs', 'direct_hits']
+RECORD_FIELDS = COUNT_FIELDS + ['runs_saved']
+
+RECORD_DTYPE = np.dtype([('player_name', 'U64')] + [(field, 'i4') for field in RECORD_FIELDS])
+
+
+class PlayerRecord:
+    """Compact per-player fielding counts for per-player and live API paths
+
+    Supports item access (``record['catches']``) so it can be passed anywhere a
+    dict or pandas row is accepted, e.g. ``PerformanceCalculator.calculate_player_score``.
+    """
+
+    __slots__ = ('player_name',) + tuple(RECORD_FIELDS)
+
+    def __init__(self, player_name='', clean_picks=0, good_throws=0, catches=0,
+                 dropped_catches=0, stumpings=0, run_outs=0, missed_run_outs=0,
+                 direct_hits=0, runs_saved=0):
+        self.player_name = player_name
+        self.clean_picks = clean_picks
+        self.good_throws = good_throws
+        self.catches = catches
+        self.dropped_catches = dropped_catches
+        self.stumpings = stumpings
+        self.run_outs = run_outs
+        self.missed_run_outs = missed_run_outs
+        self.direct_hits = direct_hits
+        self.runs_saved = runs_saved
+
+    @classmethod
+    def from_mapping(cls, data):
+        """Build a record from a dict or pandas row, ignoring extra keys"""
+        return cls(data.get('player_name', ''), *(int(data.get(field, 0)) for field in RECORD_FIELDS))
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def to_tuple(self):
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __eq__(self, other):
+        return isinstance(other, PlayerRecord) and self.to_tuple() == other.to_tuple()
+
+    def __repr__(self):
+        counts = ', '.join(f"{field}={getattr(self, field)}" for field in RECORD_FIELDS)
+        return f"PlayerRecord({self.player_name!r}, {counts})"
+
+
+def records_to_array(records):
+    """Pack records into a NumPy structured array with RECORD_DTYPE"""
+    return np.array([record.to_tuple() for record in records], dtype=RECORD_DTYPE)
+
+
+def array_to_records(array):
+    """Unpack a structured array back into PlayerRecord objects"""
+    return [PlayerRecord(str(row['player_name']), *(int(row[field]) for field in RECORD_FIELDS))
+            for row in array]
+
+
+def frame_to_array(df):
+    """Convert a fielding DataFrame to a structured array without per-row Series"""
+    array = np.zeros(len(df), dtype=RECORD_DTYPE)
+    array['player_name'] = df['player_name'].astype(str).to_numpy() if 'player_name' in df.columns else ''
+    for field in RECORD_FIELDS:
+        array[field] = df[field].to_numpy()
+    return array
@@ -0,0 +1,200 @@
+# src/prediction.py
+import os
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.metrics import mean_absolute_error, mean_squared_error
+
+try:
+    from .data_loader import sort_season
+except ImportError:
+    from data_loader import sort_season
+
+HISTORY_FEATURES = ['prior_matches', 'prior_avg', 'prior_recent_avg', 'last_score', 'prior_venue_avg']
+
+
+class FieldingPredictor:
+    """Predicts a player's next-match fielding score from history, role and venue
+
+    Every training row only sees the player's earlier matches, so the model is
+    evaluated on a time-ordered split. Missing history (debuts, new venues) is
+    left as NaN, which the gradient-boosted trees handle natively.
+    """
+
+    def __init__(self, window=5, order_column='match_date', test_fraction=0.2,
+                 max_iter=200, random_state=42):
+        self.window = window
+        self.order_column = order_column
+        self.test_fraction = test_fraction
+        self.max_iter = max_iter
+        self.random_state = random_state
+
+        self.model = None
+        self.roles = []
+        self.venues = []
+        self.metrics = {}
+        self.players = {}
+        self.history = None
+        self.venue_history = None
+        self.player_roles = None
+
+    def _sort_season(self, df):
+        return sort_season(df, self.order_column)
+
+    def _match_order(self, df):
+        """Match ids numbered in the order played (``df`` must already be season-sorted)"""
+        columns = [column for column in ['season', 'match_no'] if column in df.columns] or [self.order_column]
+        keys = df.groupby(columns, sort=False, dropna=False).ngroup()
+        return np.arange(keys.max() + 1 if len(keys) else 0), keys
+
+    def build_features(self, df_scored):
+        """History features for every scored row, using only the player's earlier matches"""
+        df = self._sort_season(df_scored)
+        scores = df['performance_score'].astype(float)
+        players = df['player_name']
+        grouped = scores.groupby(players, sort=False)
+
+        prior_matches = grouped.cumcount()
+        features = pd.DataFrame({'prior_matches': prior_matches.astype(float)}, index=df.index)
+        features['prior_avg'] = (grouped.cumsum() - scores) / prior_matches.replace(0, np.nan)
+
+        previous = grouped.shift(1)
+        features['prior_recent_avg'] = (
+            previous.groupby(players, sort=False).rolling(self.window, min_periods=1).mean()
+            .reset_index(level=0, drop=True)
+        )
+        features['last_score'] = previous
+
+        by_venue = scores.groupby([players, df['venue']], sort=False)
+        features['prior_venue_avg'] = (by_venue.cumsum() - scores) / by_venue.cumcount().replace(0, np.nan)
+        return df, features
+
+    def _encode(self, history, roles, venues, venue_avg):
+        """Design matrix from history rows plus role and venue one-hot columns"""
+        role_codes = (np.asarray(roles, dtype=object)[:, None] == np.array(self.roles, dtype=object)).astype(float)
+        venue_codes = (np.asarray(venues, dtype=object)[:, None] == np.array(self.venues, dtype=object)).astype(float)
+        return np.hstack([history, np.asarray(venue_avg, dtype=float)[:, None], role_codes, venue_codes])
+
+    def _design_matrix(self, df, features):
+        history = features[HISTORY_FEATURES[:-1]].to_numpy(dtype=float)
+        return self._encode(history, df['player_role'], df['venue'], features['prior_venue_avg'])
+
+    def time_split(self, df_scored):
+        """Split a season into earlier (train) and later (test) matches"""
+        df = self._sort_season(df_scored)
+        matches, keys = self._match_order(df)
+        n_test = max(1, int(round(len(matches) * self.test_fraction))) if len(matches) > 1 else 0
+        test_matches = set(matches[len(matches) - n_test:])
+        is_test = keys.isin(test_matches).to_numpy()
+        return df[~is_test], df[is_test]
+
+    def _new_model(self):
+        return HistGradientBoostingRegressor(max_iter=self.max_iter, random_state=self.random_state)
+
+    def fit(self, df_scored, refit=True):
+        """Train on earlier matches, evaluate on later ones, then refit on the full season"""
+        df, features = self.build_features(df_scored)
+        self.roles = sorted(df['player_role'].dropna().unique())
+        self.venues = sorted(df['venue'].dropna().unique())
+        X = self._design_matrix(df, features)
+        y = df['performance_score'].to_numpy(dtype=float)
+
+        train, test = self.time_split(df)
+        is_test = df.index.isin(test.index)
+        self.model = self._new_model().fit(X[~is_test], y[~is_test])
+        self.metrics = {'train_rows': int((~is_test).sum()), 'test_rows': int(is_test.sum())}
+        if is_test.any():
+            predicted = self.model.predict(X[is_test])
+            baseline = features.loc[is_test, 'prior_avg'].fillna(y[~is_test].mean()).to_numpy()
+            self.metrics.update({
+                'mae': mean_absolute_error(y[is_test], predicted),
+                'rmse': float(np.sqrt(mean_squared_error(y[is_test], predicted))),
+                'baseline_mae': mean_absolute_error(y[is_test], baseline)
+            })
+
+        if refit:
+            self.model = self._new_model().fit(X, y)
+        self._store_history(df)
+        return self
+
+    def _store_history(self, df):
+        """Latest per-player state used to build features for upcoming fixtures"""
+        scores = df['performance_score'].astype(float)
+        grouped = scores.groupby(df['player_name'], sort=False)
+        history = pd.DataFrame({
+            'prior_matches': grouped.size().astype(float),
+            'prior_avg': grouped.mean(),
+            'prior_recent_avg': grouped.apply(lambda s: s.tail(self.window).mean()),
+            'last_score': grouped.last()
+        })
+        self.players = {player: i for i, player in enumerate(history.index)}
+        self.history = history[HISTORY_FEATURES[:-1]].to_numpy(dtype=float)
+        self.player_roles = df.groupby('player_name', sort=False)['player_role'].last().reindex(history.index).to_numpy()
+        self.venue_history = (
+            scores.groupby([df['player_name'], df['venue']]).mean().unstack()
+            .reindex(index=history.index, columns=self.venues).to_numpy(dtype=float)
+        )
+
+    def predict_batch(self, squad, fixtures):
+        """Predicted score for every player in the squad at every fixture, in one model call
+
+        ``squad`` is a list of player names or a frame with player_name (and
+        optionally player_role); ``fixtures`` is a frame with a venue column.
+        Returns one row per (player, fixture) with the fixture's columns attached.
+        """
+        if self.model is None:
+            raise ValueError("FieldingPredictor must be fitted before predict_batch")
+        if not isinstance(squad, pd.DataFrame):
+            squad = pd.DataFrame({'player_name': list(squad)})
+        fixtures = fixtures.reset_index(drop=True)
+        n_players, n_fixtures = len(squad), len(fixtures)
+
+        positions = squad['player_name'].map(self.players).to_numpy(dtype=float)
+        known = ~np.isnan(positions)
+        rows = positions[known].astype(int)
+
+        history = np.full((n_players, len(HISTORY_FEATURES) - 1), np.nan)
+        history[:, 0] = 0
+        history[known] = self.history[rows]
+        roles = np.full(n_players, None, dtype=object)
+        roles[known] = self.player_roles[rows]
+        if 'player_role' in squad.columns:
+            roles = np.where(squad['player_role'].notna(), squad['player_role'], roles)
+
+        venue_columns = pd.Index(self.venues).get_indexer(fixtures['venue'])
+        venue_avg = np.full((n_players, n_fixtures), np.nan)
+        seen = venue_columns >= 0
+        venue_avg[np.ix_(known, seen)] = self.venue_history[np.ix_(rows, venue_columns[seen])]
+
+        X = self._encode(np.repeat(history, n_fixtures, axis=0), np.repeat(roles, n_fixtures),
+                         np.tile(fixtures['venue'].to_numpy(dtype=object), n_players), venue_avg.ravel())
+        predictions = self.model.predict(X)
+
+        result = fixtures.loc[np.tile(np.arange(n_fixtures), n_players)].reset_index(drop=True)
+        result.insert(0, 'player_name', np.repeat(squad['player_name'].to_numpy(), n_fixtures))
+        result['predicted_score'] = predictions
+        return result
+
+    def save(self, path="results/models/fielding_predictor.joblib"):
+        """Persist the trained model, encodings and player history"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        joblib.dump({
+            'params': {'window': self.window, 'order_column': self.order_column,
+                       'test_fraction': self.test_fraction, 'max_iter': self.max_iter,
+                       'random_state': self.random_state},
+            'model': self.model, 'roles': self.roles, 'venues': self.venues, 'metrics': self.metrics,
+            'players': self.players, 'history': self.history, 'venue_history': self.venue_history,
+            'player_roles': self.player_roles
+        }, path)
+        return path
+
+    @classmethod
+    def load(cls, path="results/models/fielding_predictor.joblib"):
+        saved = joblib.load(path)
+        predictor = cls(**saved.pop('params'))
+        for attribute, value in saved.items():
+            setattr(predictor, attribute, value)
+        return predictor
@@ -0,0 +1,109 @@
+# src/recommendation_rules.py
+import json
+import pandas as pd
+
+from config.constants import RECOMMENDATION_RULES
+
+try:
+    from .player_identity import names_for_ids
+except ImportError:
+    from player_identity import names_for_ids
+
+SUM_COLUMNS = ['clean_picks', 'good_throws', 'catches', 'dropped_catches', 'stumpings',
+               'run_outs', 'missed_run_outs', 'direct_hits', 'runs_saved']
+
+PRIORITY_ORDER = {'High': 0, 'Medium': 1, 'Low': 2}
+
+OUTPUT_COLUMNS = ['level', 'season', 'team', 'player_name', 'type', 'priority',
+                  'recommendation', 'rationale']
+
+
+def load_rules(path):
+    """Load a rule list from a JSON or YAML file"""
+    with open(path) as f:
+        if path.endswith(('.yaml', '.yml')):
+            import yaml
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+class RecommendationEngine:
+    """Evaluates declarative recommendation rules over team and player aggregates
+
+    Aggregates for every team and player are built once per call, and each rule
+    condition is a vectorized predicate over them, so a whole season's
+    recommendations come out of a single pass.
+    """
+
+    def __init__(self, rules=None):
+        self.rules = rules if rules is not None else RECOMMENDATION_RULES
+
+    @classmethod
+    def from_file(cls, path):
+        return cls(load_rules(path))
+
+    def build_aggregates(self, df):
+        team_keys = [key for key in ['season', 'team'] if key in df.columns]
+        # Resolved frames group players on the interned integer id
+        player_column = 'player_id' if 'player_id' in df.columns else 'player_name'
+        player_keys = team_keys + [player_column]
+        work = df.assign(
+            _conceding=(df['runs_saved'] < 0).astype(int),
+            _match=df['match_no'] if 'match_no' in df.columns else 0,
+            _score=df['performance_score'] if 'performance_score' in df.columns else 0
+        )
+
+        aggregates = {}
+        for level, keys in [('team', team_keys), ('player', player_keys)]:
+            grouped = work.groupby(keys, sort=False) if keys else work.groupby(lambda _: 0)
+            agg = grouped[SUM_COLUMNS].sum()
+            agg['players'] = grouped[player_column].nunique()
+            if player_column != 'player_name' and level == 'player':
+                agg['player_name'] = names_for_ids(df, agg.index.get_level_values(player_column))
+            agg['matches'] = grouped['_match'].nunique()
+            agg['average_score'] = grouped['_score'].mean()
+            agg['players_conceding'] = grouped['_conceding'].sum()
+            agg['runs_conceded'] = (-agg['runs_saved']).clip(lower=0)
+            aggregates[level] = agg.reset_index() if keys else agg.reset_index(drop=True)
+        return aggregates
+
+    def evaluate(self, df, levels=('team', 'player')):
+        """Prioritized recommendations for every team and player in the frame"""
+        aggregates = self.build_aggregates(df)
+        results = []
+
+        for order, rule in enumerate(self.rules):
+            level = rule.get('level', 'team')
+            if level not in levels:
+                continue
+            agg = aggregates[level]
+            mask = agg.eval(rule['condition'])
+            if not isinstance(mask, pd.Series):
+                mask = pd.Series(bool(mask), index=agg.index)
+            matched = agg[mask.astype(bool)]
+            if matched.empty:
+                continue
+
+            values = matched.to_dict('records')
+            results.append(pd.DataFrame({
+                'level': level,
+                'season': matched['season'].to_numpy() if 'season' in matched else None,
+                'team': matched['team'].to_numpy() if 'team' in matched else None,
+                'player_name': matched['player_name'].to_numpy() if level == 'player' else None,
+                'type': rule['type'],
+                'priority': rule['priority'],
+                'recommendation': [rule['recommendation'].format(**row) for row in values],
+                'rationale': [rule['rationale'].format(**row) for row in values],
+                '_rule_order': order
+            }))
+
+        if not results:
+            return pd.DataFrame(columns=OUTPUT_COLUMNS)
+
+        recommendations = pd.concat(results, ignore_index=True)
+        recommendations['_priority_rank'] = recommendations['priority'].map(PRIORITY_ORDER).fillna(len(PRIORITY_ORDER))
+        sort_keys = [key for key in ['season', 'team'] if recommendations[key].notna().any()]
+        recommendations = recommendations.sort_values(
+            sort_keys + ['_priority_rank', '_rule_order'], kind='mergesort'
+        )
+        return recommendations[OUTPUT_COLUMNS].reset_index(drop=True)
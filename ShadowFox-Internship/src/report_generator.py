@@ -0,0 +1,212 @@
+# src/report_generator.py
+import html
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from string import Template
+
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+import matplotlib.image as mpimg
+
+try:
+    from .analysis_tools import FieldingAnalyzer
+    from .result_writer import ResultWriter
+    from .visualizations import FieldingVisualizer
+except ImportError:
+    from analysis_tools import FieldingAnalyzer
+    from result_writer import ResultWriter
+    from visualizations import FieldingVisualizer
+
+# Chart title -> (FieldingVisualizer method, chart file name)
+CHARTS = {
+    'Performance Scores': ('plot_performance_scores', 'performance_scores'),
+    'Contributions Analysis': ('plot_positive_negative_contributions', 'contributions_analysis'),
+    'Runs Saved Analysis': ('plot_runs_saved_analysis', 'runs_saved_analysis'),
+    'Correlation Heatmap': ('create_correlation_heatmap', 'correlation_heatmap')
+}
+# Label for rows whose team is missing, so they still get a report
+UNKNOWN_TEAM = 'Unknown'
+
+SCOREBOARD_COLUMNS = ['player_name', 'player_role', 'performance_score', 'positive_contributions',
+                      'negative_contributions', 'efficiency_ratio', 'runs_saved']
+
+REPORT_TEMPLATE = Template("""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Fielding Report - $team</title>
+<style>
+body { font-family: Arial, sans-serif; margin: 2em; color: #222; }
+table { border-collapse: collapse; margin-bottom: 1.5em; }
+th, td { border: 1px solid #ccc; padding: 4px 10px; text-align: left; }
+th { background: #2E8B57; color: white; }
+img { max-width: 900px; display: block; margin-bottom: 1.5em; }
+</style>
+</head>
+<body>
+<h1>🏏 Fielding Performance Report - $team</h1>
+<p>Matches: $matches | Players: $players | Generated: $generated</p>
+<h2>Scoreboard</h2>
+$scoreboard
+<h2>Key Insights</h2>
+<ul>
+$insights
+</ul>
+<h2>Strategic Recommendations</h2>
+$recommendations
+$charts
+</body>
+</html>
+""")
+
+
+def _team_slug(team):
+    return ''.join(ch if ch.isalnum() else '_' for ch in str(team)).strip('_').lower()
+
+
+def _render_team_charts(team_df, slug, rendered, options, writer):
+    """This team's chart files, reusing already rendered ones and drawing only what is missing
+
+    ``rendered`` maps chart titles to files drawn earlier for the team (e.g. by the
+    dashboard's visualization step); other charts go under a team prefix.
+    With ``options['redraw_charts']`` every chart is drawn again.
+    """
+    import matplotlib.pyplot as plt
+    visualizer = FieldingVisualizer(options['chart_dir'], writer=writer, show=False)
+    charts = []
+    for title, (plot, name) in CHARTS.items():
+        path = rendered.get(title) or visualizer._chart_path(name, slug)
+        if options['redraw_charts'] or not os.path.exists(path):
+            fig = getattr(visualizer, plot)(team_df, prefix=slug)
+            plt.close(fig)
+            path = visualizer._chart_path(name, slug)
+        charts.append((title, path))
+    return charts
+
+
+def _render_team_report(team, team_df, options):
+    """Build the HTML (and optional PDF) report for one team (runs inside worker processes)"""
+    analyzer = FieldingAnalyzer()
+    scoreboard = team_df.sort_values('performance_score', ascending=False)[
+        [col for col in SCOREBOARD_COLUMNS if col in team_df.columns]
+    ]
+    insights = analyzer.generate_performance_insights(team_df)
+    recommendations = analyzer.generate_strategic_recommendations(team_df)
+    slug = _team_slug(team)
+
+    # Synchronous writer: every file is in place (atomically) before the paths are returned
+    with ResultWriter(background=False) as writer:
+        charts = (_render_team_charts(team_df, slug, options['chart_paths'].get(team, {}), options, writer)
+                  if options['include_charts'] else [])
+
+        chart_html = ''
+        if charts:
+            chart_html = '<h2>Charts</h2>\n' + '\n'.join(
+                f'<h3>{html.escape(title)}</h3>\n'
+                f'<img src="{html.escape(os.path.relpath(path, options["output_dir"]))}" alt="{html.escape(title)}">'
+                for title, path in charts
+            )
+
+        html_path = os.path.join(options['output_dir'], f"{slug}_report.html")
+        writer.write_text(REPORT_TEMPLATE.substitute(
+            team=html.escape(str(team)),
+            matches=team_df['match_no'].nunique() if 'match_no' in team_df.columns else 1,
+            players=team_df['player_name'].nunique(),
+            generated=options['generated'],
+            scoreboard=scoreboard.to_html(index=False, float_format='{:.2f}'.format),
+            insights='\n'.join(f"<li>{html.escape(insight)}</li>" for insight in insights),
+            recommendations=recommendations.to_html(index=False),
+            charts=chart_html
+        ), html_path)
+
+        paths = [html_path]
+        if options['generate_pdf']:
+            pdf_path = os.path.join(options['output_dir'], f"{slug}_report.pdf")
+            writer.write_bytes(_pdf_bytes(team, scoreboard, insights, recommendations, charts), pdf_path)
+            paths.append(pdf_path)
+    return paths
+
+
+def _pdf_bytes(team, scoreboard, insights, recommendations, charts):
+    # Figure objects (not pyplot) keep rendering free of global state
+    buffer = io.BytesIO()
+    with PdfPages(buffer) as pdf:
+        fig = Figure(figsize=(11.7, 8.3))
+        ax = fig.add_subplot(111)
+        ax.axis('off')
+        ax.set_title(f"Fielding Performance Report - {team}", fontsize=16, fontweight='bold')
+        table = ax.table(cellText=scoreboard.round(2).values.tolist(), colLabels=list(scoreboard.columns),
+                         loc='upper center', bbox=[0, 0.45, 1, 0.5])
+        table.auto_set_font_size(False)
+        table.set_fontsize(8)
+        lines = ['Key insights:'] + [f"  - {insight.encode('ascii', 'ignore').decode().strip()}" for insight in insights]
+        lines += ['', 'Recommendations:'] + [f"  - [{row['priority']}] {row['recommendation']}"
+                                            for _, row in recommendations.iterrows()]
+        ax.text(0, 0.4, '\n'.join(lines), va='top', fontsize=9, transform=ax.transAxes)
+        pdf.savefig(fig)
+
+        for title, path in charts:
+            fig = Figure(figsize=(11.7, 8.3))
+            ax = fig.add_subplot(111)
+            ax.imshow(mpimg.imread(path))
+            ax.axis('off')
+            ax.set_title(title)
+            pdf.savefig(fig)
+    return buffer.getvalue()
+
+
+class ReportGenerator:
+    """Writes per-team HTML/PDF reports into results/reports/
+
+    Reports are built in parallel across teams. Each report embeds its team's
+    chart files, reusing ones already rendered and drawing the missing ones from
+    the team's rows under a team prefix in ``chart_dir``; rows without a team
+    are reported under UNKNOWN_TEAM.
+    """
+
+    def __init__(self, output_dir="results/reports/", chart_dir="results/visualizations/",
+                 generate_pdf=False, include_charts=True, max_workers=None):
+        self.output_dir = output_dir
+        self.chart_dir = chart_dir
+        self.generate_pdf = generate_pdf
+        self.include_charts = include_charts
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_settings(cls, settings_path="config/settings.yaml", **kwargs):
+        """Read the ``reporting`` block of settings.yaml"""
+        import yaml
+        with open(settings_path) as f:
+            reporting = (yaml.safe_load(f) or {}).get('reporting', {})
+        return cls(generate_pdf=reporting.get('generate_pdf', False),
+                   include_charts=reporting.get('include_charts', True), **kwargs)
+
+    def generate_reports(self, df_scored, generated=None, chart_paths=None, redraw_charts=False):
+        """Write one report per team and return {team: [paths]}
+
+        ``chart_paths`` maps a team to {chart title: file} of charts already
+        rendered for it; those files are embedded as they are. Charts without a
+        file are drawn, and ``redraw_charts`` draws every chart again (after the
+        team's rows changed).
+        """
+        options = {
+            'output_dir': self.output_dir,
+            'chart_dir': self.chart_dir,
+            'chart_paths': chart_paths or {},
+            'redraw_charts': redraw_charts,
+            'include_charts': self.include_charts,
+            'generate_pdf': self.generate_pdf,
+            'generated': generated or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        teams = df_scored['team'].fillna(UNKNOWN_TEAM) if 'team' in df_scored.columns else UNKNOWN_TEAM
+        teams = list(df_scored.assign(team=teams).groupby('team', sort=False))
+
+        if len(teams) <= 1 or self.max_workers == 1:
+            return {team: _render_team_report(team, team_df, options) for team, team_df in teams}
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {team: executor.submit(_render_team_report, team, team_df, options)
+                       for team, team_df in teams}
+            return {team: future.result() for team, future in futures.items()}
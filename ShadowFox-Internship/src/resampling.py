@@ -0,0 +1,120 @@
+# src/resampling.py
+import os
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+try:
+    from .analysis_tools import CORRELATION_METRICS
+except ImportError:
+    from analysis_tools import CORRELATION_METRICS
+
+
+def _batch_statistic(kind, data, idx):
+    """Statistic for every resample in a (batch, n) index matrix"""
+    if kind == 'mean':
+        return data[idx].mean(axis=1)
+    x, y = data[0][idx], data[1][idx]
+    x = x - x.mean(axis=1, keepdims=True)
+    y = y - y.mean(axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (x * y).sum(axis=1) / np.sqrt((x * x).sum(axis=1) * (y * y).sum(axis=1))
+
+
+def _resample_chunk(kind, data, n_resamples, batch_size, seed):
+    """Draw n_resamples bootstrap statistics in batches (runs inside worker processes)"""
+    rng = np.random.default_rng(seed)
+    n = len(data) if kind == 'mean' else len(data[0])
+    results = []
+    for start in range(0, n_resamples, batch_size):
+        size = min(batch_size, n_resamples - start)
+        idx = rng.integers(0, n, size=(size, n))
+        results.append(_batch_statistic(kind, data, idx))
+    return np.concatenate(results)
+
+
+class BootstrapAnalyzer:
+    """Bootstrap confidence intervals for fielding scores and metric correlations
+
+    Resamples are drawn as index matrices in batches; when ``n_jobs`` > 1 and the
+    number of resamples is at least ``parallel_threshold``, batches are spread
+    across a process pool with independent seeds.
+    """
+
+    def __init__(self, n_resamples=10000, confidence=0.95, batch_size=1000, n_jobs=1,
+                 parallel_threshold=20000, random_state=42):
+        self.n_resamples = n_resamples
+        self.confidence = confidence
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs if n_jobs and n_jobs > 0 else (os.cpu_count() or 1)
+        self.parallel_threshold = parallel_threshold
+        self.random_state = random_state
+
+    def _parallel(self):
+        return self.n_jobs > 1 and self.n_resamples >= self.parallel_threshold
+
+    def _pool(self):
+        """One process pool shared by every resample of a call, or a no-op context when serial"""
+        return ProcessPoolExecutor(max_workers=self.n_jobs) if self._parallel() else nullcontext()
+
+    def resample(self, kind, data, seed=None, executor=None):
+        """Bootstrap distribution of 'mean' (1-D data) or 'correlation' ((x, y) data)
+
+        ``seed`` is a SeedSequence (default: one built from ``random_state``) and
+        ``executor`` an already running pool to submit the batches to.
+        """
+        seed = np.random.SeedSequence(self.random_state) if seed is None else seed
+        seeds = seed.spawn(self.n_jobs)
+        if not self._parallel():
+            return _resample_chunk(kind, data, self.n_resamples, self.batch_size, seeds[0])
+
+        chunk_sizes = [len(chunk) for chunk in np.array_split(np.arange(self.n_resamples), self.n_jobs)]
+        with (nullcontext(executor) if executor is not None else self._pool()) as pool:
+            chunks = pool.map(_resample_chunk, [kind] * self.n_jobs, [data] * self.n_jobs,
+                              chunk_sizes, [self.batch_size] * self.n_jobs, seeds)
+            return np.concatenate(list(chunks))
+
+    def confidence_interval(self, statistics):
+        alpha = (1 - self.confidence) / 2
+        if np.all(np.isnan(statistics)):
+            return np.nan, np.nan
+        lower, upper = np.nanpercentile(statistics, [100 * alpha, 100 * (1 - alpha)])
+        return lower, upper
+
+    def score_intervals(self, df, group_by='player_name', value='performance_score'):
+        """Mean score with a bootstrap CI for every group (player or team)"""
+        rows = []
+        groups = list(df.groupby(group_by, sort=False)[value])
+        # Independent child seeds per group; one pool serves every group
+        seeds = np.random.SeedSequence(self.random_state).spawn(len(groups))
+        with self._pool() as executor:
+            for (group, values), seed in zip(groups, seeds):
+                values = values.to_numpy(dtype=float)
+                statistics = self.resample('mean', values, seed, executor)
+                lower, upper = self.confidence_interval(statistics)
+                rows.append({group_by: group, 'observations': len(values), 'mean_score': values.mean(),
+                             'ci_lower': lower, 'ci_upper': upper})
+        return pd.DataFrame(rows)
+
+    def player_score_intervals(self, df):
+        return self.score_intervals(df, 'player_name')
+
+    def team_score_intervals(self, df):
+        return self.score_intervals(df, 'team')
+
+    def correlation_intervals(self, df, metrics=None, target='performance_score'):
+        """Pearson r of each metric against the score, with bootstrap CIs"""
+        rows = []
+        y = df[target].to_numpy(dtype=float)
+        metrics = list(metrics or CORRELATION_METRICS)
+        seeds = np.random.SeedSequence(self.random_state).spawn(len(metrics))
+        with self._pool() as executor:
+            for metric, seed in zip(metrics, seeds):
+                x = df[metric].to_numpy(dtype=float)
+                observed = _batch_statistic('correlation', (x, y), np.arange(len(x))[None, :])[0]
+                statistics = self.resample('correlation', (x, y), seed, executor)
+                lower, upper = self.confidence_interval(statistics)
+                rows.append({'metric': metric.replace('_', ' ').title(), 'correlation': observed,
+                             'ci_lower': lower, 'ci_upper': upper})
+        return pd.DataFrame(rows).sort_values('correlation', ascending=False).reset_index(drop=True)
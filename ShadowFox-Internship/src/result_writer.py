@@ -0,0 +1,135 @@
+# src/result_writer.py
+import gzip
+import hashlib
+import io
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+
+FRAME_FORMATS = {
+    '.csv': 'csv',
+    '.csv.gz': 'csv.gz',
+    '.parquet': 'parquet',
+    '.json': 'json'
+}
+
+
+def atomic_write_bytes(path, payload):
+    """Write bytes to a temp file next to ``path`` and atomically rename it into place"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return path
+
+
+def infer_frame_format(path):
+    for suffix in sorted(FRAME_FORMATS, key=len, reverse=True):
+        if path.endswith(suffix):
+            return FRAME_FORMATS[suffix]
+    raise ValueError(f"Cannot infer output format from path: {path}")
+
+
+def frame_digest(df):
+    """Content hash of a frame: values, index, column names and dtypes"""
+    digest = hashlib.blake2b(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes(), digest_size=16)
+    digest.update(repr([(str(column), str(dtype)) for column, dtype in df.dtypes.items()]).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def serialize_frame(df, fmt):
+    """Serialize a DataFrame to bytes in one of the supported formats"""
+    if fmt == 'csv':
+        return df.to_csv(index=False).encode('utf-8')
+    if fmt == 'csv.gz':
+        return gzip.compress(df.to_csv(index=False).encode('utf-8'))
+    if fmt == 'parquet':
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, index=False)
+        return buffer.getvalue()
+    if fmt == 'json':
+        return df.to_json(orient='records').encode('utf-8')
+    raise ValueError(f"Unsupported frame format: {fmt}")
+
+
+class ResultWriter:
+    """Writes pipeline outputs atomically on a background thread
+
+    Frames are serialized on the calling thread, so later in-place changes never
+    reach a queued write, and identical content in one format is serialized once
+    (keyed on a content hash), so the same scored frame saved to several paths
+    costs a single ``to_csv``. File writes run in submission order on one worker
+    thread; call ``flush`` (or ``close``) before relying on the files.
+    """
+
+    def __init__(self, background=True):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='result-writer') if background else None
+        self._futures = []
+        self._serialized = {}
+        self.written_paths = []
+
+    def write_frame(self, df, path, fmt=None):
+        fmt = fmt or infer_frame_format(path)
+        key = (frame_digest(df), fmt)
+        if key not in self._serialized:
+            self._serialized[key] = serialize_frame(df, fmt)
+        return self._submit(path, atomic_write_bytes, path, self._serialized[key])
+
+    def write_figure(self, fig, path, **savefig_kwargs):
+        """Render a figure on the calling thread and write the bytes in the background"""
+        buffer = io.BytesIO()
+        fmt = os.path.splitext(path)[1].lstrip('.') or 'png'
+        fig.savefig(buffer, format=fmt, **savefig_kwargs)
+        return self._submit(path, atomic_write_bytes, path, buffer.getvalue())
+
+    def write_json(self, obj, path):
+        payload = json.dumps(obj, indent=2, default=str).encode('utf-8')
+        return self._submit(path, atomic_write_bytes, path, payload)
+
+    def write_text(self, text, path):
+        return self._submit(path, atomic_write_bytes, path, text.encode('utf-8'))
+
+    def write_bytes(self, payload, path):
+        return self._submit(path, atomic_write_bytes, path, payload)
+
+    def _submit(self, path, func, *args):
+        self.written_paths.append(path)
+        if self._executor is None:
+            return func(*args)
+        future = self._executor.submit(func, *args)
+        self._futures.append(future)
+        return future
+
+    def flush(self):
+        """Wait for every pending write and re-raise the first failure"""
+        futures, self._futures = self._futures, []
+        errors = [future.exception() for future in futures]
+        self._serialized.clear()
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
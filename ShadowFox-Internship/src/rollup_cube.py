@@ -0,0 +1,202 @@
+# src/rollup_cube.py
+import hashlib
+import pandas as pd
+
+# Rollup hierarchy from coarsest to finest; every level is a key prefix
+HIERARCHY = ['season', 'team', 'match_no', 'player_role', 'player_name']
+LEVELS = {
+    'overall': [],
+    'season': HIERARCHY[:1],
+    'team': HIERARCHY[:2],
+    'match': HIERARCHY[:3],
+    'role': HIERARCHY[:4],
+    'player': HIERARCHY
+}
+SUM_MEASURES = ['performance_score', 'runs_saved', 'clean_picks', 'good_throws', 'catches',
+                'dropped_catches', 'stumpings', 'run_outs', 'missed_run_outs', 'direct_hits',
+                'positive_contributions', 'negative_contributions']
+RANGE_MEASURES = ['performance_score', 'runs_saved']
+
+
+def _aggregations(measures):
+    spec = {'rows': 'sum'}
+    spec.update({f'{m}_sum': 'sum' for m in measures})
+    spec.update({f'{m}_min': 'min' for m in RANGE_MEASURES})
+    spec.update({f'{m}_max': 'max' for m in RANGE_MEASURES})
+    return spec
+
+
+def _aggregate(grouped, spec):
+    """Apply the spec with one vectorized call per aggregation kind"""
+    columns_by_kind = {}
+    for column, how in spec.items():
+        columns_by_kind.setdefault(how, []).append(column)
+    parts = [getattr(grouped[columns], how)() for how, columns in columns_by_kind.items()]
+    return pd.concat(parts, axis=1)[list(spec)]
+
+
+def _roll_up(child, keys, spec):
+    """Aggregate a child level's rows to the given key prefix, keeping each group's top player"""
+    cells = child.reset_index()
+    grouped = cells.groupby(keys, sort=False)
+    rolled = _aggregate(grouped, spec)
+    if 'top_performer' in cells.columns:
+        best = grouped['top_score'].idxmax().to_numpy()
+        rolled['top_performer'] = cells['top_performer'].to_numpy()[best]
+        rolled['top_score'] = cells['top_score'].to_numpy()[best]
+    else:
+        best = grouped['performance_score_max'].idxmax().to_numpy()
+        rolled['top_performer'] = cells['player_name'].to_numpy()[best]
+        rolled['top_score'] = cells['performance_score_max'].to_numpy()[best]
+    return rolled
+
+
+def _grand_total(table, spec):
+    """Single-row overall level combined from the season level"""
+    totals = {column: table[column].agg(how) for column, how in spec.items()}
+    best = table['top_score'].idxmax()
+    totals['top_performer'] = table.loc[best, 'top_performer']
+    totals['top_score'] = table.loc[best, 'top_score']
+    return pd.DataFrame([totals], index=pd.Index(['All']))
+
+
+def _under(index, keys, prefixes):
+    """Mask of the rows of a level index whose key prefix is one of the given prefixes"""
+    return index.droplevel(index.names[len(keys):]).isin(prefixes)
+
+
+class RollupCube:
+    """Precomputed sums, counts and min/max over season > team > match > role > player
+
+    The leaf table holds one cell per (season, team, match, role, player) and each
+    level above it is a prefix rollup of those cells. ``update`` folds a new match
+    into the leaf cells and re-aggregates only the groups that contain them.
+    """
+
+    def __init__(self):
+        self.measures = []
+        self.leaf = None
+        self.levels = {}
+
+    def fingerprint(self):
+        """Content hash of the leaf cells (every level is derived from them); changes on update/refresh"""
+        if self.leaf is None:
+            return None
+        hashes = pd.util.hash_pandas_object(self.leaf, index=True).to_numpy()
+        return hashlib.blake2b(hashes.tobytes(), digest_size=16).hexdigest()
+
+    def cell_keys(self, df_scored):
+        """Leaf cell keys for the rows of a scored frame"""
+        return pd.MultiIndex.from_frame(self._keyed(df_scored)[HIERARCHY]).unique()
+
+    def rows_in_cells(self, df_scored, cell_keys):
+        """Rows of a scored frame that belong to the given leaf cells"""
+        present = [key for key in HIERARCHY if key in df_scored.columns]
+        keys = pd.MultiIndex.from_frame(self._keyed(df_scored[present])[HIERARCHY])
+        return df_scored[keys.isin(cell_keys)]
+
+    def _keyed(self, df_scored):
+        keyed = df_scored.copy()
+        for key in HIERARCHY:
+            keyed[key] = keyed[key].fillna('Unknown') if key in keyed.columns else 'Unknown'
+        return keyed
+
+    def _leaf_cells(self, df_scored):
+        keyed = self._keyed(df_scored)
+        keyed['rows'] = 1
+        for m in RANGE_MEASURES:
+            keyed[f'{m}_min'] = keyed[m]
+            keyed[f'{m}_max'] = keyed[m]
+        for m in self.measures:
+            keyed[f'{m}_sum'] = keyed[m]
+        spec = _aggregations(self.measures)
+        return _aggregate(keyed.groupby(HIERARCHY, sort=False), spec)
+
+    def fit(self, df_scored):
+        """Build the leaf table and every rollup level from a scored frame"""
+        self.measures = [m for m in SUM_MEASURES if m in df_scored.columns]
+        self.leaf = self._leaf_cells(df_scored)
+        spec = _aggregations(self.measures)
+        self.levels = {}
+        child = self.leaf
+        # Each level is rolled up from the one below it, finest first
+        for level, keys in reversed(LEVELS.items()):
+            if keys:
+                self.levels[level] = child = _roll_up(child, keys, spec)
+        self.levels['overall'] = _grand_total(self.levels['season'], spec)
+        return self
+
+    def update(self, df_scored):
+        """Add a new match's scored rows, recomputing only the affected groups"""
+        if self.leaf is None:
+            return self.fit(df_scored)
+        spec = _aggregations(self.measures)
+        increments = self._leaf_cells(df_scored)
+        overlap = increments.index.intersection(self.leaf.index)
+        merged = _aggregate(pd.concat([self.leaf.loc[overlap], increments]).groupby(level=HIERARCHY, sort=False),
+                            spec)
+        self.leaf = pd.concat([self.leaf.drop(overlap), merged])
+        self._refresh_levels(increments.index)
+        return self
+
+    def refresh(self, cell_rows, cell_keys):
+        """Rebuild the given leaf cells from their current rows (after corrections or deletions)
+
+        ``cell_rows`` holds every current scored row of the cells in ``cell_keys``;
+        cells left without rows disappear from the cube.
+        """
+        stale = self.leaf.index.intersection(cell_keys)
+        self.leaf = self.leaf.drop(stale)
+        if len(cell_rows):
+            self.leaf = pd.concat([self.leaf, self._leaf_cells(cell_rows)])
+        self._refresh_levels(cell_keys)
+        return self
+
+    def _refresh_levels(self, touched):
+        """Re-aggregate only the groups at each level that contain the touched leaf cells"""
+        spec = _aggregations(self.measures)
+        child = self.leaf
+        for level, keys in reversed(LEVELS.items()):
+            if not keys:
+                continue
+            affected = touched.droplevel(HIERARCHY[len(keys):]).unique()
+            refreshed = _roll_up(child[_under(child.index, keys, affected)], keys, spec)
+            current = self.levels[level]
+            self.levels[level] = child = pd.concat([current[~_under(current.index, keys, affected)], refreshed])
+        self.levels['overall'] = _grand_total(self.levels['season'], spec)
+
+    def rollup(self, level='team', **filters):
+        """Precomputed rows for one level, optionally filtered on any hierarchy key"""
+        table = self.levels[level]
+        if filters:
+            table = table.reset_index()
+            for key, value in filters.items():
+                table = table[table[key] == value]
+            table = table.set_index(LEVELS[level]) if LEVELS[level] else table
+        return table
+
+    def drill_down(self, **keys):
+        """Children of the group identified by a key prefix (e.g. season=, team=)"""
+        depth = max([HIERARCHY.index(key) + 1 for key in keys], default=0)
+        child_level = list(LEVELS)[min(depth + 1, len(LEVELS) - 1)]
+        return self.rollup(child_level, **keys)
+
+    def summary(self, **filters):
+        """Totals, average, range and top performer for the rows matching the filters"""
+        depth = max([HIERARCHY.index(key) + 1 for key in filters], default=0)
+        table = self.rollup(list(LEVELS)[depth], **filters)
+        rows = table['rows'].sum()
+        best = table['top_score'].idxmax()
+        summary = {
+            'rows': int(rows),
+            'average_score': table['performance_score_sum'].sum() / rows if rows else 0.0,
+            'min_score': table['performance_score_min'].min(),
+            'max_score': table['performance_score_max'].max(),
+            'min_runs_saved': table['runs_saved_min'].min(),
+            'max_runs_saved': table['runs_saved_max'].max(),
+            'top_performer': table.loc[best, 'top_performer'],
+            'top_score': table.loc[best, 'top_score']
+        }
+        for m in self.measures:
+            summary[f'total_{m}'] = table[f'{m}_sum'].sum()
+        return summary
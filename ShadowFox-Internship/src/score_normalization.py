@@ -0,0 +1,108 @@
+# src/score_normalization.py
+import os
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+BASELINE_KEYS = ['player_role', 'venue']
+
+
+def _finish_baselines(table):
+    """Mean and sample standard deviation from count / total / total_sq sums"""
+    table = table.copy()
+    count = table['count']
+    table['mean'] = table['total'] / count
+    variance = (table['total_sq'] - table['total'] ** 2 / count) / (count - 1)
+    table['std'] = np.sqrt(variance.clip(lower=0).where(count > 1))
+    return table
+
+
+class ScoreBaselines:
+    """Role x venue baseline table for normalizing performance scores
+
+    Only running sums (count, total, total of squares) are stored per key, so
+    ``update`` folds in new matches without revisiting history. Keys with
+    fewer than ``min_count`` scores fall back to the role baseline, then to the
+    overall baseline.
+    """
+
+    def __init__(self, value='performance_score', min_count=5):
+        self.value = value
+        self.min_count = min_count
+        self.table = pd.DataFrame(columns=['count', 'total', 'total_sq', 'mean', 'std'],
+                                  index=pd.MultiIndex.from_tuples([], names=BASELINE_KEYS))
+
+    def fit(self, df_scored):
+        """Build the table from scratch"""
+        self.table = self.table.iloc[0:0]
+        return self.update(df_scored)
+
+    def update(self, df_scored):
+        """Add new scored rows to the running sums and refresh the touched keys"""
+        values = df_scored[self.value].astype(float)
+        sums = pd.DataFrame({'count': 1.0, 'total': values, 'total_sq': values ** 2})
+        keys = [df_scored[key].fillna('Unknown') for key in BASELINE_KEYS]
+        increments = sums.groupby(keys).sum()
+
+        touched = increments.index
+        current = self.table[['count', 'total', 'total_sq']].astype(float)
+        combined = current.reindex(current.index.union(touched), fill_value=0)
+        combined.loc[touched] += increments
+
+        table = self.table.reindex(combined.index).astype(float)
+        table[['count', 'total', 'total_sq']] = combined
+        table.loc[touched] = _finish_baselines(combined.loc[touched])
+        self.table = table
+        return self
+
+    def role_baselines(self):
+        return _finish_baselines(self.table[['count', 'total', 'total_sq']].astype(float)
+                                 .groupby(level='player_role').sum())
+
+    def overall_baseline(self):
+        totals = self.table[['count', 'total', 'total_sq']].astype(float).sum()
+        return _finish_baselines(totals.to_frame().T).iloc[0]
+
+    def normalize(self, df_scored):
+        """Add baseline mean/std, z-score and percentile columns with a single keyed join
+
+        Percentiles are read off the normal curve of the matched baseline, since
+        only running sums are kept per key.
+        """
+        keys = pd.DataFrame({key: df_scored[key].fillna('Unknown').to_numpy() for key in BASELINE_KEYS})
+        venue = keys.merge(self.table[['count', 'mean', 'std']].reset_index(), on=BASELINE_KEYS, how='left')
+        role = keys[['player_role']].merge(self.role_baselines()[['count', 'mean', 'std']].reset_index(),
+                                           on='player_role', how='left')
+        overall = self.overall_baseline()
+
+        use_venue = (venue['count'] >= self.min_count).to_numpy()
+        use_role = ~use_venue & (role['count'] >= self.min_count).to_numpy()
+        mean = np.select([use_venue, use_role], [venue['mean'].to_numpy(dtype=float),
+                                                 role['mean'].to_numpy(dtype=float)], float(overall['mean']))
+        std = np.select([use_venue, use_role], [venue['std'].to_numpy(dtype=float),
+                                                role['std'].to_numpy(dtype=float)], float(overall['std']))
+
+        df_normalized = df_scored.copy()
+        values = df_normalized[self.value].to_numpy(dtype=float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            z_scores = np.where(std > 0, (values - mean) / std, 0.0)
+        df_normalized['baseline_mean'] = mean
+        df_normalized['baseline_std'] = std
+        df_normalized['baseline_level'] = np.select([use_venue, use_role], ['role_venue', 'role'], 'overall')
+        df_normalized['score_z'] = z_scores
+        df_normalized['score_percentile'] = stats.norm.cdf(z_scores) * 100
+        return df_normalized
+
+    def save(self, path="data/outputs/score_baselines.csv"):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.table[['count', 'total', 'total_sq']].reset_index().to_csv(path, index=False)
+        return path
+
+    @classmethod
+    def load(cls, path="data/outputs/score_baselines.csv", **kwargs):
+        baselines = cls(**kwargs)
+        sums = pd.read_csv(path).set_index(BASELINE_KEYS)
+        baselines.table = _finish_baselines(sums.astype(float))
+        return baselines
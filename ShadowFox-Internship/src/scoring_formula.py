@@ -0,0 +1,117 @@
+# src/scoring_formula.py
+import ast
+import numpy as np
+
+# Functions a formula may call, mapped to their NumPy implementations
+FUNCTIONS = {
+    'abs': np.abs, 'sqrt': np.sqrt, 'log': np.log, 'log1p': np.log1p, 'exp': np.exp,
+    'minimum': np.minimum, 'maximum': np.maximum, 'clip': np.clip, 'where': np.where
+}
+# Referenced columns that are run totals rather than fielding actions (excluded from efficiency)
+NON_ACTION_COLUMNS = ['runs_saved']
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant, ast.Compare,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.FloorDiv, ast.USub, ast.UAdd,
+    ast.Gt, ast.GtE, ast.Lt, ast.LtE, ast.Eq, ast.NotEq, ast.BitAnd, ast.BitOr, ast.Invert
+)
+
+
+def formula_from_weights(weights):
+    """The classic linear formula: weighted counts plus runs saved"""
+    expression = ' '.join(f"{'-' if weight < 0 else '+'} {abs(weight)} * {field}"
+                          for field, weight in weights.items())
+    return f"{expression} + runs_saved".lstrip('+ ')
+
+
+def _additive_terms(node, sign=1):
+    """Flatten top-level + / - (and unary minus) into (sign, term) pairs"""
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub)):
+        right_sign = sign if isinstance(node.op, ast.Add) else -sign
+        return _additive_terms(node.left, sign) + _additive_terms(node.right, right_sign)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        return _additive_terms(node.operand, -sign if isinstance(node.op, ast.USub) else sign)
+    return [(sign, node)]
+
+
+def _signed(sign, node):
+    """Fold a term's sign into its leading constant where possible (``-3 * x`` stays one multiply)"""
+    if sign > 0:
+        return node
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult) and isinstance(node.left, ast.Constant):
+        return ast.BinOp(ast.Constant(-node.left.value), ast.Mult(), node.right)
+    if isinstance(node, ast.Constant):
+        return ast.Constant(-node.value)
+    return ast.UnaryOp(ast.USub(), node)
+
+
+def _compile(node):
+    return compile(ast.fix_missing_locations(ast.Expression(node)), '<formula>', 'eval')
+
+
+class ScoringFormula:
+    """A performance-score formula parsed once and compiled to NumPy expressions
+
+    Formulas are arithmetic over count columns, e.g.
+    ``3 * catches - 3 * dropped_catches + 2 * sqrt(relay_throws) + runs_saved``.
+    Only names, numbers, arithmetic, comparisons and the functions in FUNCTIONS
+    are accepted. Each top-level additive term is compiled separately so positive
+    and negative contributions are derived per row from the sign of every term.
+    """
+
+    def __init__(self, expression):
+        self.expression = expression.strip()
+        try:
+            tree = ast.parse(self.expression, mode='eval')
+        except SyntaxError as e:
+            raise ValueError(f"Invalid scoring formula: {e.msg}") from None
+        self._validate(tree)
+
+        names = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+        self.columns = sorted(names - set(FUNCTIONS))
+        self.action_columns = [column for column in self.columns if column not in NON_ACTION_COLUMNS]
+        self._score = _compile(tree.body)
+        self._terms = [_compile(_signed(sign, term)) for sign, term in _additive_terms(tree.body)]
+
+    def _validate(self, tree):
+        for node in ast.walk(tree):
+            if not isinstance(node, _ALLOWED_NODES):
+                raise ValueError(f"Unsupported syntax in scoring formula: {type(node).__name__}")
+            if isinstance(node, ast.Call):
+                if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS or node.keywords:
+                    raise ValueError(f"Unsupported function in scoring formula: {ast.unparse(node.func)}")
+            elif isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+                raise ValueError(f"Unsupported constant in scoring formula: {node.value!r}")
+
+    def _namespace(self, data):
+        namespace = dict(FUNCTIONS)
+        for column in self.columns:
+            value = data[column]
+            namespace[column] = value.to_numpy() if hasattr(value, 'to_numpy') else value
+        return namespace
+
+    def terms(self, data):
+        """Evaluate every additive term, sign included, over a frame, row or structured array"""
+        namespace = self._namespace(data)
+        return [eval(code, {'__builtins__': {}}, namespace) for code in self._terms]
+
+    def score(self, data):
+        """Formula value for every row (or a scalar for a single row)"""
+        return eval(self._score, {'__builtins__': {}}, self._namespace(data))
+
+    def contributions(self, data):
+        """(score, positive, negative) with each term's per-row sign deciding where it counts"""
+        terms = self.terms(data)
+        score = positive = negative = 0
+        for term in terms:
+            score = score + term
+            positive = positive + np.maximum(term, 0)
+            negative = negative + np.maximum(-term, 0)
+        return score, positive, negative
+
+    def __reduce__(self):
+        # Compiled code objects do not pickle; worker processes recompile from the text
+        return (ScoringFormula, (self.expression,))
+
+    def __repr__(self):
+        return f"ScoringFormula({self.expression!r})"
@@ -0,0 +1,150 @@
+# src/sharded_runner.py
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+try:
+    from .data_loader import FieldingDataLoader, clean_frame
+    from .performance_calculator import PerformanceCalculator
+    from .analysis_tools import CORRELATION_METRICS
+    from .recommendation_rules import RecommendationEngine
+    from .player_identity import PlayerRegistry
+except ImportError:
+    from data_loader import FieldingDataLoader, clean_frame
+    from performance_calculator import PerformanceCalculator
+    from analysis_tools import CORRELATION_METRICS
+    from recommendation_rules import RecommendationEngine
+    from player_identity import PlayerRegistry
+
+SHARD_KEYS = ('team', 'season')
+CORRELATION_STATS = ['n', 'sum_x', 'sum_y', 'sum_xx', 'sum_yy', 'sum_xy']
+RANKING_COLUMNS = ['player_name', 'performance_score', 'player_role']
+
+# Read-only configuration installed once per worker process
+_WORKER_CONFIG = {}
+
+
+def _init_worker(config):
+    _WORKER_CONFIG.clear()
+    _WORKER_CONFIG.update(config)
+    _WORKER_CONFIG['calculator'] = PerformanceCalculator(config.get('weights'), config.get('formula'))
+    _WORKER_CONFIG['engine'] = RecommendationEngine(config.get('recommendation_rules'))
+
+
+def correlation_statistics(df, metrics=CORRELATION_METRICS, target='performance_score'):
+    """Sufficient statistics for Pearson r of each metric against the target"""
+    y = df[target].to_numpy(dtype=float)
+    rows = {}
+    for metric in metrics:
+        x = df[metric].to_numpy(dtype=float)
+        rows[metric] = [len(x), x.sum(), y.sum(), (x * x).sum(), (y * y).sum(), (x * y).sum()]
+    return pd.DataFrame.from_dict(rows, orient='index', columns=CORRELATION_STATS)
+
+
+def correlations_from_statistics(totals):
+    """The calculate_correlations table from merged sufficient statistics"""
+    correlations = []
+    for metric, row in totals.iterrows():
+        n = row['n']
+        covariance = n * row['sum_xy'] - row['sum_x'] * row['sum_y']
+        spread = (n * row['sum_xx'] - row['sum_x'] ** 2) * (n * row['sum_yy'] - row['sum_y'] ** 2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            r = float(np.clip(covariance / np.sqrt(spread), -1, 1))
+        # Same two-sided p-value as scipy.stats.pearsonr
+        shape = n / 2 - 1
+        p_value = 2 * stats.beta(shape, shape, loc=-1, scale=2).sf(abs(r))
+        correlations.append({
+            'metric': metric.replace('_', ' ').title(),
+            'correlation': round(r, 3),
+            'p_value': round(p_value, 4)
+        })
+    return pd.DataFrame(correlations).sort_values('correlation', ascending=False)
+
+
+def _run_shard(shard):
+    """Clean, score and analyze one shard; rows keep their global index"""
+    scored = _WORKER_CONFIG['calculator'].calculate_all_scores(clean_frame(shard))
+    return {
+        'scored': scored,
+        'correlation_stats': correlation_statistics(scored),
+        'recommendations': _WORKER_CONFIG['engine'].evaluate(scored)
+    }
+
+
+class ShardedRunner:
+    """Runs clean → score → analyze per team or season shard in a process pool
+
+    Each shard carries its rows' global positions as the index, and the reduce
+    step merges shard results so the scored frame, rankings, correlations and
+    recommendations are identical to running the pipeline on the whole frame.
+    Player names are resolved through ``registry`` in this process before
+    sharding, as ``FieldingDataLoader.clean_fielding_data`` does.
+    """
+
+    def __init__(self, shard_by='team', max_workers=None, weights=None, recommendation_rules=None,
+                 top_n=3, formula=None, registry=None):
+        if shard_by not in SHARD_KEYS:
+            raise ValueError(f"Unknown shard key '{shard_by}', expected one of {SHARD_KEYS}")
+        self.shard_by = shard_by
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.top_n = top_n
+        self.registry = registry if registry is not None else PlayerRegistry()
+        self.config = {'weights': weights, 'recommendation_rules': recommendation_rules, 'formula': formula}
+
+    def partition(self, df):
+        """Split a loaded frame into shards on the shard key, in order of first appearance"""
+        df = df.reset_index(drop=True)
+        if self.shard_by not in df.columns:
+            return [(None, df)]
+        return list(df.groupby(self.shard_by, sort=False, dropna=False))
+
+    def run(self, source):
+        """Run a loaded frame, or a directory / glob / list of match files, across shards"""
+        if not isinstance(source, pd.DataFrame):
+            loader = FieldingDataLoader(self.registry)
+            source = loader.load_from_directory(source, max_workers=self.max_workers)
+        # Workers only see pickled copies, so identities are resolved here against the one registry
+        shards = self.partition(self.registry.resolve(source))
+        frames = [frame for _, frame in shards]
+
+        if self.max_workers == 1 or len(frames) == 1:
+            _init_worker(self.config)
+            results = [_run_shard(frame) for frame in frames]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(frames)),
+                                     initializer=_init_worker, initargs=(self.config,)) as executor:
+                results = list(executor.map(_run_shard, frames))
+
+        merged = self.reduce(results)
+        merged['shards'] = [key for key, _ in shards]
+        return merged
+
+    def reduce(self, results):
+        """Merge per-shard results into whole-run outputs"""
+        scored = pd.concat([result['scored'] for result in results]).sort_index()
+        rankings = scored.sort_values('performance_score', ascending=False, kind='mergesort')
+
+        totals = sum(result['correlation_stats'] for result in results)
+        recommendations = pd.concat([result['recommendations'] for result in results], ignore_index=True)
+        sort_keys = [key for key in ['season', 'team'] if recommendations[key].notna().any()]
+        if sort_keys:
+            recommendations = recommendations.sort_values(sort_keys, kind='mergesort')
+
+        return {
+            'scored': scored.reset_index(drop=True),
+            'rankings': rankings.reset_index(drop=True),
+            'top_performers': rankings[RANKING_COLUMNS].head(self.top_n).reset_index(drop=True),
+            'correlations': correlations_from_statistics(totals),
+            'recommendations': recommendations.reset_index(drop=True)
+        }
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else "data/raw/"
+    shard_by = sys.argv[2] if len(sys.argv) > 2 else 'team'
+    output = ShardedRunner(shard_by=shard_by).run(source)
+    print(f"✅ Scored {len(output['scored'])} rows across {len(output['shards'])} {shard_by} shard(s)")
+    print(output['top_performers'].to_string(index=False))
@@ -0,0 +1,83 @@
+# src/similarity.py
+import numpy as np
+from sklearn.cluster import KMeans
+from sklearn.neighbors import NearestNeighbors
+from sklearn.preprocessing import StandardScaler
+
+METRIC_FIELDS = ['clean_picks', 'good_throws', 'catches', 'dropped_catches', 'stumpings',
+                 'run_outs', 'missed_run_outs', 'direct_hits', 'runs_saved']
+
+
+class FieldingSimilarityIndex:
+    """Nearest-neighbour index over per-player fielding profiles
+
+    Each profile is a player's (or player-season's) per-match average of the
+    nine fielding metrics, standardized so no single metric dominates distances.
+    """
+
+    def __init__(self, group_by=('player_name', 'season')):
+        self.group_by = list(group_by)
+        self.scaler = StandardScaler()
+        self.index = None
+        self.profiles = None
+        self.vectors = None
+        self.keys = []
+
+    def fit(self, df):
+        keys = [key for key in self.group_by if key in df.columns]
+        grouped = df.groupby(keys, sort=False)
+        profiles = grouped[METRIC_FIELDS].mean()
+        profiles['matches'] = grouped.size()
+        self.profiles = profiles.reset_index()
+        self.keys = keys
+
+        self.vectors = self.scaler.fit_transform(self.profiles[METRIC_FIELDS].to_numpy(dtype=float))
+        self.index = NearestNeighbors(n_jobs=-1).fit(self.vectors)
+        return self
+
+    def query(self, player_name, k=5, **keys):
+        """The k profiles most similar to a player's profile (excluding the player itself)"""
+        mask = self.profiles['player_name'] == player_name
+        for key, value in keys.items():
+            mask &= self.profiles[key] == value
+        positions = np.flatnonzero(mask.to_numpy())
+        if len(positions) == 0:
+            raise KeyError(f"No profile for {player_name} {keys or ''}".strip())
+
+        results = self._neighbours(self.vectors[positions[:1]], k + 1)
+        return results[results.index != positions[0]].head(k).reset_index(drop=True)
+
+    def query_profile(self, metrics, k=5):
+        """The k profiles closest to an arbitrary per-match metric profile"""
+        vector = np.array([[float(metrics.get(field, 0)) for field in METRIC_FIELDS]])
+        return self._neighbours(self.scaler.transform(vector), k).reset_index(drop=True)
+
+    def query_batch(self, profiles, k=5):
+        """k nearest profiles for every row of a per-match metric frame, in one call"""
+        vectors = self.scaler.transform(profiles[METRIC_FIELDS].to_numpy(dtype=float))
+        distances, positions = self.index.kneighbors(vectors, n_neighbors=min(k, len(self.profiles)))
+        return distances, positions
+
+    def _neighbours(self, vector, k):
+        distances, positions = self.index.kneighbors(vector, n_neighbors=min(k, len(self.profiles)))
+        results = self.profiles.iloc[positions[0]].copy()
+        results['distance'] = distances[0]
+        return results
+
+    def cluster(self, n_clusters=4, random_state=42):
+        """Group profiles into fielding archetypes named after each centroid's strongest metric"""
+        model = KMeans(n_clusters=n_clusters, random_state=random_state, n_init=10)
+        labels = model.fit_predict(self.vectors)
+
+        archetypes = {}
+        for cluster_id, centroid in enumerate(model.cluster_centers_):
+            strongest = METRIC_FIELDS[int(np.argmax(centroid))]
+            name = f"{strongest.replace('_', ' ').title()} specialists"
+            if name in archetypes.values():
+                name = f"{name} ({cluster_id})"
+            archetypes[cluster_id] = name
+
+        clustered = self.profiles.copy()
+        clustered['cluster'] = labels
+        clustered['archetype'] = clustered['cluster'].map(archetypes)
+        return clustered
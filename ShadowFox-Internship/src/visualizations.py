@@ -6,8 +6,11 @@ import numpy as np
 import os
 
 class FieldingVisualizer:
-    def __init__(self, save_path="results/visualizations/"):
+    def __init__(self, save_path="results/visualizations/", writer=None, show=True):
         self.save_path = save_path
+        self.writer = writer
+        # Headless callers (report workers) only save figures
+        self.show = show
         self.setup_plot_style()
         
     def setup_plot_style(self):
@@ -18,7 +21,7 @@ class FieldingVisualizer:
         plt.rcParams['savefig.dpi'] = 300
         os.makedirs(self.save_path, exist_ok=True)
     
-    def plot_performance_scores(self, df, save=True):
+    def plot_performance_scores(self, df, save=True, prefix=None):
         fig, ax = plt.subplots(figsize=(12, 8))
         df_sorted = df.sort_values('performance_score', ascending=True)
         
@@ -52,14 +55,14 @@ class FieldingVisualizer:
         plt.tight_layout()
         
         if save:
-            filename = os.path.join(self.save_path, 'performance_scores.png')
-            plt.savefig(filename, bbox_inches='tight', dpi=300)
-            print(f"✅ Saved: {filename}")
+            filename = self._chart_path('performance_scores', prefix)
+            self._save_figure(fig, filename)
         
-        plt.show()
+        if self.show:
+            plt.show()
         return fig
     
-    def plot_positive_negative_contributions(self, df, save=True):
+    def plot_positive_negative_contributions(self, df, save=True, prefix=None):
         fig, ax = plt.subplots(figsize=(14, 8))
         players = df['player_name']
         positive = df['positive_contributions']
@@ -91,14 +94,14 @@ class FieldingVisualizer:
         plt.tight_layout()
         
         if save:
-            filename = os.path.join(self.save_path, 'contributions_analysis.png')
-            plt.savefig(filename, bbox_inches='tight', dpi=300)
-            print(f"✅ Saved: {filename}")
+            filename = self._chart_path('contributions_analysis', prefix)
+            self._save_figure(fig, filename)
         
-        plt.show()
+        if self.show:
+            plt.show()
         return fig
     
-    def plot_runs_saved_analysis(self, df, save=True):
+    def plot_runs_saved_analysis(self, df, save=True, prefix=None):
         fig, ax = plt.subplots(figsize=(12, 8))
         df_sorted = df.sort_values('runs_saved', ascending=True)
         colors = ['red' if x < 0 else 'green' for x in df_sorted['runs_saved']]
@@ -124,14 +127,14 @@ class FieldingVisualizer:
         plt.tight_layout()
         
         if save:
-            filename = os.path.join(self.save_path, 'runs_saved_analysis.png')
-            plt.savefig(filename, bbox_inches='tight', dpi=300)
-            print(f"✅ Saved: {filename}")
+            filename = self._chart_path('runs_saved_analysis', prefix)
+            self._save_figure(fig, filename)
         
-        plt.show()
+        if self.show:
+            plt.show()
         return fig
     
-    def create_correlation_heatmap(self, df, save=True):
+    def create_correlation_heatmap(self, df, save=True, prefix=None):
         numeric_cols = ['clean_picks', 'good_throws', 'catches', 'dropped_catches',
                        'stumpings', 'run_outs', 'missed_run_outs', 'direct_hits',
                        'runs_saved', 'performance_score']
@@ -148,9 +151,21 @@ class FieldingVisualizer:
         plt.tight_layout()
         
         if save:
-            filename = os.path.join(self.save_path, 'correlation_heatmap.png')
-            plt.savefig(filename, bbox_inches='tight', dpi=300)
-            print(f"✅ Saved: {filename}")
+            filename = self._chart_path('correlation_heatmap', prefix)
+            self._save_figure(fig, filename)
         
-        plt.show()
-        return fig
\ No newline at end of file
+        if self.show:
+            plt.show()
+        return fig
+    
+    def _chart_path(self, name, prefix=None):
+        """PNG path for a chart; ``prefix`` (e.g. a match or team) keeps runs from overwriting each other"""
+        return os.path.join(self.save_path, f"{prefix}_{name}.png" if prefix else f"{name}.png")
+    
+    def _save_figure(self, fig, filename):
+        """Save through the shared ResultWriter when available, otherwise directly"""
+        if self.writer is not None:
+            self.writer.write_figure(fig, filename, bbox_inches='tight', dpi=300)
+        else:
+            fig.savefig(filename, bbox_inches='tight', dpi=300)
+        print(f"✅ Saved: {filename}")
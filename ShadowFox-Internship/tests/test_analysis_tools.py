@@ -0,0 +1,112 @@
+"""
+Test cases for analysis tools
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import pandas as pd
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.analysis_tools import FieldingAnalyzer
+from src.recommendation_rules import RecommendationEngine
+
+class TestAnalysisCache(unittest.TestCase):
+    """Test cases for analyzer result memoization"""
+    
+    def setUp(self):
+        df = FieldingDataLoader().create_sample_dataset()
+        self.df_scored = PerformanceCalculator().calculate_all_scores(df)
+        self.analyzer = FieldingAnalyzer(cache_size=4)
+    
+    def test_repeated_calls_hit_cache(self):
+        """Test that repeating an analysis on the same frame is served from the cache"""
+        first = self.analyzer.generate_strategic_recommendations(self.df_scored)
+        second = self.analyzer.generate_strategic_recommendations(self.df_scored.copy())
+        
+        pd.testing.assert_frame_equal(first, second)
+        self.assertEqual(self.analyzer.cache_info()['hits'], 1)
+        self.assertEqual(self.analyzer.cache_info()['misses'], 1)
+    
+    def test_nested_calls_share_cache(self):
+        """Test that insights reuse a top performers result computed earlier"""
+        self.analyzer.identify_top_performers(self.df_scored, 3)
+        self.analyzer.generate_performance_insights(self.df_scored)
+        
+        self.assertEqual(self.analyzer.cache_hits, 1)
+    
+    def test_data_change_invalidates(self):
+        """Test that changing a relevant column produces a fresh result"""
+        before = self.analyzer.identify_top_performers(self.df_scored, 1)
+        changed = self.df_scored.copy()
+        changed.loc[changed['player_name'] == 'Phil Salt', 'performance_score'] = 50
+        after = self.analyzer.identify_top_performers(changed, 1)
+        
+        self.assertNotEqual(before['player_name'].iloc[0], after['player_name'].iloc[0])
+        self.assertEqual(self.analyzer.cache_hits, 0)
+    
+    def test_cached_results_are_isolated(self):
+        """Test that mutating a returned result does not corrupt the cache"""
+        insights = self.analyzer.generate_performance_insights(self.df_scored)
+        insights.clear()
+        
+        self.assertGreater(len(self.analyzer.generate_performance_insights(self.df_scored)), 0)
+    
+    def test_lru_eviction(self):
+        """Test that the cache never grows past its configured size"""
+        for n in range(1, 8):
+            self.analyzer.identify_top_performers(self.df_scored, n)
+        
+        self.assertEqual(self.analyzer.cache_info()['size'], 4)
+
+class TestRecommendationRules(unittest.TestCase):
+    """Test cases for the declarative recommendation engine"""
+    
+    def setUp(self):
+        df = FieldingDataLoader().create_sample_dataset()
+        self.df_scored = PerformanceCalculator().calculate_all_scores(df)
+        self.analyzer = FieldingAnalyzer()
+    
+    def test_default_rules_reproduce_team_recommendations(self):
+        """Test that the default rule set gives the original three team recommendations"""
+        recommendations = self.analyzer.generate_strategic_recommendations(self.df_scored)
+        
+        self.assertEqual(list(recommendations['type']), ['Team Training', 'Technical Training', 'Foundation'])
+        self.assertEqual(recommendations['rationale'].iloc[0], '2 catches dropped affecting team performance')
+        self.assertEqual(recommendations['rationale'].iloc[1], '2 players conceded runs')
+    
+    def test_every_team_in_one_pass(self):
+        """Test that a multi-team frame yields recommendations per team"""
+        clean_team = self.df_scored.assign(team='Clean XI', dropped_catches=0, runs_saved=1)
+        season = pd.concat([self.df_scored, clean_team], ignore_index=True)
+        recommendations = self.analyzer.generate_all_recommendations(season)
+        team_level = recommendations[recommendations['level'] == 'team']
+        
+        self.assertEqual(set(team_level['team']), {'Delhi Capitals', 'Clean XI'})
+        self.assertEqual(list(team_level[team_level['team'] == 'Clean XI']['type']), ['Foundation'])
+        
+        strategic = self.analyzer.generate_strategic_recommendations(season)
+        self.assertEqual(list(strategic.columns[:1]), ['team'])
+        self.assertFalse(strategic.duplicated().any())
+        self.assertEqual(list(strategic[strategic['team'] == 'Clean XI']['type']), ['Foundation'])
+    
+    def test_custom_player_rule(self):
+        """Test a custom player-level rule with formatted text"""
+        engine = RecommendationEngine([{
+            'level': 'player', 'condition': 'catches >= 2', 'type': 'Recognition',
+            'priority': 'Low', 'recommendation': 'Praise {player_name}',
+            'rationale': '{catches} catches taken'
+        }])
+        recommendations = engine.evaluate(self.df_scored)
+        
+        self.assertEqual(list(recommendations['recommendation']), ['Praise Yash Dhull'])
+        self.assertEqual(recommendations['rationale'].iloc[0], '2 catches taken')
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
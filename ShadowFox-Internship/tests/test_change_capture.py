@@ -0,0 +1,140 @@
+"""
+Test cases for change data capture and selective recomputation
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import tempfile
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.fielding_store import FieldingStore
+from src.change_capture import IncrementalRecomputer
+from src.report_generator import ReportGenerator
+
+TEAMS = ['Delhi Capitals', 'Mumbai Indians']
+
+class TestChangeCapture(unittest.TestCase):
+    """Test cases for input diffing and incremental recomputation"""
+    
+    def setUp(self):
+        """Build a season of 40 matches for two teams"""
+        base = FieldingDataLoader().create_sample_dataset()
+        rng = np.random.default_rng(4)
+        matches = []
+        for i in range(40):
+            match_df = base.copy()
+            match_df['match_no'] = f"IPL{2367 + i}"
+            match_df['season'] = 2024
+            match_df['team'] = TEAMS[i % 2]
+            match_df['catches'] = rng.integers(0, 3, len(base))
+            match_df['dropped_catches'] = rng.integers(0, 2, len(base))
+            match_df['runs_saved'] = rng.integers(-4, 6, len(base))
+            matches.append(match_df)
+        self.season = pd.concat(matches, ignore_index=True)
+        self.loader = FieldingDataLoader()
+        
+        # A corrected file for one match: one changed row, one removed, one added
+        match = self.season[self.season['match_no'] == 'IPL2370'].copy()
+        match.loc[match['player_name'] == 'Phil Salt', 'dropped_catches'] = 3
+        match = match[match['player_name'] != 'Aman Khan']
+        substitute = match.iloc[[0]].assign(player_name='Ripal Patel')
+        self.correction = pd.concat([match, substitute], ignore_index=True)
+        
+        self.corrected_season = pd.concat(
+            [self.season[self.season['match_no'] != 'IPL2370'], self.correction], ignore_index=True)
+    
+    def test_diff_inputs_by_row_hash(self):
+        """Test that only the corrected keys are reported"""
+        changes = self.loader.diff_inputs(self.correction, self.season)
+        by_change = dict(zip(changes['change'], changes['player_name']))
+        
+        self.assertEqual(len(changes), 3)
+        self.assertEqual(by_change, {'modified': 'Phil Salt', 'removed': 'Aman Khan',
+                                     'added': 'Ripal Patel'})
+    
+    def test_diff_against_saved_snapshot(self):
+        """Test diffing against persisted row hashes"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.loader.processed_data_path = temp_dir
+            self.loader.save_input_snapshot(self.season)
+            changes = self.loader.diff_inputs(self.correction, self.loader.load_input_snapshot())
+        
+        self.assertEqual(sorted(changes['change']), ['added', 'modified', 'removed'])
+    
+    def test_selective_recompute_matches_full_rebuild(self):
+        """Test that applying a correction equals rebuilding from the corrected season"""
+        incremental = IncrementalRecomputer().build(self.season)
+        report = incremental.apply(self.correction)
+        full = IncrementalRecomputer().build(self.corrected_season)
+        
+        self.assertEqual((report['added'], report['modified'], report['removed']), (1, 1, 1))
+        self.assertEqual(report['matches'], ['IPL2370'])
+        self.assertEqual(report['teams'], [{'season': 2024, 'team': 'Mumbai Indians'}])
+        
+        pd.testing.assert_frame_equal(incremental.scored.sort_index(), full.scored.sort_index())
+        pd.testing.assert_frame_equal(incremental.recommendations, full.recommendations)
+        for level, table in full.cube.levels.items():
+            pd.testing.assert_frame_equal(incremental.cube.levels[level].sort_index(), table.sort_index(),
+                                          check_dtype=False)
+    
+    def test_name_variants_in_corrections(self):
+        """Test that a corrected file using name variants diffs against the canonical rows"""
+        variants = self.correction.replace({'player_name': {'Phil Salt': 'Philip Salt',
+                                                            'Rilee Russouw': 'R Russouw'}})
+        incremental = IncrementalRecomputer().build(self.season)
+        report = incremental.apply(variants)
+        full = IncrementalRecomputer().build(self.corrected_season)
+        
+        self.assertEqual((report['added'], report['modified'], report['removed']), (1, 1, 1))
+        self.assertIn('player_id', incremental.scored.columns)
+        pd.testing.assert_frame_equal(incremental.scored.sort_index(), full.scored.sort_index())
+    
+    def test_store_rows_follow_corrections(self):
+        """Test that the store drops removed rows and replaces corrected ones"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = FieldingStore(os.path.join(temp_dir, 'store.db'))
+            IncrementalRecomputer(store=store).build(self.season).apply(self.correction)
+            rows = store.query("SELECT player_name, dropped_catches FROM scored_fielding "
+                               "WHERE match_no = 'IPL2370'")
+            store.close()
+        
+        players = dict(zip(rows['player_name'], rows['dropped_catches']))
+        self.assertNotIn('Aman Khan', players)
+        self.assertIn('Ripal Patel', players)
+        self.assertEqual(players['Phil Salt'], 3)
+    
+    def test_reports_and_charts_follow_corrections(self):
+        """Test that only the corrected team's report and charts are redrawn"""
+        season = self.season[self.season['match_no'].isin(['IPL2367', 'IPL2368', 'IPL2369', 'IPL2370'])]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            chart_dir = os.path.join(temp_dir, 'charts')
+            generator = ReportGenerator(os.path.join(temp_dir, 'reports'), chart_dir, max_workers=1)
+            recomputer = IncrementalRecomputer(report_generator=generator).build(season)
+            self.assertTrue(os.path.exists(os.path.join(chart_dir, 'delhi_capitals_performance_scores.png')))
+            
+            for filename in os.listdir(chart_dir):
+                os.remove(os.path.join(chart_dir, filename))
+            report = recomputer.apply(self.correction)
+            redrawn = sorted(os.listdir(chart_dir))
+        
+        self.assertEqual(list(report['reports']), ['Mumbai Indians'])
+        self.assertEqual(len(redrawn), 4)
+        self.assertTrue(all(filename.startswith('mumbai_indians_') for filename in redrawn))
+    
+    def test_unchanged_input_is_a_no_op(self):
+        recomputer = IncrementalRecomputer().build(self.season)
+        report = recomputer.apply(self.season[self.season['match_no'] == 'IPL2380'])
+        
+        self.assertEqual((report['added'], report['modified'], report['removed']), (0, 0, 0))
+        self.assertEqual(report['teams'], [])
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
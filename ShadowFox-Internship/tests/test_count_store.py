@@ -0,0 +1,105 @@
+"""
+Test cases for the memory-mapped count matrix store
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import pickle
+import tempfile
+import numpy as np
+import pandas as pd
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.count_store import CountMatrixStore, write_count_store
+
+def _catch_total(store):
+    return int(store.column('catches').sum())
+
+class TestCountMatrixStore(unittest.TestCase):
+    """Test cases for writing, memory-mapping and sharing count stores"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.temp_dir.name, 'count_store')
+        self.loader = FieldingDataLoader()
+        self.df = self.loader.create_sample_dataset()
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_round_trip(self):
+        """Test that the store reproduces the loader frame"""
+        store = self.loader.load_count_store(self.loader.save_count_store(self.df, self.directory))
+        frame = store.to_frame()
+        
+        self.assertEqual(store.counts.dtype, np.int16)
+        self.assertIsInstance(store.counts, np.memmap)
+        pd.testing.assert_frame_equal(frame, self.df[frame.columns], check_dtype=False)
+    
+    def test_scores_match_calculator(self):
+        """Test that matrix scoring equals PerformanceCalculator"""
+        store = CountMatrixStore(write_count_store(self.df, self.directory))
+        calculator = PerformanceCalculator()
+        expected = calculator.calculate_all_scores(self.df)['performance_score']
+        
+        np.testing.assert_array_equal(store.scores(calculator.weights), expected)
+    
+    def test_masks_use_id_arrays(self):
+        """Test player and team selections"""
+        store = CountMatrixStore(write_count_store(self.df, self.directory))
+        
+        self.assertEqual(store.mask(player='Axar Patel').sum(), 1)
+        self.assertEqual(store.mask(team='Delhi Capitals').sum(), 7)
+        with self.assertRaises(KeyError):
+            store.mask(team='Unknown XI')
+    
+    def test_out_of_range_counts_rejected(self):
+        df = self.df.copy()
+        df.loc[0, 'runs_saved'] = 40000
+        with self.assertRaises(ValueError):
+            write_count_store(df, self.directory)
+    
+    def test_fractional_counts_rejected(self):
+        """Test that values int16 would truncate are refused and leave the old store untouched"""
+        write_count_store(self.df, self.directory)
+        df = self.df.copy()
+        df['catches'] = df['catches'].astype(float)
+        df.loc[0, 'catches'] = 1.5
+        with self.assertRaises(ValueError):
+            write_count_store(df, self.directory)
+        
+        store = CountMatrixStore(self.directory)
+        self.assertEqual(store.column('catches').sum(), self.df['catches'].sum())
+    
+    def test_rewrite_replaces_whole_directory(self):
+        """Test that a rewrite swaps in a complete store and leaves no staging directories"""
+        write_count_store(self.df, self.directory)
+        smaller = self.df.iloc[:3]
+        store = CountMatrixStore(write_count_store(smaller, self.directory))
+        
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store.manifest['rows'], 3)
+        self.assertEqual(os.listdir(self.temp_dir.name), ['count_store'])
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         ['counts.npy', 'dictionaries.json', 'manifest.json', 'match_ids.npy',
+                          'player_ids.npy', 'team_ids.npy'])
+    
+    def test_shared_with_worker_processes(self):
+        """Test that stores pickle by path and reopen in workers"""
+        store = CountMatrixStore(write_count_store(self.df, self.directory))
+        self.assertLess(len(pickle.dumps(store)), 500)
+        
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            totals = list(executor.map(_catch_total, [store, store]))
+        self.assertEqual(totals, [self.df['catches'].sum()] * 2)
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,150 @@
+"""
+Test cases for multi-file data ingestion
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import tempfile
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader, CANONICAL_COLUMNS
+
+class TestDataIngestion(unittest.TestCase):
+    """Test cases for loading directories of match files"""
+    
+    def setUp(self):
+        """Write a small season folder of match files"""
+        self.loader = FieldingDataLoader()
+        self.df = self.loader.create_sample_dataset()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        
+        for i, match_no in enumerate(['IPL2367', 'IPL2368', 'IPL2369']):
+            match_df = self.df.copy()
+            match_df['match_no'] = match_no
+            match_df.to_csv(os.path.join(self.temp_dir.name, f"match_{i}.csv"), index=False)
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_directory_loading(self):
+        """Test that all match files are concatenated in file order"""
+        df = self.loader.load_from_directory(self.temp_dir.name, max_workers=2)
+        
+        self.assertEqual(len(df), 21)
+        self.assertEqual(list(df['match_no'].unique()), ['IPL2367', 'IPL2368', 'IPL2369'])
+        self.assertEqual(self.loader.load_failures, [])
+    
+    def test_header_normalization(self):
+        """Test that header variants are mapped to the canonical schema"""
+        renamed = self.df.rename(columns={'player_name': 'Player', 'match_no': 'Match ID'})
+        renamed = renamed.drop(columns=['stumpings'])
+        renamed.to_csv(os.path.join(self.temp_dir.name, "variant.csv"), index=False)
+        
+        df = self.loader.load_from_directory(os.path.join(self.temp_dir.name, "variant.csv"))
+        
+        self.assertEqual(list(df.columns[:len(CANONICAL_COLUMNS)]), CANONICAL_COLUMNS)
+        self.assertTrue((df['stumpings'] == 0).all())
+    
+    def _write_workbook(self, filename):
+        """Write one sheet per match, with a renamed player header"""
+        from openpyxl import Workbook
+        workbook = Workbook(write_only=True)
+        for match_no in ['IPL2367', 'IPL2368']:
+            sheet = workbook.create_sheet(match_no)
+            match_df = self.df.rename(columns={'player_name': 'Player'})
+            match_df['match_no'] = match_no
+            sheet.append(list(match_df.columns))
+            for row in match_df.itertuples(index=False):
+                sheet.append(list(row))
+        filepath = os.path.join(self.temp_dir.name, filename)
+        workbook.save(filepath)
+        return filepath
+    
+    def test_excel_multi_sheet_loading(self):
+        """Test that every sheet of a workbook is loaded into the canonical schema"""
+        filepath = self._write_workbook("season.xlsx")
+        df = self.loader.load_from_excel(filepath, max_workers=2)
+        
+        self.assertEqual(len(df), 14)
+        self.assertEqual(list(df['source_sheet'].unique()), ['IPL2367', 'IPL2368'])
+        self.assertEqual(df['catches'].sum(), 2 * self.df['catches'].sum())
+        self.assertIn('player_name', df.columns)
+    
+    def test_excel_sheet_and_column_selection(self):
+        """Test loading selected sheets and columns only"""
+        filepath = self._write_workbook("season.xlsx")
+        df = self.loader.load_from_excel(filepath, sheets=['IPL2368'],
+                                         columns=['Player', 'catches'])
+        
+        self.assertEqual(list(df.columns), ['player_name', 'catches', 'source_sheet'])
+        self.assertEqual(len(df), 7)
+    
+    def test_excel_missing_columns_reported(self):
+        """Test that requested columns absent from a sheet are reported, including on errors"""
+        filepath = self._write_workbook("season.xlsx")
+        df = self.loader.load_from_excel(filepath, columns=['Player', 'catches', 'Boundary Saves'])
+        
+        self.assertNotIn('boundary_saves', df.columns)
+        self.assertEqual(self.loader.missing_columns, {'IPL2367': ['boundary_saves'],
+                                                       'IPL2368': ['boundary_saves']})
+        
+        empty = self.loader.load_from_excel(os.path.join(self.temp_dir.name, "missing.xlsx"),
+                                            columns=['Player', 'drops'])
+        self.assertEqual(list(empty.columns), ['player_name', 'dropped_catches'])
+    
+    def test_excel_clashing_headers_rejected(self):
+        """Test that two headers mapping to one canonical column fail the sheet instead of merging"""
+        from openpyxl import Workbook
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet('IPL2367')
+        sheet.append(['Player', 'Name', 'catches'])
+        sheet.append(['Phil Salt', 'P Salt', 1])
+        filepath = os.path.join(self.temp_dir.name, "clash.xlsx")
+        workbook.save(filepath)
+        
+        df = self.loader.load_from_excel(filepath)
+        self.assertEqual(len(df), 0)
+        self.assertIn("both map to 'player_name'", self.loader.load_failures[0]['error'])
+        # Selecting columns that avoid the clash still loads
+        df = self.loader.load_from_excel(filepath, columns=['catches'])
+        self.assertEqual(list(df['catches']), [1])
+    
+    def test_excel_chunks_streamed(self):
+        """Test that workbook rows can be consumed chunk by chunk without concatenation"""
+        filepath = self._write_workbook("season.xlsx")
+        chunks = list(self.loader.iter_excel_chunks(filepath, chunk_rows=3))
+        
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1, 3, 3, 1])
+        self.assertTrue(all(list(chunk.columns[:len(CANONICAL_COLUMNS)]) == CANONICAL_COLUMNS
+                            for chunk in chunks))
+        self.assertEqual(sum(chunk['catches'].sum() for chunk in chunks), 2 * self.df['catches'].sum())
+        with self.assertRaises(ValueError):
+            list(self.loader.iter_excel_chunks(filepath, sheets=['IPL9999']))
+    
+    def test_default_workbook(self):
+        """Test that the bundled raw workbook loads with the default path"""
+        loader = FieldingDataLoader()
+        loader.raw_data_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw')
+        df = loader.load_from_excel()
+        
+        self.assertEqual(loader.load_failures, [])
+        self.assertEqual(len(df), 7)
+    
+    def test_failures_reported(self):
+        """Test that unreadable files are reported rather than replaced by sample data"""
+        with open(os.path.join(self.temp_dir.name, "broken.xlsx"), 'w') as f:
+            f.write("not a workbook")
+        
+        df = self.loader.load_from_directory(self.temp_dir.name, max_workers=1)
+        
+        self.assertEqual(len(df), 21)
+        self.assertEqual(len(self.loader.load_failures), 1)
+        self.assertTrue(self.loader.load_failures[0]['file'].endswith("broken.xlsx"))
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,92 @@
+"""
+Test cases for ball-by-ball event ingestion
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import tempfile
+import pandas as pd
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader, CANONICAL_COLUMNS
+from src.performance_calculator import PerformanceCalculator
+from src.event_ingestion import EventAggregator, EVENT_TYPE_MAP
+
+def explode_to_events(df):
+    """Turn aggregated sample counts back into one row per fielding event"""
+    events = []
+    reverse = {column: event for event, (column, sign) in EVENT_TYPE_MAP.items() if sign == 1}
+    for _, player in df.iterrows():
+        base = {key: player[key] for key in ['player_name', 'match_no', 'innings',
+                                             'team', 'player_role', 'venue']}
+        for column, event_type in reverse.items():
+            if column == 'runs_saved':
+                if player['runs_saved'] != 0:
+                    event_type = 'runs_saved' if player['runs_saved'] > 0 else 'runs_conceded'
+                    events.append(dict(base, event_type=event_type, runs=abs(player['runs_saved'])))
+                continue
+            events.extend(dict(base, event_type=event_type, runs=None) for _ in range(player[column]))
+    return pd.DataFrame(events)
+
+class TestEventIngestion(unittest.TestCase):
+    """Test cases for aggregating events into fielding counts"""
+    
+    def setUp(self):
+        self.loader = FieldingDataLoader()
+        self.df = self.loader.create_sample_dataset()
+        self.events = explode_to_events(self.df)
+    
+    def test_chunked_aggregation_reproduces_counts(self):
+        """Test that events streamed in small chunks aggregate back to the sample counts"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "events.csv")
+            self.events.sample(frac=1, random_state=1).to_csv(path, index=False)
+            df = EventAggregator().ingest_csv(path, chunksize=5).to_frame()
+        
+        self.assertEqual(list(df.columns), CANONICAL_COLUMNS)
+        df = df.set_index('player_name').loc[self.df['player_name']].reset_index()
+        pd.testing.assert_frame_equal(df[CANONICAL_COLUMNS], self.df[CANONICAL_COLUMNS],
+                                      check_dtype=False)
+    
+    def test_aggregated_frame_scores(self):
+        """Test that the aggregated frame feeds straight into PerformanceCalculator"""
+        aggregator = EventAggregator().ingest_records(self.events.to_dict('records'))
+        scored = PerformanceCalculator().calculate_all_scores(aggregator.to_frame())
+        expected = PerformanceCalculator().calculate_all_scores(self.df)
+        
+        self.assertEqual(sorted(scored['performance_score']), sorted(expected['performance_score']))
+    
+    def test_single_events_and_unknown_types(self):
+        """Test live single-event updates and reporting of unmapped event types"""
+        aggregator = EventAggregator()
+        aggregator.add_event('Phil Salt', 'IPL2367', 1, 'stumping')
+        aggregator.add_event('Phil Salt', 'IPL2367', 1, 'runs_conceded', runs=4)
+        aggregator.add_event('Phil Salt', 'IPL2367', 1, 'relay_throw')
+        
+        row = aggregator.to_frame().iloc[0]
+        self.assertEqual(row['stumpings'], 1)
+        self.assertEqual(row['runs_saved'], -4)
+        self.assertEqual(aggregator.unknown_events, {'relay_throw': 1})
+
+    def test_events_without_key_are_rejected(self):
+        """Test that events missing innings or player are counted as incomplete, not processed"""
+        events = self.events.copy()
+        events.loc[:2, 'innings'] = None
+        events.loc[3, 'player_name'] = None
+        aggregator = EventAggregator()
+        aggregator.add_events(events)
+        aggregator.add_event('Phil Salt', 'IPL2367', None, 'catch')
+        
+        self.assertEqual(aggregator.incomplete_events, 5)
+        self.assertEqual(aggregator.events_processed, len(events) - 4)
+        keyed = EventAggregator()
+        keyed.add_events(events.dropna(subset=['player_name', 'innings']))
+        pd.testing.assert_frame_equal(aggregator.to_frame(), keyed.to_frame())
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
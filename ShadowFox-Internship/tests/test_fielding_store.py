@@ -0,0 +1,74 @@
+"""
+Test cases for the embedded analytical store
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.analysis_tools import FieldingAnalyzer
+from src.fielding_store import FieldingStore
+
+class TestFieldingStore(unittest.TestCase):
+    """Test cases for storing and querying scored fielding data"""
+    
+    def setUp(self):
+        """Store two seasons of the sample match"""
+        df = FieldingDataLoader().create_sample_dataset()
+        self.df_scored = PerformanceCalculator().calculate_all_scores(df)
+        self.store = FieldingStore(":memory:")
+        self.store.insert_scored(self.df_scored, season=2023)
+        self.store.insert_scored(self.df_scored, season=2024)
+        self.analyzer = FieldingAnalyzer(store=self.store)
+    
+    def tearDown(self):
+        self.store.close()
+    
+    def test_insert_is_idempotent(self):
+        """Test that re-inserting a match replaces rather than duplicates rows"""
+        self.store.insert_scored(self.df_scored, season=2024)
+        count = self.store.query("SELECT COUNT(*) AS n FROM scored_fielding")['n'].iloc[0]
+        self.assertEqual(count, 14)
+    
+    def test_top_performers_pushdown(self):
+        """Test that store top performers match the in-memory analyzer"""
+        expected = self.analyzer.identify_top_performers(self.df_scored, 3)
+        result = self.analyzer.query_top_performers(3, season=2024)
+        
+        self.assertEqual(sorted(result['performance_score']), sorted(expected['performance_score']))
+    
+    def test_team_summary(self):
+        """Test team aggregates across seasons"""
+        summary = self.analyzer.query_team_summary()
+        
+        self.assertEqual(len(summary), 1)
+        self.assertEqual(summary['total_catches'].iloc[0], 2 * self.df_scored['catches'].sum())
+        self.assertAlmostEqual(summary['average_score'].iloc[0], self.df_scored['performance_score'].mean())
+    
+    def test_invalid_filter_rejected(self):
+        """Test that only known columns can be used as filters"""
+        with self.assertRaises(ValueError):
+            self.store.top_performers(3, performance_score=10)
+
+    def test_missing_innings_and_match(self):
+        """Test that NaN innings default to 1 and rows without a match are rejected"""
+        df = self.df_scored.copy()
+        df['innings'] = float('nan')
+        df['match_no'] = 'IPL2400'
+        self.store.insert_scored(df, season=2024)
+        innings = self.store.query("SELECT DISTINCT innings FROM scored_fielding WHERE match_no = 'IPL2400'")
+        self.assertEqual(list(innings['innings']), [1])
+        
+        df.loc[0, 'match_no'] = None
+        with self.assertRaises(ValueError):
+            self.store.insert_scored(df, season=2024)
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,85 @@
+"""
+Test cases for rolling form metrics
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.form_metrics import FormTracker
+
+class TestFormMetrics(unittest.TestCase):
+    """Test cases for season form and incremental updates"""
+    
+    def setUp(self):
+        """Build a six-match season from the sample match with varied counts"""
+        base = FieldingDataLoader().create_sample_dataset()
+        rng = np.random.default_rng(7)
+        matches = []
+        for i in range(6):
+            match_df = base.copy()
+            match_df['match_no'] = f"IPL{2367 + i}"
+            match_df['match_date'] = pd.Timestamp('2024-04-01') + pd.Timedelta(days=3 * i)
+            match_df['dropped_catches'] = rng.integers(0, 2, len(base))
+            match_df['catches'] = rng.integers(0, 3, len(base))
+            matches.append(match_df)
+        self.season = PerformanceCalculator().calculate_all_scores(pd.concat(matches, ignore_index=True))
+    
+    def test_rolling_average_matches_manual(self):
+        """Test last-N average against a direct per-player calculation"""
+        form = FormTracker(window=3).compute_form(self.season)
+        player = form[form['player_name'] == 'Axar Patel']
+        expected = player['performance_score'].rolling(3, min_periods=1).mean()
+        
+        np.testing.assert_allclose(player['form_avg_3'], expected)
+    
+    def test_clean_streak_resets_on_drop(self):
+        """Test that the no-drop streak restarts after a dropped catch"""
+        form = FormTracker().compute_form(self.season)
+        for _, player in form.groupby('player_name'):
+            streak = 0
+            for dropped, value in zip(player['dropped_catches'], player['clean_streak']):
+                streak = streak + 1 if dropped == 0 else 0
+                self.assertEqual(value, streak)
+    
+    def test_incremental_update_matches_full_recompute(self):
+        """Test that adding matches one at a time gives the same form as a full pass"""
+        full = FormTracker(window=3).compute_form(self.season)
+        
+        tracker = FormTracker(window=3)
+        tracker.compute_form(self.season[self.season['match_no'] < 'IPL2370'])
+        updated = [tracker.update(match_df) for match_no, match_df
+                   in self.season[self.season['match_no'] >= 'IPL2370'].groupby('match_no')]
+        incremental = pd.concat(updated, ignore_index=True)
+        
+        expected = full[full['match_no'] >= 'IPL2370'].reset_index(drop=True)
+        for column in ['form_avg_3', 'form_ewm', 'clean_streak']:
+            np.testing.assert_allclose(incremental[column], expected[column])
+    
+    def test_season_without_dates_ordered_by_match(self):
+        """Test that undated rows are ordered by match number and innings, not by input order"""
+        season = self.season.drop(columns='match_date')
+        # 'IPL998' < 'IPL1003' only when compared numerically
+        season['match_no'] = season['match_no'].str[3:].astype(int).sub(1369).map(lambda n: f"IPL{n}")
+        shuffled = season.sample(frac=1, random_state=3)
+        
+        # Rows within a match stay shuffled, so compare each player's sequence of matches
+        dated = FormTracker(window=3).compute_form(self.season).sort_values('player_name', kind='mergesort')
+        undated = FormTracker(window=3).compute_form(shuffled).sort_values('player_name', kind='mergesort')
+        for column in ['form_avg_3', 'form_ewm', 'clean_streak']:
+            np.testing.assert_allclose(undated[column], dated[column])
+        
+        with self.assertRaises(ValueError):
+            FormTracker().compute_form(season.drop(columns='match_no'))
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
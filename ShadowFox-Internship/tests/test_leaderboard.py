@@ -0,0 +1,115 @@
+"""
+Test cases for the paged leaderboard query API
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.leaderboard import Leaderboard
+
+class TestLeaderboard(unittest.TestCase):
+    """Test cases for filters, sort keys and cursor pagination"""
+
+    def setUp(self):
+        """Score two seasons of matches across two teams and three venues"""
+        base = FieldingDataLoader().create_sample_dataset()
+        rng = np.random.default_rng(4)
+        matches = []
+        for i in range(12):
+            match_df = base.copy()
+            match_df['match_no'] = f"IPL{2367 + i}"
+            match_df['season'] = 2023 + i // 6
+            match_df['team'] = ['Delhi Capitals', 'Mumbai Indians'][i % 2]
+            match_df['venue'] = ['Delhi', 'Mumbai', 'Chennai'][i % 3]
+            match_df['catches'] = rng.integers(0, 3, len(base))
+            match_df['runs_saved'] = rng.integers(-3, 5, len(base))
+            matches.append(match_df)
+        self.df_scored = PerformanceCalculator().calculate_all_scores(pd.concat(matches, ignore_index=True))
+        self.board = Leaderboard(page_size=5).fit(self.df_scored)
+
+    def collect(self, **query):
+        return pd.concat(list(self.board.pages(**query)), ignore_index=True)
+
+    def test_pages_follow_full_sort(self):
+        """Test that concatenated pages equal a stable sort of the whole frame"""
+        rows = self.collect()
+        expected = self.df_scored.sort_values('performance_score', ascending=False, kind='mergesort')
+
+        self.assertEqual(list(rows['player_name']), list(expected['player_name']))
+        self.assertEqual(list(rows['rank']), list(range(1, len(expected) + 1)))
+
+    def test_filters_and_sort_keys(self):
+        """Test filter pushdown and alternate sort keys against pandas filtering"""
+        rows = self.collect(sort='runs_saved', team='Mumbai Indians', venue='Chennai', season=2024)
+        expected = self.df_scored[(self.df_scored['team'] == 'Mumbai Indians') &
+                                  (self.df_scored['venue'] == 'Chennai') & (self.df_scored['season'] == 2024)]
+
+        self.assertEqual(len(rows), len(expected))
+        self.assertEqual(list(rows['runs_saved']), sorted(expected['runs_saved'], reverse=True))
+
+        ascending = self.collect(sort='efficiency_ratio', ascending=True, player_role=['Bowler', 'Batsman'])
+        roles = self.df_scored[self.df_scored['player_role'].isin(['Bowler', 'Batsman'])]
+        self.assertEqual(list(ascending['efficiency_ratio']), sorted(roles['efficiency_ratio']))
+
+    def test_driving_filter_not_rechecked(self):
+        """Test that the posting list a query walks is not also applied as a row check"""
+        candidates, checks = self.board._filter_plan('score', {'team': 'Mumbai Indians', 'venue': 'Chennai'})
+
+        self.assertEqual(len(checks), 1)
+        self.assertEqual(set(self.df_scored.loc[candidates, 'venue']), {'Chennai'})
+        _, checks = self.board._filter_plan('score', {'season': 2024})
+        self.assertEqual(checks, [])
+
+    def test_min_matches(self):
+        """Test that players below the match threshold are excluded"""
+        df = self.df_scored.iloc[6:].copy()
+        board = Leaderboard().fit(df)
+        rows = pd.concat(list(board.pages(min_matches=12)), ignore_index=True)
+
+        counts = df.groupby('player_name')['match_no'].nunique()
+        self.assertEqual(set(rows['player_name']), set(counts[counts >= 12].index))
+        self.assertTrue((rows['matches_played'] >= 12).all())
+
+    def test_cursor_validation(self):
+        """Test that cursors are tied to their query and to the fitted data"""
+        first = self.board.query(team='Delhi Capitals')
+        self.assertEqual(len(first['rows']), 5)
+
+        second = self.board.query(team='Delhi Capitals', cursor=first['next_cursor'])
+        self.assertEqual(second['rows']['rank'].iloc[0], 6)
+
+        with self.assertRaises(ValueError):
+            self.board.query(team='Mumbai Indians', cursor=first['next_cursor'])
+        with self.assertRaises(ValueError):
+            self.board.query(city='Delhi')
+
+        # Refitting the same rows keeps cursors valid; a board over other rows rejects them
+        self.board.fit(self.df_scored)
+        self.assertEqual(len(self.board.query(team='Delhi Capitals', cursor=first['next_cursor'])['rows']), 5)
+        other = Leaderboard(page_size=5).fit(self.df_scored.iloc[1:])
+        with self.assertRaises(ValueError):
+            other.query(team='Delhi Capitals', cursor=first['next_cursor'])
+
+    def test_filter_values_match_column_dtype(self):
+        """Test that filters compare as the column's dtype, e.g. int seasons against float ones"""
+        df = self.df_scored.assign(season=self.df_scored['season'].astype(float))
+        df.loc[0, 'season'] = np.nan
+        board = Leaderboard(page_size=5).fit(df)
+        expected = (df['season'] == 2023).sum()
+
+        for season in [2023, 2023.0, '2023', [2023, 2030]]:
+            rows = pd.concat(list(board.pages(season=season, team=['Delhi Capitals', 'Mumbai Indians'])))
+            self.assertEqual(len(rows), expected)
+        self.assertEqual(len(board.query(season=2023.5)['rows']), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Test cases for the live in-match scoring service
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import json
+import pandas as pd
+import threading
+import urllib.error
+import urllib.request
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.live_scoring import LiveScoreBoard, create_server
+from tests.test_event_ingestion import explode_to_events
+
+class TestLiveScoring(unittest.TestCase):
+    """Test cases for incremental score updates"""
+    
+    def setUp(self):
+        self.df = FieldingDataLoader().create_sample_dataset()
+        self.expected = PerformanceCalculator().calculate_all_scores(self.df).set_index('player_name')
+        events = explode_to_events(self.df).sample(frac=1, random_state=3)
+        self.events = [{'player_name': e['player_name'], 'event_type': e['event_type'],
+                        'runs': int(e['runs']) if pd.notna(e['runs']) else 1,
+                        'team': e['team'], 'player_role': e['player_role']}
+                       for e in events.to_dict('records')]
+    
+    def test_incremental_scores_match_batch(self):
+        """Test that applying events one by one matches calculate_all_scores"""
+        board = LiveScoreBoard()
+        for event in self.events:
+            board.apply_event(**event)
+        
+        live = board.to_frame().set_index('player_name')
+        for column in ['performance_score', 'positive_contributions',
+                       'negative_contributions', 'net_contribution', 'efficiency_ratio']:
+            for player in self.expected.index:
+                self.assertAlmostEqual(live.loc[player, column], self.expected.loc[player, column],
+                                       msg=f"{column} for {player}")
+    
+    def test_runs_crossing_zero(self):
+        """Test contributions when a player's runs saved moves from negative to positive"""
+        board = LiveScoreBoard()
+        board.apply_event('Phil Salt', 'runs_conceded', runs=2)
+        update = board.apply_event('Phil Salt', 'runs_saved', runs=3)
+        
+        self.assertEqual(update['performance_score'], 1)
+        self.assertEqual(update['positive_contributions'], 1)
+        self.assertEqual(update['negative_contributions'], 0)
+    
+    def test_leaderboard_kept_in_score_order(self):
+        """Test that the ranking follows every event and reads return independent copies"""
+        board = LiveScoreBoard()
+        for event in self.events:
+            board.apply_event(**event)
+        
+        ranked = board.leaderboard()
+        expected = sorted(self.expected['performance_score'], reverse=True)
+        self.assertEqual(list(ranked['performance_score']), expected)
+        ranked.loc[0, 'performance_score'] = -100
+        self.assertNotEqual(board.leaderboard().loc[0, 'performance_score'], -100)
+        
+        last = ranked['player_name'].iloc[-1]
+        for _ in range(30):
+            board.apply_event(last, 'direct_hit')
+        self.assertEqual(board.leaderboard()['player_name'].iloc[0], last)
+    
+    def test_non_finite_runs_rejected(self):
+        """Test that NaN and infinite runs are refused before anything is applied"""
+        board = LiveScoreBoard()
+        for runs in [float('nan'), float('inf'), -float('inf')]:
+            with self.assertRaises(ValueError):
+                board.apply_event('Phil Salt', 'runs_saved', runs=runs)
+        self.assertEqual(board.players, {})
+    
+    def test_http_service(self):
+        """Test posting events and reading the top performers over HTTP"""
+        server = create_server(port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            request = urllib.request.Request(f"{base}/events", data=json.dumps(self.events).encode(),
+                                             headers={'Content-Type': 'application/json'})
+            urllib.request.urlopen(request).read()
+            top = json.loads(urllib.request.urlopen(f"{base}/top?n=2").read())
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        self.assertEqual(len(top), 2)
+        self.assertEqual(top[0]['performance_score'], self.expected['performance_score'].max())
+
+    def test_invalid_batch_applies_nothing(self):
+        """Test that a batch with one bad event is rejected whole, over HTTP too"""
+        board = LiveScoreBoard()
+        with self.assertRaises(ValueError):
+            board.apply_events(self.events[:3] + [{'player_name': 'Phil Salt', 'event_type': 'bogus'}])
+        self.assertEqual(board.events_applied, 0)
+        self.assertEqual(board.players, {})
+
+        server = create_server(port=0, board=board)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        statuses = []
+        try:
+            bad_batch = self.events[:3] + [{'player_name': 'Phil Salt', 'event_type': 'catch', 'runs': 'x'}]
+            request = urllib.request.Request(f"{base}/events", data=json.dumps(bad_batch).encode(),
+                                             headers={'Content-Type': 'application/json'})
+            for target in [request, f"{base}/top?n=abc"]:
+                try:
+                    urllib.request.urlopen(target)
+                except urllib.error.HTTPError as e:
+                    statuses.append(e.code)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(statuses, [400, 400])
+        self.assertEqual(board.events_applied, 0)
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,78 @@
+"""
+Test cases for the batch modeling module
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import tempfile
+import pandas as pd
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.modeling import FieldingModeler
+
+class TestFieldingModeler(unittest.TestCase):
+    """Test cases for PCA, clustering, random forest and persistence"""
+    
+    def setUp(self):
+        df = FieldingDataLoader().create_sample_dataset()
+        self.df_scored = PerformanceCalculator().calculate_all_scores(df)
+        self.modeler = FieldingModeler(n_estimators=20, n_jobs=1)
+    
+    def test_features_built_once(self):
+        """Test that the feature matrices are shared between models"""
+        first = self.modeler.build_features(self.df_scored)
+        self.modeler.fit_pca(self.df_scored)
+        self.modeler.fit_clusters(self.df_scored)
+        
+        self.assertIs(self.modeler.build_features(self.df_scored.copy()), first)
+    
+    def test_cluster_summary(self):
+        """Test the per-cluster summary table"""
+        clustered = self.modeler.fit_clusters(self.df_scored)
+        summary = self.modeler.cluster_summary(clustered)
+        
+        self.assertEqual(len(summary), 3)
+        self.assertEqual(summary['players'].sum(), 7)
+    
+    def test_feature_importance(self):
+        """Test that importances cover every prediction feature and sum to one"""
+        importance, cv_scores = self.modeler.fit_feature_importance(self.df_scored)
+        
+        self.assertEqual(len(importance), 9)
+        self.assertAlmostEqual(importance['importance'].sum(), 1.0)
+        self.assertEqual(len(cv_scores), 5)
+    
+    def test_large_data_uses_incremental_models(self):
+        """Test the season-scale path with IncrementalPCA and MiniBatchKMeans"""
+        modeler = FieldingModeler(large_data_threshold=5, batch_size=5, n_jobs=1)
+        components = modeler.fit_pca(self.df_scored)
+        modeler.fit_clusters(self.df_scored)
+        
+        self.assertEqual(type(modeler.pca).__name__, 'IncrementalPCA')
+        self.assertEqual(type(modeler.kmeans).__name__, 'MiniBatchKMeans')
+        self.assertEqual(list(components.columns), ['PC1', 'PC2'])
+    
+    def test_save_and_reload(self):
+        """Test that persisted models transform new data identically"""
+        self.modeler.fit(self.df_scored)
+        expected = self.modeler.transform(self.df_scored)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self.modeler.save(os.path.join(temp_dir, 'models.joblib'))
+            reloaded = FieldingModeler.load(path).transform(self.df_scored)
+        
+        pd.testing.assert_frame_equal(reloaded, expected)
+    
+    def test_top_bottom_ttest(self):
+        result = self.modeler.compare_top_bottom(self.df_scored)
+        self.assertGreater(result['t_statistic'], 0)
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,169 @@
+"""
+Test cases for the asyncio pipeline orchestrator
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import tempfile
+import threading
+import time
+import sys
+import os
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.pipeline import PipelineOrchestrator, build_analysis_pipeline, _render_charts
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.visualizations import FieldingVisualizer
+from src.analysis_tools import FieldingAnalyzer
+from src.fielding_store import FieldingStore
+from src.result_writer import ResultWriter
+
+
+def load(source):
+    return list(range(source))
+
+
+def square_all(values):
+    return [v * v for v in values]
+
+
+def total(values):
+    return sum(values)
+
+
+def slow_identity(values):
+    time.sleep(0.2)
+    return values
+
+
+class TestPipelineOrchestrator(unittest.TestCase):
+    """Test cases for dependency-graph execution"""
+    
+    def test_dependency_results_passed_in_order(self):
+        """Test that each stage receives its dependencies' results"""
+        pipeline = PipelineOrchestrator(max_workers=2)
+        pipeline.add_stage('raw', load)
+        pipeline.add_stage('squares', square_all, ['raw'], executor='process')
+        pipeline.add_stage('total', total, ['squares'], executor='inline')
+        pipeline.add_stage('both', lambda raw, sq: (len(raw), len(sq)), ['raw', 'squares'])
+        
+        results = pipeline.run(4)
+        
+        self.assertEqual(results['squares'], [0, 1, 4, 9])
+        self.assertEqual(results['total'], 14)
+        self.assertEqual(results['both'], (4, 4))
+    
+    def test_independent_stages_overlap(self):
+        """Test that sibling stages run concurrently"""
+        pipeline = PipelineOrchestrator(max_workers=4)
+        pipeline.add_stage('raw', load)
+        for name in ['a', 'b', 'c']:
+            pipeline.add_stage(name, slow_identity, ['raw'])
+        
+        start = time.perf_counter()
+        pipeline.run(3)
+        self.assertLess(time.perf_counter() - start, 0.5)
+    
+    def test_batch_results_in_source_order(self):
+        """Test that batch runs return one result per source in order"""
+        pipeline = PipelineOrchestrator(max_workers=3, queue_size=1)
+        pipeline.add_stage('raw', load)
+        pipeline.add_stage('total', total, ['raw'], executor='process')
+        
+        results = pipeline.run_batch([5, 1, 3, 0])
+        
+        self.assertEqual([r['total'] for r in results], [10, 0, 3, 0])
+    
+    def test_concurrent_runs_use_their_own_executors(self):
+        """Test that overlapping run() calls do not share or shut down each other's pools"""
+        pipeline = PipelineOrchestrator(max_workers=2)
+        pipeline.add_stage('raw', load)
+        pipeline.add_stage('slow', slow_identity, ['raw'])
+        pipeline.add_stage('total', total, ['slow'], executor='serial')
+        
+        results = {}
+        threads = [threading.Thread(target=lambda n=n: results.update({n: pipeline.run(n)['total']}))
+                   for n in [3, 4, 5]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, {3: 3, 4: 6, 5: 10})
+    
+    def test_unknown_dependency_rejected(self):
+        """Test that stages must be declared after their dependencies"""
+        pipeline = PipelineOrchestrator()
+        with self.assertRaises(ValueError):
+            pipeline.add_stage('total', total, ['raw'])
+
+    def test_batch_charts_kept_per_match(self):
+        """Test that each match's charts get their own files and figures are closed"""
+        df_scored = PerformanceCalculator().calculate_all_scores(FieldingDataLoader().create_sample_dataset())
+        with tempfile.TemporaryDirectory() as tmp:
+            visualizer = FieldingVisualizer(save_path=tmp)
+            paths = [_render_charts(visualizer, df_scored.assign(match_no=match_no))
+                     for match_no in ['IPL2367', 'IPL2368', 'IPL2369']]
+            
+            saved = [path for charts in paths for path in charts.values()]
+            self.assertEqual(len(set(saved)), 12)
+            self.assertTrue(all(os.path.exists(path) for path in saved))
+            self.assertTrue(os.path.basename(paths[1]['runs_saved']).startswith('IPL2368_'))
+        self.assertEqual(plt.get_fignums(), [])
+
+    def test_batch_cleaning_shares_the_registry(self):
+        """Test that new players from concurrent matches get distinct ids in the loader's registry"""
+        loader = FieldingDataLoader()
+        sample = loader.create_sample_dataset()
+        with tempfile.TemporaryDirectory() as tmp:
+            sources = []
+            for match_no, newcomer in [('IPL2368', 'Prithvi Shaw'), ('IPL2369', 'Mitchell Marsh')]:
+                match_df = sample.assign(match_no=match_no)
+                match_df.loc[0, 'player_name'] = newcomer
+                sources.append(os.path.join(tmp, f'{match_no}.csv'))
+                match_df.to_csv(sources[-1], index=False)
+            
+            pipeline = build_analysis_pipeline(loader, PerformanceCalculator(), FieldingVisualizer(tmp),
+                                               FieldingAnalyzer(), None, max_workers=2)
+            pipeline.stages = {name: pipeline.stages[name] for name in ['raw', 'validation', 'clean']}
+            results = pipeline.run_batch(sources)
+        
+        ids = [result['clean'].loc[0, 'player_id'] for result in results]
+        self.assertEqual(ids, [loader.registry.lookup('Prithvi Shaw'), loader.registry.lookup('Mitchell Marsh')])
+        self.assertEqual(sorted(ids), [7, 8])
+
+    def test_batch_with_store_backed_analyzer(self):
+        """Test the full graph with a store-backed analyzer; a missing file is reported, not replaced"""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, 'IPL2368.csv')
+            FieldingDataLoader().create_sample_dataset().assign(match_no='IPL2368').to_csv(source, index=False)
+            analyzer = FieldingAnalyzer(store=FieldingStore(os.path.join(tmp, 'store.db')))
+            
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                with ResultWriter() as writer:
+                    pipeline = build_analysis_pipeline(FieldingDataLoader(), PerformanceCalculator(),
+                                                       FieldingVisualizer(tmp, show=False), analyzer, writer,
+                                                       max_workers=2)
+                    results = pipeline.run_batch([source, os.path.join(tmp, 'missing.csv')],
+                                                 return_exceptions=True)
+                    with self.assertRaises(FileNotFoundError):
+                        pipeline.run(os.path.join(tmp, 'missing.csv'))
+            finally:
+                os.chdir(cwd)
+            analyzer.store.conn.close()
+        
+        self.assertEqual(results[0]['scored']['match_no'].iloc[0], 'IPL2368')
+        self.assertIsInstance(results[1], FileNotFoundError)
+        # Analysis ran in this process, so its results are in the analyzer's own cache
+        self.assertGreater(analyzer.cache_info()['size'], 0)
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,118 @@
+"""
+Test cases for player identity resolution and interned ids
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import tempfile
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.recommendation_rules import RecommendationEngine
+from src.player_identity import PlayerRegistry
+
+class TestPlayerIdentity(unittest.TestCase):
+    """Test cases for alias, initials and fuzzy matching and id interning"""
+
+    def setUp(self):
+        """Sample match plus a second feed using name variants"""
+        self.loader = FieldingDataLoader()
+        self.df = self.loader.create_sample_dataset()
+        self.variants = self.df.copy()
+        self.variants['player_name'] = ['R Russouw', 'Philip Salt', 'Yas Dhull', 'A. Patel',
+                                        'Lalit Yadav', 'aman  khan', 'K Yadav']
+        self.variants['match_no'] = 'IPL2368'
+        # Only the initials rows carry a role, which they need to be merged
+        self.variants['player_role'] = self.variants['player_role'].where(
+            self.variants.index.isin([0, 3, 6]), None)
+
+    def test_variants_resolve_to_known_players(self):
+        """Test that alias, initials and fuzzy matches map onto the canonical names"""
+        registry = PlayerRegistry()
+        resolved = registry.resolve(self.variants)
+
+        self.assertEqual(list(resolved['player_name']), list(self.df['player_name']))
+        self.assertEqual(list(resolved['player_id']), list(range(7)))
+        self.assertEqual(resolved['player_id'].dtype, np.int32)
+        self.assertEqual(list(resolved['player_role']), list(self.df['player_role']))
+        self.assertEqual(registry.review_queue, [])
+
+    def test_resolution_methods_and_new_players(self):
+        """Test the recorded match method and that unmatched names get new ids"""
+        registry = PlayerRegistry()
+        self.assertEqual(registry.resolve_name('R. Russouw', role='Batsman'), registry.lookup('Rilee Russouw'))
+        self.assertEqual(registry.resolve_name('Kuldip Yadav'), registry.lookup('Kuldeep Yadav'))
+        self.assertEqual([r['method'] for r in registry.resolutions], ['initials', 'fuzzy'])
+
+        new_id = registry.resolve_name('Prithvi Shaw', role='Batsman')
+        self.assertEqual(new_id, 7)
+        self.assertEqual(registry.roles[new_id], 'Batsman')
+        # Ambiguous initials are never merged
+        registry.register('Kamlesh Yadav')
+        self.assertNotIn(registry.resolve_name('K Yadav', role='Bowler'), [registry.lookup('Kuldeep Yadav'),
+                                                                           registry.lookup('Kamlesh Yadav')])
+    
+    def test_unconfirmed_matches_are_queued(self):
+        """Test that a different first name, a bare initial or a misspelt surname is queued, not merged"""
+        registry = PlayerRegistry(roles={'Rohit Sharma': 'Batsman', 'Yash Dhull': 'Batsman'}, aliases={})
+        mohit = registry.resolve_name('Mohit Sharma', role='Bowler')
+        r_sharma = registry.resolve_name('R Sharma')
+        dull = registry.resolve_name('Yash Dull')
+        
+        self.assertEqual(len({mohit, r_sharma, dull, registry.lookup('Rohit Sharma'),
+                              registry.lookup('Yash Dhull')}), 5)
+        self.assertEqual([(entry['name'], entry['candidate']) for entry in registry.review_queue],
+                         [('Mohit Sharma', 'Rohit Sharma'), ('R Sharma', 'Rohit Sharma'),
+                          ('Yash Dull', 'Yash Dhull')])
+        self.assertEqual(registry.resolutions, [])
+        # A corroborating role lets the initials through
+        self.assertEqual(registry.resolve_name('Y Dhull', role='Batsman'), registry.lookup('Yash Dhull'))
+
+    def test_cleaning_merges_feeds(self):
+        """Test that cleaning two feeds yields one id per player across both matches"""
+        combined = pd.concat([self.df, self.variants], ignore_index=True)
+        cleaned = self.loader.clean_fielding_data(combined)
+
+        self.assertEqual(cleaned['player_id'].nunique(), 7)
+        self.assertTrue((cleaned.groupby('player_id')['match_no'].nunique() == 2).all())
+
+    def test_id_keyed_aggregates_and_validation(self):
+        """Test that id-keyed recommendations and validation match the name-keyed results"""
+        resolved = self.loader.clean_fielding_data(self.df)
+        calculator = PerformanceCalculator(registry=self.loader.registry)
+        df_scored = calculator.calculate_all_scores(resolved)
+
+        engine = RecommendationEngine()
+        pd.testing.assert_frame_equal(engine.evaluate(df_scored),
+                                      engine.evaluate(df_scored.drop(columns='player_id')))
+
+        validation = calculator.validate_calculations(df_scored, {'Rilee Rossouw': 10, 'Philip Salt': 2,
+                                                                  'Kuldip Yadav': 9})
+        self.assertIn('player_id', validation.columns)
+        self.assertEqual(list(validation['status'].iloc[[0, 1, 6]]), ['✅ PASS'] * 3)
+        # Validation only looks names up; the registry is left as it was
+        self.assertIsNone(self.loader.registry.lookup('Kuldip Yadav'))
+        self.assertEqual(self.loader.registry.resolutions, [])
+
+    def test_save_and_load_keep_ids(self):
+        """Test that a saved alias table reloads with the same ids"""
+        registry = PlayerRegistry()
+        registry.resolve(self.variants)
+        registry.resolve_name('Prithvi Shaw')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = registry.save(os.path.join(tmp, 'player_registry.csv'))
+            loaded = PlayerRegistry.load(path)
+
+        self.assertEqual(loaded.names, registry.names)
+        self.assertEqual(loaded.aliases, registry.aliases)
+        self.assertEqual(loaded.lookup('Yas Dhull'), registry.lookup('Yash Dhull'))
+
+if __name__ == '__main__':
+    unittest.main()
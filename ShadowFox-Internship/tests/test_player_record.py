@@ -0,0 +1,54 @@
+"""
+Test cases for the compact player record type
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.player_record import (PlayerRecord, records_to_array, array_to_records,
+                               frame_to_array, RECORD_DTYPE)
+
+class TestPlayerRecord(unittest.TestCase):
+    """Test cases for PlayerRecord conversions and batch scoring"""
+    
+    def setUp(self):
+        self.calculator = PerformanceCalculator()
+        self.df = FieldingDataLoader().create_sample_dataset()
+        self.records = [PlayerRecord.from_mapping(row) for row in self.df.to_dict('records')]
+    
+    def test_slots_only(self):
+        """Test that records carry no per-instance __dict__"""
+        self.assertFalse(hasattr(self.records[0], '__dict__'))
+    
+    def test_single_record_scoring(self):
+        """Test that a record works with calculate_player_score like a dict"""
+        russouw = self.records[0]
+        self.assertEqual(self.calculator.calculate_player_score(russouw), 10)
+    
+    def test_structured_array_round_trip(self):
+        """Test conversion to and from NumPy structured arrays"""
+        array = records_to_array(self.records)
+        
+        self.assertEqual(array.dtype, RECORD_DTYPE)
+        self.assertEqual(array_to_records(array), self.records)
+        np.testing.assert_array_equal(frame_to_array(self.df), array)
+    
+    def test_batch_scores_match_frame_scores(self):
+        """Test that batch record scoring equals the DataFrame scoring path"""
+        expected = self.calculator.calculate_all_scores(self.df)['performance_score'].to_numpy()
+        
+        np.testing.assert_array_equal(self.calculator.calculate_record_scores(self.records), expected)
+        np.testing.assert_array_equal(self.calculator.calculate_record_scores(frame_to_array(self.df)),
+                                      expected)
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
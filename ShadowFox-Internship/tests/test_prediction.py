@@ -0,0 +1,121 @@
+"""
+Test cases for the fielding score prediction model
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import tempfile
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.prediction import FieldingPredictor
+
+VENUES = ['Arun Jaitley Stadium', 'Wankhede Stadium', 'Eden Gardens']
+
+class TestFieldingPredictor(unittest.TestCase):
+    """Test cases for time-ordered training and batched inference"""
+
+    def setUp(self):
+        """Build a ten-match season from the sample match with varied counts and venues"""
+        base = FieldingDataLoader().create_sample_dataset()
+        rng = np.random.default_rng(11)
+        matches = []
+        for i in range(10):
+            match_df = base.copy()
+            match_df['match_no'] = f"IPL{2367 + i}"
+            match_df['match_date'] = pd.Timestamp('2024-04-01') + pd.Timedelta(days=3 * i)
+            match_df['venue'] = VENUES[i % 3]
+            match_df['catches'] = rng.integers(0, 3, len(base))
+            match_df['runs_saved'] = rng.integers(-3, 5, len(base))
+            matches.append(match_df)
+        season = pd.concat(matches, ignore_index=True).sample(frac=1, random_state=3)
+        self.season = PerformanceCalculator().calculate_all_scores(season)
+        self.predictor = FieldingPredictor(max_iter=50)
+
+    def test_features_only_use_earlier_matches(self):
+        """Test that history features exclude the current match"""
+        df, features = self.predictor.build_features(self.season)
+        player = df['player_name'] == 'Axar Patel'
+        scores = df.loc[player, 'performance_score'].to_numpy()
+
+        self.assertEqual(features.loc[player, 'prior_matches'].iloc[0], 0)
+        self.assertTrue(np.isnan(features.loc[player, 'prior_avg'].iloc[0]))
+        self.assertEqual(features.loc[player, 'last_score'].iloc[3], scores[2])
+        self.assertAlmostEqual(features.loc[player, 'prior_avg'].iloc[4], scores[:4].mean())
+
+    def test_time_split_is_ordered(self):
+        """Test that every test match is played after every training match"""
+        train, test = self.predictor.time_split(self.season)
+
+        self.assertEqual(len(train) + len(test), len(self.season))
+        self.assertLess(train['match_date'].max(), test['match_date'].min())
+
+    def test_time_split_without_dates(self):
+        """Test that undated seasons split on match number order, not on input order"""
+        season = self.season.drop(columns='match_date')
+        # 'IPL998' < 'IPL1000' only when compared numerically
+        season['match_no'] = season['match_no'].str[3:].astype(int).sub(1369).map(lambda n: f"IPL{n}")
+        train, test = self.predictor.time_split(season)
+
+        self.assertEqual(set(test['match_no']), {'IPL1006', 'IPL1007'})
+        self.assertEqual(len(train) + len(test), len(season))
+        with self.assertRaises(ValueError):
+            self.predictor.time_split(season.drop(columns='match_no'))
+
+    def test_fit_reports_holdout_metrics(self):
+        """Test that fitting evaluates on the later matches"""
+        metrics = self.predictor.fit(self.season).metrics
+
+        self.assertEqual(metrics['test_rows'], 14)
+        for key in ['mae', 'rmse', 'baseline_mae']:
+            self.assertIn(key, metrics)
+
+    def test_predict_batch_matrix(self):
+        """Test squad-by-fixture predictions, including a debutant and a new venue"""
+        self.predictor.fit(self.season)
+        squad = ['Axar Patel', 'Kuldeep Yadav', 'New Signing']
+        fixtures = pd.DataFrame({'match_no': ['IPL2400', 'IPL2401'],
+                                 'venue': ['Eden Gardens', 'Chepauk']})
+        predictions = self.predictor.predict_batch(squad, fixtures)
+
+        self.assertEqual(len(predictions), 6)
+        self.assertEqual(list(predictions['player_name']), [p for p in squad for _ in range(2)])
+        self.assertEqual(list(predictions['match_no'][:2]), ['IPL2400', 'IPL2401'])
+        self.assertFalse(predictions['predicted_score'].isna().any())
+
+        single = self.predictor.predict_batch(['Kuldeep Yadav'], fixtures.iloc[[1]])
+        self.assertAlmostEqual(single['predicted_score'].iloc[0], predictions['predicted_score'].iloc[3])
+
+    def test_full_schedule(self):
+        """Test batched inference for a season-sized squad and fixture list"""
+        self.predictor.fit(self.season)
+        squad = pd.DataFrame({'player_name': [f'Player {i}' for i in range(243)] + ['Axar Patel']})
+        fixtures = pd.DataFrame({'match_no': range(74), 'venue': [VENUES[i % 3] for i in range(74)]})
+        predictions = self.predictor.predict_batch(squad, fixtures)
+
+        self.assertEqual(len(predictions), 244 * 74)
+        self.assertFalse(predictions['predicted_score'].isna().any())
+
+    def test_save_and_reload(self):
+        """Test that persisted artifacts reproduce predictions"""
+        self.predictor.fit(self.season)
+        fixtures = pd.DataFrame({'venue': VENUES})
+        expected = self.predictor.predict_batch(['Phil Salt', 'Aman Khan'], fixtures)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self.predictor.save(os.path.join(temp_dir, 'predictor.joblib'))
+            reloaded = FieldingPredictor.load(path)
+
+        pd.testing.assert_frame_equal(reloaded.predict_batch(['Phil Salt', 'Aman Khan'], fixtures), expected)
+        self.assertEqual(reloaded.metrics, self.predictor.metrics)
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,119 @@
+"""
+Test cases for headless report generation
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import tempfile
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.report_generator import ReportGenerator
+
+class TestReportGenerator(unittest.TestCase):
+    """Test cases for per-team HTML and PDF reports"""
+    
+    def setUp(self):
+        df = FieldingDataLoader().create_sample_dataset()
+        df_scored = PerformanceCalculator().calculate_all_scores(df)
+        self.season = pd.concat([df_scored, df_scored.assign(team='Mumbai Indians')], ignore_index=True)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = os.path.join(self.temp_dir.name, 'reports')
+        self.chart_dir = os.path.join(self.temp_dir.name, 'charts')
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_html_report_per_team(self):
+        """Test one HTML report per team with scoreboard, recommendations and charts"""
+        generator = ReportGenerator(self.output_dir, self.chart_dir, max_workers=2)
+        reports = generator.generate_reports(self.season)
+        
+        self.assertEqual(set(reports), {'Delhi Capitals', 'Mumbai Indians'})
+        with open(reports['Delhi Capitals'][0], encoding='utf-8') as f:
+            content = f.read()
+        self.assertIn('Yash Dhull', content)
+        self.assertIn('Implement intensive catching practice sessions', content)
+        self.assertIn('delhi_capitals_performance_scores.png', content)
+        self.assertNotIn('mumbai_indians', content)
+        for team in ['delhi_capitals', 'mumbai_indians']:
+            self.assertTrue(os.path.exists(os.path.join(self.chart_dir, f'{team}_correlation_heatmap.png')))
+        self.assertEqual(plt.get_fignums(), [])
+    
+    def test_rendered_charts_reused(self):
+        """Test that charts rendered earlier are embedded as they are and only missing ones are drawn"""
+        os.makedirs(self.chart_dir)
+        fig, ax = plt.subplots()
+        ax.bar([1, 2], [3, 4])
+        league_chart = os.path.join(self.chart_dir, 'performance_scores.png')
+        fig.savefig(league_chart)
+        plt.close(fig)
+        with open(league_chart, 'rb') as f:
+            before = f.read()
+        
+        delhi = self.season[self.season['team'] == 'Delhi Capitals']
+        generator = ReportGenerator(self.output_dir, self.chart_dir, max_workers=1)
+        reused = {'Delhi Capitals': {'Performance Scores': league_chart}}
+        reports = generator.generate_reports(delhi, chart_paths=reused)
+        with open(reports['Delhi Capitals'][0], encoding='utf-8') as f:
+            content = f.read()
+        with open(league_chart, 'rb') as f:
+            self.assertEqual(f.read(), before)
+        
+        self.assertIn('"../charts/performance_scores.png"', content)
+        self.assertEqual(sorted(os.listdir(self.chart_dir)),
+                         ['delhi_capitals_contributions_analysis.png',
+                          'delhi_capitals_correlation_heatmap.png',
+                          'delhi_capitals_runs_saved_analysis.png', 'performance_scores.png'])
+        
+        # A second run finds every file and draws nothing
+        def mtimes():
+            return {name: os.path.getmtime(os.path.join(self.chart_dir, name)) for name in os.listdir(self.chart_dir)}
+        first = mtimes()
+        generator.generate_reports(delhi, chart_paths=reused)
+        self.assertEqual(mtimes(), first)
+    
+    def test_rows_without_team(self):
+        """Test that rows with a missing team are reported under Unknown instead of dropped"""
+        season = self.season.copy()
+        season.loc[season['player_name'] == 'Yash Dhull', 'team'] = None
+        generator = ReportGenerator(self.output_dir, self.chart_dir, include_charts=False, max_workers=1)
+        reports = generator.generate_reports(season)
+        
+        self.assertEqual(set(reports), {'Delhi Capitals', 'Mumbai Indians', 'Unknown'})
+        with open(reports['Unknown'][0], encoding='utf-8') as f:
+            content = f.read()
+        self.assertIn('Yash Dhull', content)
+        self.assertEqual(sorted(os.listdir(self.output_dir)),
+                         ['delhi_capitals_report.html', 'mumbai_indians_report.html', 'unknown_report.html'])
+    
+    def test_pdf_report(self):
+        """Test optional PDF output"""
+        generator = ReportGenerator(self.output_dir, self.chart_dir, generate_pdf=True, max_workers=1)
+        reports = generator.generate_reports(self.season[self.season['team'] == 'Delhi Capitals'])
+        
+        pdf_path = reports['Delhi Capitals'][1]
+        self.assertTrue(pdf_path.endswith('.pdf'))
+        with open(pdf_path, 'rb') as f:
+            self.assertEqual(f.read(4), b'%PDF')
+    
+    def test_settings_file(self):
+        """Test that reporting options are read from settings.yaml"""
+        settings = os.path.join(os.path.dirname(__file__), '..', 'config', 'settings.yaml')
+        generator = ReportGenerator.from_settings(settings)
+        
+        self.assertFalse(generator.generate_pdf)
+        self.assertTrue(generator.include_charts)
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,76 @@
+"""
+Test cases for bootstrap confidence intervals
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.analysis_tools import FieldingAnalyzer
+from src.resampling import BootstrapAnalyzer
+
+class TestBootstrap(unittest.TestCase):
+    """Test cases for resampled score and correlation intervals"""
+    
+    def setUp(self):
+        df = FieldingDataLoader().create_sample_dataset()
+        self.df_scored = PerformanceCalculator().calculate_all_scores(df)
+        self.bootstrap = BootstrapAnalyzer(n_resamples=2000, random_state=1)
+    
+    def test_interval_contains_mean(self):
+        """Test that the team CI brackets the observed team mean"""
+        team = self.bootstrap.team_score_intervals(self.df_scored).iloc[0]
+        
+        self.assertAlmostEqual(team['mean_score'], self.df_scored['performance_score'].mean())
+        self.assertLessEqual(team['ci_lower'], team['mean_score'])
+        self.assertGreaterEqual(team['ci_upper'], team['mean_score'])
+    
+    def test_single_observation_interval_is_degenerate(self):
+        """Test that a player with one match gets a zero-width interval"""
+        players = self.bootstrap.player_score_intervals(self.df_scored)
+        
+        self.assertEqual(len(players), 7)
+        np.testing.assert_allclose(players['ci_lower'], players['mean_score'])
+        np.testing.assert_allclose(players['ci_upper'], players['mean_score'])
+    
+    def test_correlations_match_pearson(self):
+        """Test that observed correlations agree with the analyzer's Pearson r"""
+        intervals = self.bootstrap.correlation_intervals(self.df_scored).set_index('metric')
+        pearson = FieldingAnalyzer().calculate_correlations(self.df_scored).set_index('metric')
+        
+        for metric in pearson.index:
+            self.assertAlmostEqual(intervals.loc[metric, 'correlation'], pearson.loc[metric, 'correlation'], places=3)
+    
+    def test_parallel_resampling_is_reproducible(self):
+        """Test that the process-pool path returns the requested number of resamples deterministically"""
+        values = self.df_scored['performance_score'].to_numpy(dtype=float)
+        parallel = BootstrapAnalyzer(n_resamples=3000, n_jobs=2, parallel_threshold=1000, random_state=5)
+        
+        first = parallel.resample('mean', values)
+        second = parallel.resample('mean', values)
+        
+        self.assertEqual(len(first), 3000)
+        np.testing.assert_array_equal(first, second)
+
+    def test_groups_draw_independent_resamples(self):
+        """Test that each group gets its own child seed and one shared pool serves every group"""
+        both = self.df_scored.iloc[np.tile(np.arange(len(self.df_scored)), 2)].reset_index(drop=True)
+        both.loc[len(self.df_scored):, 'team'] = 'Twin XI'
+        serial = self.bootstrap.team_score_intervals(both)
+        self.assertEqual(serial['mean_score'].iloc[0], serial['mean_score'].iloc[1])
+        self.assertNotEqual(serial['ci_lower'].iloc[0], serial['ci_lower'].iloc[1])
+
+        parallel = BootstrapAnalyzer(n_resamples=3000, n_jobs=2, parallel_threshold=1000, random_state=5)
+        first = parallel.team_score_intervals(both)
+        self.assertTrue(first.equals(parallel.team_score_intervals(both)))
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,96 @@
+"""
+Test cases for the batched, atomic result writer
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import tempfile
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.result_writer import ResultWriter
+import src.result_writer as result_writer
+
+class TestResultWriter(unittest.TestCase):
+    """Test cases for writing pipeline outputs"""
+    
+    def setUp(self):
+        self.df = FieldingDataLoader().create_sample_dataset()
+        self.temp_dir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def _path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+    
+    def test_frame_formats_round_trip(self):
+        """Test csv and compressed csv outputs read back identically"""
+        with ResultWriter() as writer:
+            writer.write_frame(self.df, self._path("results.csv"))
+            writer.write_frame(self.df, self._path("results.csv.gz"))
+        
+        pd.testing.assert_frame_equal(pd.read_csv(self._path("results.csv")), self.df)
+        pd.testing.assert_frame_equal(pd.read_csv(self._path("results.csv.gz")), self.df)
+    
+    def test_same_frame_serialized_once(self):
+        """Test that one frame written to several paths is serialized a single time"""
+        calls = []
+        original = result_writer.serialize_frame
+        result_writer.serialize_frame = lambda df, fmt: calls.append(fmt) or original(df, fmt)
+        try:
+            with ResultWriter() as writer:
+                writer.write_frame(self.df, self._path("a.csv"))
+                writer.write_frame(self.df, self._path("b.csv"))
+        finally:
+            result_writer.serialize_frame = original
+        
+        self.assertEqual(calls, ['csv'])
+        self.assertTrue(os.path.exists(self._path("b.csv")))
+    
+    def test_failed_write_leaves_previous_file(self):
+        """Test that a failed serialization never leaves a partial file behind"""
+        path = self._path("results.csv")
+        with ResultWriter() as writer:
+            writer.write_frame(self.df, path)
+        
+        with ResultWriter() as writer:
+            with self.assertRaises(ValueError):
+                writer.write_frame(self.df, path, fmt='unknown')
+        
+        pd.testing.assert_frame_equal(pd.read_csv(path), self.df)
+        self.assertEqual(os.listdir(self.temp_dir.name), ["results.csv"])
+    
+    def test_frame_snapshot_taken_at_submit(self):
+        """Test that in-place changes after a write reach only later writes, and paths are recorded"""
+        df = self.df.copy()
+        with ResultWriter() as writer:
+            writer.write_frame(df, self._path("x.csv"))
+            df.loc[0, 'catches'] = 99
+            writer.write_frame(df, self._path("y.csv"))
+        
+        self.assertEqual(pd.read_csv(self._path("x.csv")).loc[0, 'catches'], self.df.loc[0, 'catches'])
+        self.assertEqual(pd.read_csv(self._path("y.csv")).loc[0, 'catches'], 99)
+        self.assertEqual(writer.written_paths, [self._path("x.csv"), self._path("y.csv")])
+    
+    def test_figure_written(self):
+        """Test that figures are rendered and written through the writer"""
+        fig, ax = plt.subplots()
+        ax.plot([1, 2, 3])
+        with ResultWriter() as writer:
+            writer.write_figure(fig, self._path("chart.png"))
+        plt.close('all')
+        
+        self.assertGreater(os.path.getsize(self._path("chart.png")), 0)
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,105 @@
+"""
+Test cases for the team/season rollup cube
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.analysis_tools import FieldingAnalyzer
+from src.rollup_cube import RollupCube
+
+class TestRollupCube(unittest.TestCase):
+    """Test cases for precomputed rollups, drill-down and incremental updates"""
+    
+    def setUp(self):
+        """Build two seasons of matches for two teams"""
+        base = FieldingDataLoader().create_sample_dataset()
+        rng = np.random.default_rng(9)
+        matches = []
+        for i in range(8):
+            match_df = base.copy()
+            match_df['match_no'] = f"IPL{2367 + i}"
+            match_df['season'] = 2023 + i // 4
+            match_df['team'] = ['Delhi Capitals', 'Mumbai Indians'][i % 2]
+            match_df['catches'] = rng.integers(0, 3, len(base))
+            match_df['runs_saved'] = rng.integers(-3, 5, len(base))
+            matches.append(match_df)
+        self.df_scored = PerformanceCalculator().calculate_all_scores(pd.concat(matches, ignore_index=True))
+    
+    def test_team_rollup_matches_groupby(self):
+        """Test team-level sums, counts and ranges against a direct groupby"""
+        teams = RollupCube().fit(self.df_scored).rollup('team')
+        grouped = self.df_scored.groupby(['season', 'team'])
+        
+        expected = grouped['performance_score'].agg(['sum', 'size', 'min', 'max'])
+        actual = teams.loc[expected.index]
+        np.testing.assert_array_equal(actual['performance_score_sum'], expected['sum'])
+        np.testing.assert_array_equal(actual['rows'], expected['size'])
+        np.testing.assert_array_equal(actual['performance_score_min'], expected['min'])
+        np.testing.assert_array_equal(actual['performance_score_max'], expected['max'])
+    
+    def test_summary_matches_frame(self):
+        """Test the dashboard figures read from the cube"""
+        subset = self.df_scored[self.df_scored['team'] == 'Mumbai Indians']
+        summary = RollupCube().fit(self.df_scored).summary(team='Mumbai Indians')
+        
+        self.assertAlmostEqual(summary['average_score'], subset['performance_score'].mean())
+        self.assertEqual(summary['total_runs_saved'], subset['runs_saved'].sum())
+        self.assertEqual(summary['total_catches'], subset['catches'].sum())
+        self.assertEqual(summary['top_score'], subset['performance_score'].max())
+        self.assertEqual(summary['top_performer'],
+                         subset.loc[subset['performance_score'].idxmax(), 'player_name'])
+    
+    def test_drill_down(self):
+        """Test that drilling into a season returns its teams"""
+        teams = RollupCube().fit(self.df_scored).drill_down(season=2024)
+        
+        self.assertEqual(sorted(teams.index.get_level_values('team')), ['Delhi Capitals', 'Mumbai Indians'])
+        self.assertEqual(teams['rows'].sum(), 28)
+    
+    def test_incremental_update_matches_full_build(self):
+        """Test that adding matches one at a time equals building from the full frame"""
+        full = RollupCube().fit(self.df_scored)
+        incremental = RollupCube()
+        for _, match_df in self.df_scored.groupby('match_no', sort=False):
+            incremental.update(match_df)
+        
+        for level, table in full.levels.items():
+            pd.testing.assert_frame_equal(incremental.levels[level].sort_index(), table.sort_index(),
+                                          check_dtype=False)
+    
+    def test_insights_from_cube(self):
+        """Test that cube-backed insights match the row-scanning version"""
+        df = PerformanceCalculator().calculate_all_scores(FieldingDataLoader().create_sample_dataset())
+        analyzer = FieldingAnalyzer()
+        
+        self.assertEqual(analyzer.generate_performance_insights(df, RollupCube().fit(df)),
+                         analyzer.generate_performance_insights(df))
+    
+    def test_cached_insights_follow_cube_updates(self):
+        """Test that memoized insights are recomputed after the cube changes"""
+        df = PerformanceCalculator().calculate_all_scores(FieldingDataLoader().create_sample_dataset())
+        analyzer = FieldingAnalyzer()
+        cube = RollupCube().fit(df)
+        before = analyzer.generate_performance_insights(df, cube)
+        self.assertEqual(analyzer.generate_performance_insights(df, cube), before)
+        self.assertEqual(analyzer.cache_hits, 1)
+        
+        cube.update(df.assign(match_no='IPL2368'))
+        after = analyzer.generate_performance_insights(df, cube)
+        self.assertNotEqual(after, before)
+        self.assertIn(f"👐 Total catches taken: {2 * df['catches'].sum()}", after)
+        self.assertNotIn(cube, [value for key in analyzer._cache for _, value in key[2]])
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
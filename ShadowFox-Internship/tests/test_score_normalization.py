@@ -0,0 +1,88 @@
+"""
+Test cases for role and venue normalized scoring
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import tempfile
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.score_normalization import ScoreBaselines
+
+class TestScoreBaselines(unittest.TestCase):
+    """Test cases for baseline tables and normalized scores"""
+    
+    def setUp(self):
+        """Build a season over two venues with varied counts"""
+        base = FieldingDataLoader().create_sample_dataset()
+        rng = np.random.default_rng(5)
+        matches = []
+        for i in range(12):
+            match_df = base.copy()
+            match_df['match_no'] = f"IPL{2367 + i}"
+            match_df['venue'] = ['Arun Jaitley Stadium', 'Wankhede Stadium'][i % 2]
+            match_df['catches'] = rng.integers(0, 3, len(base))
+            match_df['runs_saved'] = rng.integers(-3, 5, len(base))
+            matches.append(match_df)
+        self.season = PerformanceCalculator().calculate_all_scores(pd.concat(matches, ignore_index=True))
+    
+    def test_z_scores_match_group_statistics(self):
+        """Test z-scores against a direct role x venue groupby"""
+        normalized = ScoreBaselines(min_count=2).fit(self.season).normalize(self.season)
+        grouped = self.season.groupby(['player_role', 'venue'])['performance_score']
+        expected = ((self.season['performance_score'] - grouped.transform('mean'))
+                    / grouped.transform('std'))
+        
+        np.testing.assert_allclose(normalized['score_z'], expected.fillna(0))
+        self.assertTrue(normalized['score_percentile'].between(0, 100).all())
+    
+    def test_incremental_update_matches_full_fit(self):
+        """Test that folding in matches one at a time equals one fit over the season"""
+        full = ScoreBaselines().fit(self.season).table
+        incremental = ScoreBaselines()
+        for _, match_df in self.season.groupby('match_no'):
+            incremental.update(match_df)
+        
+        pd.testing.assert_frame_equal(incremental.table.sort_index().astype(float),
+                                      full.sort_index().astype(float))
+    
+    def test_sparse_keys_fall_back(self):
+        """Test fallback to role and overall baselines for thin samples"""
+        baselines = ScoreBaselines(min_count=10).fit(self.season)
+        new_rows = self.season.head(2).copy()
+        new_rows['venue'] = 'Eden Gardens'
+        new_rows.loc[new_rows.index[1], 'player_role'] = 'Substitute'
+        normalized = baselines.normalize(new_rows)
+        
+        self.assertEqual(list(normalized['baseline_level']), ['role', 'overall'])
+        self.assertAlmostEqual(normalized['baseline_mean'].iloc[1],
+                               self.season['performance_score'].mean())
+    
+    def test_save_and_load(self):
+        """Test that the persisted table reproduces normalized scores"""
+        baselines = ScoreBaselines().fit(self.season)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = baselines.save(os.path.join(temp_dir, 'baselines.csv'))
+            reloaded = ScoreBaselines.load(path)
+        
+        pd.testing.assert_frame_equal(reloaded.normalize(self.season), baselines.normalize(self.season))
+    
+    def test_calculator_normalized_scores(self):
+        """Test the PerformanceCalculator entry point on the sample match"""
+        df = FieldingDataLoader().create_sample_dataset()
+        normalized = PerformanceCalculator().calculate_normalized_scores(df)
+        
+        self.assertIn('score_z', normalized.columns)
+        self.assertEqual(len(normalized), 7)
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
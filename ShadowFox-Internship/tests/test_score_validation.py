@@ -0,0 +1,69 @@
+"""
+Test cases for vectorized score validation
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import pandas as pd
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+
+class TestScoreValidation(unittest.TestCase):
+    """Test cases for validating scores against expected tables"""
+    
+    def setUp(self):
+        self.calculator = PerformanceCalculator()
+        df = FieldingDataLoader().create_sample_dataset()
+        self.df_scored = self.calculator.calculate_all_scores(df)
+        self.expected_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'expected_scores.csv')
+    
+    def test_default_expected_scores_pass(self):
+        """Test that the sample match validates against config/expected_scores.csv"""
+        validation = self.calculator.validate_calculations(self.df_scored)
+        
+        self.assertTrue((validation['status'] == '✅ PASS').all())
+        self.assertEqual(list(validation['player_name']), list(self.df_scored['player_name']))
+    
+    def test_file_keyed_on_player_and_match(self):
+        """Test validation against a player-match keyed expected-scores file"""
+        season = pd.concat([self.df_scored, self.df_scored.assign(match_no='IPL2368')], ignore_index=True)
+        validation = self.calculator.validate_calculations(season, self.expected_path)
+        summary = self.calculator.summarize_validation(validation)
+        
+        self.assertEqual(summary['checked'], 7)
+        self.assertEqual(summary['passed'], 7)
+        self.assertEqual(summary['missing_expected'], 7)
+        self.assertTrue((validation.loc[7:, 'status'] == '⚠️ NO EXPECTED VALUE').all())
+    
+    def test_conflicting_expected_scores_without_match(self):
+        """Test that per-match expected scores cannot be silently collapsed onto one row per player"""
+        expected = pd.DataFrame({'player_name': ['Phil Salt', 'Phil Salt', 'Yash Dhull', 'Yash Dhull'],
+                                 'match_no': ['IPL2367', 'IPL2368', 'IPL2367', 'IPL2368'],
+                                 'expected_score': [2, 7, 11, 11]})
+        df = self.df_scored.drop(columns='match_no')
+        with self.assertRaisesRegex(ValueError, 'Phil Salt'):
+            self.calculator.validate_calculations(df, expected)
+        
+        # Agreeing duplicates are harmless
+        validation = self.calculator.validate_calculations(df, expected[expected['player_name'] == 'Yash Dhull'])
+        self.assertEqual(len(validation), len(df))
+        self.assertEqual(validation.loc[validation['player_name'] == 'Yash Dhull', 'status'].item(), '✅ PASS')
+    
+    def test_failures_and_differences(self):
+        """Test that mismatches are flagged with their signed difference"""
+        validation = self.calculator.validate_calculations(self.df_scored, {'Phil Salt': 5})
+        salt = validation[validation['player_name'] == 'Phil Salt'].iloc[0]
+        
+        self.assertEqual(salt['status'], '❌ FAIL')
+        self.assertEqual(salt['difference'], -3)
+        self.assertEqual(self.calculator.summarize_validation(validation)['max_abs_difference'], 3)
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
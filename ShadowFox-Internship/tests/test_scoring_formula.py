@@ -0,0 +1,89 @@
+"""
+Test cases for the scoring-formula language
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import pickle
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.scoring_formula import ScoringFormula
+
+class TestScoringFormula(unittest.TestCase):
+    """Test cases for parsing, evaluation and derived contribution columns"""
+
+    def setUp(self):
+        """Sample match with two extra event columns"""
+        self.df = FieldingDataLoader().create_sample_dataset()
+        self.df['relay_throws'] = [4, 0, 1, 9, 2, 0, 1]
+        self.df['boundary_saves'] = [1, 0, 2, 0, 0, 3, 1]
+
+    def test_default_formula_matches_weights(self):
+        """Test that the weight-derived formula reproduces the original scores and split"""
+        df_scored = PerformanceCalculator().calculate_all_scores(self.df)
+        weights = PerformanceCalculator().weights
+
+        expected = self.df['runs_saved'] + sum(self.df[field] * weight for field, weight in weights.items())
+        positive = sum(self.df[field] * weight for field, weight in weights.items() if weight > 0)
+        positive = positive + self.df['runs_saved'].clip(lower=0)
+
+        pd.testing.assert_series_equal(df_scored['performance_score'], expected, check_names=False)
+        pd.testing.assert_series_equal(df_scored['positive_contributions'], positive, check_names=False)
+        self.assertEqual(list(df_scored['performance_score']), [10, 2, 11, 11, 6, 9, 9])
+
+    def test_custom_formula_with_new_events(self):
+        """Test a nonlinear formula over new event columns"""
+        formula = "3 * catches - 3 * dropped_catches + 2 * sqrt(relay_throws) + 4 * boundary_saves + runs_saved"
+        df_scored = PerformanceCalculator(formula=formula).calculate_all_scores(self.df)
+
+        expected = (3 * self.df['catches'] - 3 * self.df['dropped_catches'] + 2 * np.sqrt(self.df['relay_throws'])
+                    + 4 * self.df['boundary_saves'] + self.df['runs_saved'])
+        np.testing.assert_allclose(df_scored['performance_score'], expected)
+        np.testing.assert_allclose(df_scored['net_contribution'], expected)
+
+        negative = 3 * self.df['dropped_catches'] + (-self.df['runs_saved']).clip(lower=0)
+        np.testing.assert_allclose(df_scored['negative_contributions'], negative)
+
+    def test_rejects_unsafe_expressions(self):
+        """Test that attribute access, unknown functions and strings are refused"""
+        for expression in ["catches.__class__", "open('x')", "__import__('os')", "'a' + catches",
+                           "catches[0]", "lambda: 1", "catches +"]:
+            with self.assertRaises(ValueError):
+                ScoringFormula(expression)
+
+    def test_missing_column_policy(self):
+        """Test that frame scoring rejects a missing formula column while a single row scores 0"""
+        calculator = PerformanceCalculator()
+        incomplete = self.df.drop(columns='direct_hits')
+        with self.assertRaisesRegex(ValueError, 'direct_hits'):
+            calculator.calculate_all_scores(incomplete)
+        with self.assertRaisesRegex(ValueError, 'direct_hits'):
+            calculator._calculate_additional_metrics(incomplete.assign(performance_score=0))
+        self.assertEqual(calculator.calculate_player_score(incomplete.iloc[0]), 0)
+    
+    def test_formula_metadata_and_pickling(self):
+        """Test referenced columns, action columns and pickling for worker processes"""
+        formula = ScoringFormula("where(catches >= 2, 5, 0) + maximum(runs_saved, 0) - log1p(relay_throws)")
+        self.assertEqual(formula.columns, ['catches', 'relay_throws', 'runs_saved'])
+        self.assertEqual(formula.action_columns, ['catches', 'relay_throws'])
+
+        restored = pickle.loads(pickle.dumps(formula))
+        np.testing.assert_allclose(restored.score(self.df), formula.score(self.df))
+
+    def test_formula_from_settings(self):
+        """Test that the analysis block of settings.yaml configures the calculator"""
+        settings = os.path.join(os.path.dirname(__file__), '..', 'config', 'settings.yaml')
+        calculator = PerformanceCalculator.from_settings(settings)
+        self.assertEqual(calculator.weights['catches'], 3)
+        self.assertEqual(calculator.calculate_player_score(self.df.iloc[0]), 10)
+
+if __name__ == '__main__':
+    unittest.main()
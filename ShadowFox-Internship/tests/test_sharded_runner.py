@@ -0,0 +1,87 @@
+"""
+Test cases for the multiprocess sharded runner
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.performance_calculator import PerformanceCalculator
+from src.analysis_tools import FieldingAnalyzer
+from src.sharded_runner import ShardedRunner
+
+TEAMS = ['Delhi Capitals', 'Mumbai Indians', 'Chennai Super Kings']
+
+class TestShardedRunner(unittest.TestCase):
+    """Test that sharded runs reproduce a single-process run exactly"""
+    
+    def setUp(self):
+        """Build two seasons across three teams, with a duplicate row, name variants and interleaved teams"""
+        base = FieldingDataLoader().create_sample_dataset()
+        rng = np.random.default_rng(21)
+        matches = []
+        for i in range(12):
+            match_df = base.copy()
+            match_df['match_no'] = f"IPL{2367 + i}"
+            match_df['season'] = 2023 + i // 6
+            match_df['team'] = TEAMS[i % 3]
+            for col in ['catches', 'dropped_catches', 'run_outs']:
+                match_df[col] = rng.integers(0, 3, len(base))
+            match_df['runs_saved'] = rng.integers(-4, 6, len(base))
+            if i % 4 == 1:
+                match_df['player_name'] = match_df['player_name'].replace(
+                    {'Rilee Russouw': 'R Russouw', 'Phil Salt': 'Philip Salt'})
+            matches.append(match_df)
+        df = pd.concat(matches, ignore_index=True)
+        self.df = pd.concat([df, df.iloc[[5]]], ignore_index=True).sample(frac=1, random_state=2)
+        
+        cleaned = FieldingDataLoader().clean_fielding_data(self.df)
+        self.scored = PerformanceCalculator().calculate_all_scores(cleaned)
+        self.analyzer = FieldingAnalyzer()
+    
+    def assert_matches_single_process(self, output):
+        pd.testing.assert_frame_equal(output['scored'], self.scored)
+        pd.testing.assert_frame_equal(output['top_performers'],
+                                      self.analyzer.identify_top_performers(self.scored, 3))
+        pd.testing.assert_frame_equal(output['correlations'], self.analyzer.calculate_correlations(self.scored))
+        pd.testing.assert_frame_equal(output['recommendations'],
+                                      self.analyzer.generate_all_recommendations(self.scored))
+    
+    def test_team_shards_in_process_pool(self):
+        output = ShardedRunner(shard_by='team', max_workers=3).run(self.df)
+        
+        self.assertEqual(len(output['shards']), 3)
+        self.assert_matches_single_process(output)
+    
+    def test_season_shards_inline(self):
+        output = ShardedRunner(shard_by='season', max_workers=1).run(self.df)
+        
+        self.assertEqual(sorted(output['shards']), [2023, 2024])
+        self.assert_matches_single_process(output)
+    
+    def test_rankings_cover_every_row(self):
+        output = ShardedRunner(max_workers=1).run(self.df)
+        
+        self.assertEqual(len(output['rankings']), len(self.scored))
+        self.assertTrue(output['rankings']['performance_score'].is_monotonic_decreasing)
+    
+    def test_variants_resolved_before_sharding(self):
+        output = ShardedRunner(shard_by='team', max_workers=1).run(self.df)
+        
+        self.assertNotIn('R Russouw', set(output['scored']['player_name']))
+        self.assertEqual(output['scored']['player_id'].nunique(), 7)
+    
+    def test_unknown_shard_key(self):
+        with self.assertRaises(ValueError):
+            ShardedRunner(shard_by='venue')
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)
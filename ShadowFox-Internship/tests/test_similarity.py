@@ -0,0 +1,59 @@
+"""
+Test cases for the player similarity index
+ShadowFox Data Science Internship
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import FieldingDataLoader
+from src.similarity import FieldingSimilarityIndex
+
+class TestSimilarityIndex(unittest.TestCase):
+    """Test cases for k-NN queries and archetype clustering"""
+    
+    def setUp(self):
+        """Two seasons of the sample match, with a near-copy of Axar Patel"""
+        df = FieldingDataLoader().create_sample_dataset()
+        twin = df[df['player_name'] == 'Axar Patel'].assign(player_name='Axar Twin', runs_saved=1)
+        base = pd.concat([df, twin], ignore_index=True)
+        self.season = pd.concat([base.assign(season=2023), base.assign(season=2024)], ignore_index=True)
+        self.index = FieldingSimilarityIndex().fit(self.season)
+    
+    def test_profiles_per_player_season(self):
+        """Test that one profile is built per player-season"""
+        self.assertEqual(len(self.index.profiles), 16)
+        self.assertTrue((self.index.profiles['matches'] == 1).all())
+    
+    def test_nearest_neighbour(self):
+        """Test that the closest other player-season is the same player or the twin"""
+        neighbours = self.index.query('Axar Patel', k=3, season=2024)
+        
+        self.assertEqual(len(neighbours), 3)
+        self.assertEqual(neighbours['player_name'].iloc[0], 'Axar Patel')
+        self.assertEqual(neighbours['season'].iloc[0], 2023)
+        self.assertEqual(neighbours['player_name'].iloc[1], 'Axar Twin')
+        self.assertTrue(np.all(np.diff(neighbours['distance']) >= 0))
+    
+    def test_unknown_player(self):
+        with self.assertRaises(KeyError):
+            self.index.query('Nobody')
+    
+    def test_clustering(self):
+        """Test archetype assignment for every profile"""
+        clustered = self.index.cluster(n_clusters=3)
+        
+        self.assertEqual(clustered['cluster'].nunique(), 3)
+        self.assertTrue(clustered['archetype'].notna().all())
+        twins = clustered[clustered['player_name'].isin(['Axar Patel', 'Axar Twin'])]
+        self.assertEqual(twins['cluster'].nunique(), 1)
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main(verbosity=2)